@@ -0,0 +1,32 @@
+"""Add composite (fee_type, created_at) index on platform_fees
+
+Revision ID: 3f1a9c2d7b4e
+Revises: 98c88ece3b34
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1a9c2d7b4e"
+down_revision: Union[str, None] = "98c88ece3b34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index fee aggregation by type over a time window."""
+    op.create_index(
+        "ix_platform_fees_fee_type_created_at",
+        "platform_fees",
+        ["fee_type", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_platform_fees_fee_type_created_at", table_name="platform_fees")
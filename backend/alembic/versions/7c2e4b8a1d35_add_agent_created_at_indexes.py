@@ -0,0 +1,60 @@
+"""Add composite (agent, created_at DESC) indexes for activity queries
+
+Revision ID: 7c2e4b8a1d35
+Revises: 3f1a9c2d7b4e
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e4b8a1d35"
+down_revision: Union[str, None] = "3f1a9c2d7b4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_orders_agent_id_created_at", "orders", "agent_id"),
+    ("ix_platform_fees_agent_id_created_at", "platform_fees", "agent_id"),
+    ("ix_trades_buyer_id_created_at", "trades", "buyer_id"),
+    ("ix_trades_seller_id_created_at", "trades", "seller_id"),
+]
+
+
+def upgrade() -> None:
+    """
+    Create (agent column, created_at DESC) indexes.
+
+    These back the "WHERE <agent column> = ? ORDER BY created_at DESC LIMIT n"
+    queries so the top rows stream straight off the index. On PostgreSQL the
+    indexes are built CONCURRENTLY to avoid locking writes on large tables.
+    """
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+
+    if is_postgresql:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, table, column in INDEXES:
+                op.create_index(
+                    name,
+                    table,
+                    [column, sa.text("created_at DESC")],
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table, column in INDEXES:
+            op.create_index(name, table, [column, sa.text("created_at DESC")], unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,74 @@
+"""Add comment indexes for the oldest order and batched reply loads
+
+Revision ID: a2c4e6a8b0d3
+Revises: f0b2d4e6a8c1
+Create Date: 2026-10-17 03:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a2c4e6a8b0d3"
+down_revision: Union[str, None] = "f0b2d4e6a8c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partial index predicates, written as each dialect renders is_deleted.is_(False)
+NOT_DELETED = {"postgresql": sa.text("is_deleted IS false"), "sqlite": sa.text("is_deleted IS 0")}
+
+# (index, columns, only index rows that are not deleted)
+INDEXES = [
+    (
+        "ix_comments_market_parent_oldest",
+        ["market_id", "parent_id", sa.text("is_pinned DESC"), "created_at", "id"],
+        False,
+    ),
+    (
+        "ix_comments_replies",
+        ["parent_id", sa.text("is_pinned DESC"), sa.text("score DESC"), "created_at"],
+        True,
+    ),
+]
+
+
+def upgrade() -> None:
+    """
+    Index market threads in oldest-first order, and live replies in display order.
+
+    On PostgreSQL the indexes are built CONCURRENTLY to avoid locking writes.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, columns, partial in INDEXES:
+                op.create_index(
+                    name,
+                    "comments",
+                    columns,
+                    unique=False,
+                    postgresql_where=NOT_DELETED["postgresql"] if partial else None,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, columns, partial in INDEXES:
+            op.create_index(
+                name,
+                "comments",
+                columns,
+                unique=False,
+                sqlite_where=NOT_DELETED["sqlite"] if partial else None,
+            )
+
+
+def downgrade() -> None:
+    for name, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="comments")
@@ -0,0 +1,57 @@
+"""Add (created_at DESC, id DESC) indexes for keyset pagination
+
+Revision ID: a3b5c7d9e1f4
+Revises: f2c4e6a8b0d1
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3b5c7d9e1f4"
+down_revision: Union[str, None] = "f2c4e6a8b0d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_markets_created_at_id", "markets"),
+    ("ix_trades_created_at_id", "trades"),
+]
+
+
+def upgrade() -> None:
+    """
+    Index the (created_at, id) keyset order of the admin market and trade listings.
+
+    On PostgreSQL the indexes are built CONCURRENTLY to avoid locking writes.
+    """
+    columns = [sa.text("created_at DESC"), sa.text("id DESC")]
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+
+    if is_postgresql:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, table in INDEXES:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table in INDEXES:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,52 @@
+"""Add a partial index over each agent's non-empty positions
+
+Revision ID: a7c9e1b3d5f8
+Revises: f4b6d8a0c2e5
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c9e1b3d5f8"
+down_revision: Union[str, None] = "f4b6d8a0c2e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_positions_agent_id_open"
+COLUMNS = ["agent_id", "yes_shares", "no_shares"]
+WHERE = sa.text("yes_shares > 0 OR no_shares > 0")
+
+
+def upgrade() -> None:
+    """
+    Index positions with shares by agent, matching the v1 positions filter.
+
+    On PostgreSQL the index is built CONCURRENTLY to avoid locking writes.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX,
+                "positions",
+                COLUMNS,
+                unique=False,
+                postgresql_where=WHERE,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.create_index(INDEX, "positions", COLUMNS, unique=False, sqlite_where=WHERE)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name="positions")
@@ -0,0 +1,67 @@
+"""Add (status, created_at) and (category, created_at) market indexes
+
+Revision ID: b2d4f6a8c0e3
+Revises: a7c9e1b3d5f8
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d4f6a8c0e3"
+down_revision: Union[str, None] = "a7c9e1b3d5f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, columns) - market lists filtered on one column, newest first
+INDEXES = [
+    ("ix_markets_status_created_at", ["status", sa.text("created_at DESC")]),
+    ("ix_markets_category_created_at", ["category", sa.text("created_at DESC")]),
+]
+
+# Single-column indexes now leading columns of a composite
+DROPPED_INDEXES = [
+    ("ix_markets_status", "status"),
+    ("ix_markets_category", "category"),
+]
+
+
+def upgrade() -> None:
+    """
+    Create the composites, then drop the single-column indexes they cover.
+
+    On PostgreSQL the indexes are built CONCURRENTLY to avoid locking writes.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, columns in INDEXES:
+                op.create_index(
+                    name,
+                    "markets",
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, columns in INDEXES:
+            op.create_index(name, "markets", columns, unique=False)
+
+    for name, _ in DROPPED_INDEXES:
+        op.drop_index(name, table_name="markets")
+
+
+def downgrade() -> None:
+    for name, column in reversed(DROPPED_INDEXES):
+        op.create_index(name, "markets", [column], unique=False)
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="markets")
@@ -0,0 +1,82 @@
+"""Store fee and pending action enums as VARCHAR instead of native enums
+
+Revision ID: b5d8e2f4a6c1
+Revises: 7c2e4b8a1d35
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d8e2f4a6c1"
+down_revision: Union[str, None] = "7c2e4b8a1d35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Convert native enum columns to VARCHAR(16) holding the enum values.
+
+    platform_fees.fee_type previously stored member names (TRADING); it now
+    stores values (trading), matching pending_actions.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE platform_fees ALTER COLUMN fee_type TYPE VARCHAR(16) "
+            "USING lower(fee_type::text)"
+        )
+        op.execute(
+            "ALTER TABLE pending_actions ALTER COLUMN action_type TYPE VARCHAR(16) "
+            "USING action_type::text"
+        )
+        op.execute(
+            "ALTER TABLE pending_actions ALTER COLUMN status TYPE VARCHAR(16) USING status::text"
+        )
+        op.execute("DROP TYPE IF EXISTS feetype")
+        op.execute("DROP TYPE IF EXISTS actiontype")
+        op.execute("DROP TYPE IF EXISTS actionstatus")
+    else:
+        # Non-native enums are already VARCHAR; only the stored fee values change
+        op.execute("UPDATE platform_fees SET fee_type = lower(fee_type)")
+
+    op.create_index(
+        "ix_pending_actions_status_created_at",
+        "pending_actions",
+        ["status", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pending_actions_status_created_at", table_name="pending_actions")
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("CREATE TYPE feetype AS ENUM ('TRADING', 'MARKET_CREATION', 'SETTLEMENT')")
+        op.execute(
+            "CREATE TYPE actiontype AS ENUM "
+            "('place_order', 'cancel_order', 'transfer', 'create_market')"
+        )
+        op.execute(
+            "CREATE TYPE actionstatus AS ENUM ('pending', 'approved', 'rejected', 'expired')"
+        )
+        op.execute(
+            "ALTER TABLE platform_fees ALTER COLUMN fee_type TYPE feetype "
+            "USING upper(fee_type)::feetype"
+        )
+        op.execute(
+            "ALTER TABLE pending_actions ALTER COLUMN action_type TYPE actiontype "
+            "USING action_type::actiontype"
+        )
+        op.execute(
+            "ALTER TABLE pending_actions ALTER COLUMN status TYPE actionstatus "
+            "USING status::actionstatus"
+        )
+    else:
+        op.execute("UPDATE platform_fees SET fee_type = upper(fee_type)")
@@ -0,0 +1,59 @@
+"""Add agent_rankings materialized view for profile leaderboard ranks
+
+Revision ID: b8d0f2a4c6e9
+Revises: a3b5c7d9e1f4
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d0f2a4c6e9"
+down_revision: Union[str, None] = "a3b5c7d9e1f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CREATE_VIEW = """
+CREATE MATERIALIZED VIEW agent_rankings AS
+WITH trade_sides AS (
+    SELECT buyer_id AS agent_id, price * size AS notional FROM trades
+    UNION ALL
+    SELECT seller_id AS agent_id, price * size AS notional FROM trades
+),
+volumes AS (
+    SELECT agent_id, sum(notional) AS volume FROM trade_sides GROUP BY agent_id
+)
+SELECT
+    agents.id,
+    rank() OVER (ORDER BY agents.balance - 1000.00 DESC) AS rank_by_profit,
+    rank() OVER (ORDER BY agents.balance DESC) AS rank_by_balance,
+    rank() OVER (ORDER BY agents.reputation DESC) AS rank_by_reputation,
+    rank() OVER (ORDER BY coalesce(volumes.volume, 0) DESC) AS rank_by_volume
+FROM agents
+LEFT OUTER JOIN volumes ON volumes.agent_id = agents.id
+"""
+
+
+def upgrade() -> None:
+    """
+    Precompute agent rankings on PostgreSQL.
+
+    The unique index on id is what allows REFRESH MATERIALIZED VIEW CONCURRENTLY.
+    SQLite has no materialized views, so rankings are computed live there.
+    """
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(sa.text(CREATE_VIEW))
+    op.create_index("ix_agent_rankings_id", "agent_rankings", ["id"], unique=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(sa.text("DROP MATERIALIZED VIEW IF EXISTS agent_rankings"))
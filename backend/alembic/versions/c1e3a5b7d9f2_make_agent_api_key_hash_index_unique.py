@@ -0,0 +1,53 @@
+"""Make the agents.api_key_hash index unique
+
+Revision ID: c1e3a5b7d9f2
+Revises: b8d0f2a4c6e9
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c1e3a5b7d9f2"
+down_revision: Union[str, None] = "b8d0f2a4c6e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_agents_api_key_hash"
+NEW_INDEX = "ix_agents_api_key_hash_unique"
+
+
+def upgrade() -> None:
+    """
+    Replace the plain api_key_hash index with a unique one.
+
+    On PostgreSQL the unique index is built CONCURRENTLY next to the old one
+    and renamed into place, so key lookups keep an index throughout.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            op.create_index(
+                NEW_INDEX,
+                "agents",
+                ["api_key_hash"],
+                unique=True,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(INDEX, table_name="agents", postgresql_concurrently=True)
+        op.execute(f"ALTER INDEX {NEW_INDEX} RENAME TO {INDEX}")
+    else:
+        op.drop_index(INDEX, table_name="agents")
+        op.create_index(INDEX, "agents", ["api_key_hash"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name="agents")
+    op.create_index(INDEX, "agents", ["api_key_hash"], unique=False)
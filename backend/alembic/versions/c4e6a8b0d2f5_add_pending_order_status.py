@@ -0,0 +1,60 @@
+"""Add PENDING order status for background matching
+
+Revision ID: c4e6a8b0d2f5
+Revises: b2d4f6a8c0e3
+Create Date: 2026-10-16 23:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e6a8b0d2f5"
+down_revision: Union[str, None] = "b2d4f6a8c0e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_orders_pending"
+WHERE = sa.text("status = 'PENDING'")
+
+
+def upgrade() -> None:
+    """
+    Add PENDING to the order status enum and index pending orders by age.
+
+    On PostgreSQL the new enum value must be committed before the partial
+    index can reference it, and the index is built CONCURRENTLY, so both run
+    outside the migration transaction.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE orderstatus ADD VALUE IF NOT EXISTS 'PENDING'")
+            op.create_index(
+                INDEX,
+                "orders",
+                ["created_at"],
+                unique=False,
+                postgresql_where=WHERE,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        # Non-native enums are plain VARCHAR, so only the index is needed
+        op.create_index(INDEX, "orders", ["created_at"], unique=False, sqlite_where=WHERE)
+
+
+def downgrade() -> None:
+    """
+    Drop the pending index and release pending orders into the book.
+
+    PostgreSQL cannot drop an enum value, so PENDING stays in the type.
+    """
+    op.drop_index(INDEX, table_name="orders")
+    op.execute("UPDATE orders SET status = 'OPEN' WHERE status = 'PENDING'")
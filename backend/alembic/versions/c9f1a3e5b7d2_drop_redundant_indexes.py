@@ -0,0 +1,52 @@
+"""Drop indexes that no query uses or that composites already cover
+
+Revision ID: c9f1a3e5b7d2
+Revises: b5d8e2f4a6c1
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9f1a3e5b7d2"
+down_revision: Union[str, None] = "b5d8e2f4a6c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, column) - single-column indexes created by the initial migration
+DROPPED_INDEXES = [
+    # Leading column of an (x, created_at) composite
+    ("ix_orders_agent_id", "orders", "agent_id"),
+    ("ix_trades_buyer_id", "trades", "buyer_id"),
+    ("ix_trades_seller_id", "trades", "seller_id"),
+    ("ix_platform_fees_agent_id", "platform_fees", "agent_id"),
+    ("ix_platform_fees_fee_type", "platform_fees", "fee_type"),
+    ("ix_transactions_wallet_id", "transactions", "wallet_id"),
+    # Never filtered on
+    ("ix_transactions_agent_id", "transactions", "agent_id"),
+    ("ix_transactions_type", "transactions", "type"),
+]
+
+
+def upgrade() -> None:
+    """Replace per-column transaction indexes with one wallet history index."""
+    op.create_index(
+        "ix_transactions_wallet_id_created_at",
+        "transactions",
+        ["wallet_id", sa.text("created_at DESC")],
+        unique=False,
+    )
+    for name, table, _ in DROPPED_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, column in reversed(DROPPED_INDEXES):
+        op.create_index(name, table, [column], unique=False)
+    op.drop_index("ix_transactions_wallet_id_created_at", table_name="transactions")
@@ -0,0 +1,65 @@
+"""Add agents.api_key_prefix for integer API key lookups
+
+Revision ID: d3f5b7c9e1a4
+Revises: c1e3a5b7d9f2
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f5b7c9e1a4"
+down_revision: Union[str, None] = "c1e3a5b7d9f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_agents_api_key_prefix"
+
+
+def upgrade() -> None:
+    """
+    Add the column, backfill it from the stored hashes, then index it.
+
+    The prefix is the first 8 bytes of the SHA-256 hex digest as a signed
+    BIGINT, matching server.utils.api_key.api_key_prefix.
+    """
+    bind = op.get_bind()
+    op.add_column("agents", sa.Column("api_key_prefix", sa.BigInteger(), nullable=True))
+
+    agents = sa.table(
+        "agents",
+        sa.column("id", sa.Uuid()),
+        sa.column("api_key_hash", sa.String()),
+        sa.column("api_key_prefix", sa.BigInteger()),
+    )
+    rows = bind.execute(
+        sa.select(agents.c.id, agents.c.api_key_hash).where(agents.c.api_key_hash.isnot(None))
+    ).all()
+    for agent_id, api_key_hash in rows:
+        prefix = int.from_bytes(bytes.fromhex(api_key_hash[:16]), "big", signed=True)
+        bind.execute(agents.update().where(agents.c.id == agent_id).values(api_key_prefix=prefix))
+
+    if bind.dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX,
+                "agents",
+                ["api_key_prefix"],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.create_index(INDEX, "agents", ["api_key_prefix"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name="agents")
+    op.drop_column("agents", "api_key_prefix")
@@ -0,0 +1,36 @@
+"""Add partial index over live pending actions
+
+Revision ID: d4a6c8e0f2b3
+Revises: c9f1a3e5b7d2
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a6c8e0f2b3"
+down_revision: Union[str, None] = "c9f1a3e5b7d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index expires_at for pending rows only (PendingAction.is_pending)."""
+    op.create_index(
+        "ix_pending_actions_live",
+        "pending_actions",
+        ["expires_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+        sqlite_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pending_actions_live", table_name="pending_actions")
@@ -0,0 +1,83 @@
+"""Add keyset indexes for market comment threads
+
+Revision ID: d6f8a0c2e4b7
+Revises: c4e6a8b0d2f5
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d6f8a0c2e4b7"
+down_revision: Union[str, None] = "c4e6a8b0d2f5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, columns) - a market's threads in the newest and top comment orders
+INDEXES = [
+    (
+        "ix_comments_market_parent_newest",
+        [
+            "market_id",
+            "parent_id",
+            sa.text("is_pinned DESC"),
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+    ),
+    (
+        "ix_comments_market_parent_top",
+        [
+            "market_id",
+            "parent_id",
+            sa.text("is_pinned DESC"),
+            sa.text("(upvotes - downvotes) DESC"),
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+    ),
+]
+
+# Single-column index now the leading column of the composites
+DROPPED_INDEXES = [("ix_comments_market_id", "market_id")]
+
+
+def upgrade() -> None:
+    """
+    Create the composites, then drop the single-column index they cover.
+
+    On PostgreSQL the indexes are built CONCURRENTLY to avoid locking writes.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, columns in INDEXES:
+                op.create_index(
+                    name,
+                    "comments",
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, columns in INDEXES:
+            op.create_index(name, "comments", columns, unique=False)
+
+    for name, _ in DROPPED_INDEXES:
+        op.drop_index(name, table_name="comments")
+
+
+def downgrade() -> None:
+    for name, column in reversed(DROPPED_INDEXES):
+        op.create_index(name, "comments", [column], unique=False)
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="comments")
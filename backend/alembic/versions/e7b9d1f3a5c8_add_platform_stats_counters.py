@@ -0,0 +1,57 @@
+"""Add agent and open market counters to platform_stats
+
+Revision ID: e7b9d1f3a5c8
+Revises: d4a6c8e0f2b3
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b9d1f3a5c8"
+down_revision: Union[str, None] = "d4a6c8e0f2b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NEW_COUNTERS = ["open_markets", "total_agents", "total_traders", "total_moderators"]
+
+
+def upgrade() -> None:
+    """Add counters and backfill every counter /admin/stats reads from the base tables."""
+    for column in NEW_COUNTERS:
+        op.add_column(
+            "platform_stats",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+
+    # Make sure the single stats row exists before backfilling it
+    op.execute(
+        "INSERT INTO platform_stats (id, total_trading_fees, total_market_creation_fees, "
+        "total_settlement_fees, total_volume, total_trades, total_markets_created, "
+        "total_markets_resolved, updated_at) "
+        "SELECT 1, 0, 0, 0, 0, 0, 0, 0, CURRENT_TIMESTAMP "
+        "WHERE NOT EXISTS (SELECT 1 FROM platform_stats WHERE id = 1)"
+    )
+    op.execute(
+        "UPDATE platform_stats SET "
+        "total_agents = (SELECT COUNT(*) FROM agents), "
+        "total_traders = (SELECT COUNT(*) FROM agents WHERE role = 'TRADER'), "
+        "total_moderators = (SELECT COUNT(*) FROM agents WHERE role = 'MODERATOR'), "
+        "total_markets_created = (SELECT COUNT(*) FROM markets), "
+        "open_markets = (SELECT COUNT(*) FROM markets WHERE status = 'OPEN'), "
+        "total_markets_resolved = (SELECT COUNT(*) FROM markets WHERE status = 'RESOLVED'), "
+        "total_trades = (SELECT COUNT(*) FROM trades), "
+        "total_volume = (SELECT COALESCE(SUM(price * size), 0) FROM trades) "
+        "WHERE id = 1"
+    )
+
+
+def downgrade() -> None:
+    for column in reversed(NEW_COUNTERS):
+        op.drop_column("platform_stats", column)
@@ -0,0 +1,109 @@
+"""Add generated score and controversy columns to comments
+
+Revision ID: e8a0c2e4b6d9
+Revises: d6f8a0c2e4b7
+Create Date: 2026-10-17 01:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8a0c2e4b6d9"
+down_revision: Union[str, None] = "d6f8a0c2e4b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (column, generation expression)
+COLUMNS = [
+    ("score", "upvotes - downvotes"),
+    ("controversy", "CASE WHEN upvotes < downvotes THEN upvotes ELSE downvotes END"),
+]
+
+# (index, columns) - a market's threads ordered by the generated columns
+INDEXES = [
+    (
+        "ix_comments_market_parent_top",
+        [
+            "market_id",
+            "parent_id",
+            sa.text("is_pinned DESC"),
+            sa.text("score DESC"),
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+    ),
+    (
+        "ix_comments_market_parent_controversial",
+        [
+            "market_id",
+            "parent_id",
+            sa.text("is_pinned DESC"),
+            sa.text("controversy DESC"),
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+    ),
+]
+
+# The top-order index over the (upvotes - downvotes) expression it replaces
+EXPRESSION_INDEX = (
+    "ix_comments_market_parent_top",
+    [
+        "market_id",
+        "parent_id",
+        sa.text("is_pinned DESC"),
+        sa.text("(upvotes - downvotes) DESC"),
+        sa.text("created_at DESC"),
+        sa.text("id DESC"),
+    ],
+)
+
+
+def upgrade() -> None:
+    """
+    Add the generated columns and index the top and controversial orders by them.
+
+    PostgreSQL stores the columns; adding them rewrites the table. SQLite can
+    only add virtual generated columns to an existing table, which it can
+    still index. On PostgreSQL the indexes are built CONCURRENTLY to avoid
+    locking writes.
+    """
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+
+    for name, expression in COLUMNS:
+        op.add_column(
+            "comments",
+            sa.Column(name, sa.Integer(), sa.Computed(expression, persisted=is_postgresql)),
+        )
+    op.drop_index(EXPRESSION_INDEX[0], table_name="comments")
+
+    if is_postgresql:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, columns in INDEXES:
+                op.create_index(
+                    name,
+                    "comments",
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, columns in INDEXES:
+            op.create_index(name, "comments", columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="comments")
+    for name, _ in reversed(COLUMNS):
+        op.drop_column("comments", name)
+    op.create_index(EXPRESSION_INDEX[0], "comments", EXPRESSION_INDEX[1], unique=False)
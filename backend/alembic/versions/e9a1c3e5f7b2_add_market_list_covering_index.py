@@ -0,0 +1,54 @@
+"""Add a covering index for the v1 market list
+
+Revision ID: e9a1c3e5f7b2
+Revises: d3f5b7c9e1a4
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e9a1c3e5f7b2"
+down_revision: Union[str, None] = "d3f5b7c9e1a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_markets_status_category_created_at"
+COLUMNS = ["status", "category", sa.text("created_at DESC")]
+# Every other column the list returns, so PostgreSQL can skip the heap
+INCLUDE = ["id", "creator_id", "question", "outcome", "yes_price", "no_price", "volume", "deadline"]
+
+
+def upgrade() -> None:
+    """
+    Index the list's filters and order, including the listed columns.
+
+    On PostgreSQL the index is built CONCURRENTLY to avoid locking writes.
+    SQLite has no INCLUDE, so it gets the plain composite.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX,
+                "markets",
+                COLUMNS,
+                unique=False,
+                postgresql_include=INCLUDE,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.create_index(INDEX, "markets", COLUMNS, unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name="markets")
@@ -0,0 +1,55 @@
+"""Add a partial index over resting orders by price level
+
+Revision ID: f0b2d4e6a8c1
+Revises: e8a0c2e4b6d9
+Create Date: 2026-10-17 02:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f0b2d4e6a8c1"
+down_revision: Union[str, None] = "e8a0c2e4b6d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_orders_open_book"
+COLUMNS = ["market_id", "side", "price"]
+WHERE = sa.text("status IN ('OPEN', 'PARTIAL')")
+
+
+def upgrade() -> None:
+    """
+    Index open and partially filled orders by (market, side, price).
+
+    On PostgreSQL the index also includes size and filled, so the order book's
+    per-level sums are index-only scans, and it is built CONCURRENTLY to avoid
+    locking writes.
+    """
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX,
+                "orders",
+                COLUMNS,
+                unique=False,
+                postgresql_include=["size", "filled"],
+                postgresql_where=WHERE,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.create_index(INDEX, "orders", COLUMNS, unique=False, sqlite_where=WHERE)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name="orders")
@@ -0,0 +1,88 @@
+"""Add composite indexes for profile market lists and position lookups
+
+Revision ID: f2c4e6a8b0d1
+Revises: e7b9d1f3a5c8
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c4e6a8b0d1"
+down_revision: Union[str, None] = "e7b9d1f3a5c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RESOLVED_ONLY = "status = 'RESOLVED'"
+
+# (index, table, columns, partial-index predicate)
+INDEXES = [
+    (
+        "ix_markets_creator_id_created_at",
+        "markets",
+        ["creator_id", sa.text("created_at DESC")],
+        None,
+    ),
+    (
+        "ix_markets_resolved_by_resolved_at",
+        "markets",
+        ["resolved_by", sa.text("resolved_at DESC")],
+        RESOLVED_ONLY,
+    ),
+    ("ix_positions_market_id_agent_id", "positions", ["market_id", "agent_id"], None),
+]
+
+# (index, table, column) - single-column indexes now leading columns of a composite
+DROPPED_INDEXES = [
+    ("ix_markets_creator_id", "markets", "creator_id"),
+    ("ix_positions_market_id", "positions", "market_id"),
+]
+
+
+def upgrade() -> None:
+    """
+    Create the composites, then drop the single-column indexes they cover.
+
+    On PostgreSQL the indexes are built CONCURRENTLY to avoid locking writes.
+    """
+    bind = op.get_bind()
+    is_postgresql = bind.dialect.name == "postgresql"
+
+    if is_postgresql:
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns, where in INDEXES:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    unique=False,
+                    postgresql_where=sa.text(where) if where else None,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                sqlite_where=sa.text(where) if where else None,
+            )
+
+    for name, table, _ in DROPPED_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    for name, table, column in reversed(DROPPED_INDEXES):
+        op.create_index(name, table, [column], unique=False)
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,83 @@
+"""Add market_resolutions queue for background settlement
+
+Revision ID: f4b6d8a0c2e5
+Revises: e9a1c3e5f7b2
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4b6d8a0c2e5"
+down_revision: Union[str, None] = "e9a1c3e5f7b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "market_resolutions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("market_id", sa.Uuid(), nullable=False),
+        sa.Column("moderator_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "outcome",
+            sa.Enum("YES", "NO", name="outcome", native_enum=False, length=8),
+            nullable=False,
+        ),
+        sa.Column("evidence", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("idempotency_key", sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "pending",
+                "completed",
+                "failed",
+                name="resolutionstatus",
+                native_enum=False,
+                length=16,
+            ),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("result_data", sa.JSON(), nullable=True),
+        sa.Column("error", sqlmodel.sql.sqltypes.AutoString(length=500), nullable=True),
+        sa.ForeignKeyConstraint(["market_id"], ["markets.id"]),
+        sa.ForeignKeyConstraint(["moderator_id"], ["agents.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("moderator_id", "idempotency_key"),
+    )
+    op.create_index(
+        op.f("ix_market_resolutions_market_id"), "market_resolutions", ["market_id"], unique=False
+    )
+    op.create_index(
+        "ix_market_resolutions_market_pending",
+        "market_resolutions",
+        ["market_id"],
+        unique=True,
+        postgresql_where=sa.text("status = 'pending'"),
+        sqlite_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "ix_market_resolutions_pending",
+        "market_resolutions",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+        sqlite_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_market_resolutions_pending", table_name="market_resolutions")
+    op.drop_index("ix_market_resolutions_market_pending", table_name="market_resolutions")
+    op.drop_index(op.f("ix_market_resolutions_market_id"), table_name="market_resolutions")
+    op.drop_table("market_resolutions")
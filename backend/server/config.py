@@ -22,6 +22,46 @@ class Settings(BaseSettings):
     MODERATOR_PLATFORM_SHARE: Decimal = Decimal("0.30")  # 30% of platform settlement fee
     MODERATOR_WINNER_FEE: Decimal = Decimal("0.005")  # 0.5% additional from winner profits
 
+    # PostgreSQL connection pool (unused behind a transaction pooler, which gets NullPool)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 10.0  # Seconds to wait for a pooled connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
+    # Extra connections execute_concurrently may hold at once, across all requests
+    DB_CONCURRENT_READS: int = 8
+    # Whether DATABASE_URL is a transaction-mode pooler; detected from port 6543 if unset
+    DB_TRANSACTION_POOLER: bool | None = None
+
+    # Pending action sweeper settings
+    PENDING_ACTION_SWEEP_INTERVAL: float = 60.0  # Seconds between expiry sweeps
+    PENDING_ACTION_RETENTION_DAYS: int = 30  # Days to keep approved/rejected/expired actions
+
+    # Seconds between resolution worker scans (queued resolutions also wake it)
+    RESOLUTION_WORKER_INTERVAL: float = 5.0
+
+    # Seconds between matching worker scans (async bets also wake it)
+    MATCHING_WORKER_INTERVAL: float = 1.0
+
+    # Seconds between writes of buffered platform stats to the stats row
+    PLATFORM_STATS_FLUSH_INTERVAL: float = 2.0
+
+    # Seconds between agent_rankings materialized view refreshes (PostgreSQL only)
+    AGENT_RANKINGS_REFRESH_INTERVAL: float = 30.0
+
+    # Seconds a rendered v1 market list page is cached in process
+    MARKET_LIST_CACHE_TTL: float = 2.0
+    # Seconds a market's status and prices are cached in process for placing bets
+    MARKET_SNAPSHOT_CACHE_TTL: float = 1.0
+
+    # Redis for profile caching and rate limiting (in-process fallbacks without it)
+    REDIS_URL: str | None = None
+    PROFILE_CACHE_TTL: int = 15  # Seconds a rendered agent profile is cached
+    ORDER_BOOK_CACHE_TTL: float = 1.0  # Seconds a rendered market order book is cached
+
+    # In-process cache of API key lookups for authenticated requests
+    AUTH_CACHE_TTL: float = 60.0  # Seconds a verified key lookup is cached
+    AUTH_CACHE_SIZE: int = 10_000  # Maximum cached keys per process
+
     # Admin settings
     ADMIN_SECRET_KEY: str = "admin-secret-change-in-production"
 
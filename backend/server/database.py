@@ -1,6 +1,8 @@
+import asyncio
 import ssl
 
-from sqlalchemy import event
+from sqlalchemy import event, make_url
+from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool, StaticPool
@@ -12,6 +14,8 @@ from server.config import settings
 connect_args = {}
 engine_kwargs = {
     "echo": False,
+    # Room for every compiled statement the routers issue, so none is recompiled
+    "query_cache_size": 1200,
 }
 
 if settings.DATABASE_URL.startswith("sqlite"):
@@ -33,15 +37,40 @@ elif settings.DATABASE_URL.startswith("postgresql"):
         "ssl": ssl_context,
         "timeout": 30,  # Reduced from 60 to fail faster
         "command_timeout": 30,  # Reduced from 60
-        # Disable prepared statements for transaction pooler compatibility
-        "statement_cache_size": 0,
-        "prepared_statement_cache_size": 0,
     }
-    # Use NullPool for serverless-style connections
-    # NullPool creates a new connection for each checkout, no pooling
-    # This avoids connection pooling issues with Supabase transaction pooler
-    engine_kwargs["poolclass"] = NullPool
-    # Note: pool_pre_ping, max_overflow, pool_reset_on_return are not compatible with NullPool
+
+    transaction_pooler = settings.DB_TRANSACTION_POOLER
+    if transaction_pooler is None:
+        # Supabase's transaction pooler listens on 6543, direct connections on 5432
+        transaction_pooler = make_url(settings.DATABASE_URL).port == 6543
+
+    if transaction_pooler:
+        # Disable prepared statements for transaction pooler compatibility
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        # Use NullPool for serverless-style connections
+        # NullPool creates a new connection for each checkout, no pooling
+        # This avoids connection pooling issues with Supabase transaction pooler
+        engine_kwargs["poolclass"] = NullPool
+        # Note: pool_pre_ping, max_overflow, pool_reset_on_return are not compatible with NullPool
+    else:
+        # Direct connections keep a pool and cache prepared statements per connection
+        connect_args["statement_cache_size"] = 1024
+        connect_args["prepared_statement_cache_size"] = 512
+        connect_args["server_settings"] = {
+            # Short OLTP queries don't benefit from JIT compilation
+            "jit": "off",
+            # Server-side keepalives stop NATs and load balancers from silently
+            # dropping idle pooled connections, which would fail the next query
+            "tcp_keepalives_idle": "30",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "3",
+        }
+        engine_kwargs["pool_size"] = settings.DB_POOL_SIZE
+        engine_kwargs["max_overflow"] = settings.DB_MAX_OVERFLOW
+        engine_kwargs["pool_timeout"] = settings.DB_POOL_TIMEOUT
+        engine_kwargs["pool_recycle"] = settings.DB_POOL_RECYCLE
+        engine_kwargs["pool_pre_ping"] = True
 
 # For SQLite, we need to handle connect_args differently
 if settings.DATABASE_URL.startswith("sqlite"):
@@ -93,6 +122,41 @@ async def get_session():
         yield session
 
 
+# Caps the connections concurrent reads check out, so fan-outs from many
+# requests can't take the whole pool (or open unbounded pooler connections)
+_concurrent_reads = asyncio.Semaphore(settings.DB_CONCURRENT_READS)
+
+
+async def execute_concurrently(session: AsyncSession, *statements) -> list[Result]:
+    """
+    Execute independent read-only statements concurrently.
+
+    An AsyncSession cannot run statements concurrently, so each statement gets its
+    own short-lived session bound to the same engine as ``session``. At most
+    DB_CONCURRENT_READS of these run at once across the process. Results are
+    buffered before those sessions close and returned in statement order.
+
+    Callers should end ``session``'s transaction first, so its connection isn't
+    held while waiting for these.
+
+    SQLite shares a single connection (StaticPool), so statements run
+    sequentially on ``session`` there.
+    """
+    if session.bind.dialect.name == "sqlite":
+        return [await session.execute(statement) for statement in statements]
+
+    async def run(statement):
+        async with (
+            _concurrent_reads,
+            AsyncSession(session.bind, expire_on_commit=False) as read_session,
+        ):
+            result = await read_session.execute(statement)
+            return result.freeze()
+
+    frozen_results = await asyncio.gather(*(run(statement) for statement in statements))
+    return [frozen() for frozen in frozen_results]
+
+
 async def check_schema_sync():
     """
     Check if database schema matches model definitions.
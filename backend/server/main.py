@@ -1,9 +1,10 @@
 import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from server.config import settings
 from server.database import engine, init_db
@@ -23,6 +24,12 @@ from server.routers import (
     wallet,
     ws,
 )
+from server.services.order_matching import run_matching_worker
+from server.services.pending_actions import run_pending_action_sweeper
+from server.services.platform_stats import run_platform_stats_flusher
+from server.services.rankings import run_rankings_refresher
+from server.services.resolutions import run_resolution_worker
+from server.utils.json_response import ORJSONResponse
 from server.utils.logging_config import setup_logging
 
 # Setup logging
@@ -34,7 +41,7 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup."""
+    """Initialize database and background tasks on startup."""
     logger.info("Starting MoltStreet API server...")
 
     # Try to init DB with timeout, don't block startup if it fails
@@ -70,10 +77,37 @@ async def lifespan(app: FastAPI):
         logger.exception("=" * 80)
         logger.warning("Server starting without database - API endpoints will fail!")
 
+    sweeper = asyncio.create_task(
+        run_pending_action_sweeper(
+            settings.PENDING_ACTION_SWEEP_INTERVAL, settings.PENDING_ACTION_RETENTION_DAYS
+        )
+    )
+
+    resolution_worker = asyncio.create_task(
+        run_resolution_worker(settings.RESOLUTION_WORKER_INTERVAL)
+    )
+
+    matching_worker = asyncio.create_task(run_matching_worker(settings.MATCHING_WORKER_INTERVAL))
+
+    stats_flusher = asyncio.create_task(
+        run_platform_stats_flusher(settings.PLATFORM_STATS_FLUSH_INTERVAL)
+    )
+
+    background_tasks = [sweeper, resolution_worker, matching_worker, stats_flusher]
+    if engine.dialect.name == "postgresql":
+        background_tasks.append(
+            asyncio.create_task(run_rankings_refresher(settings.AGENT_RANKINGS_REFRESH_INTERVAL))
+        )
+
     logger.info("Server startup complete")
     yield
     logger.info("Server shutting down...")
 
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
 
 app = FastAPI(
     title="MoltStreet API",
@@ -102,6 +136,7 @@ MoltStreet is a prediction market platform where AI agents bet tokens on outcome
     """,
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -136,8 +171,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "ETag"],
 )
 
+# Compress larger JSON bodies (market lists, positions, profiles) for polling agents
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
+
 # Register global exception handlers
 register_exception_handlers(app)
 
@@ -1,14 +1,91 @@
 """Authentication middleware for API key validation."""
 
-from datetime import UTC, datetime
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
 
 from fastapi import Depends, Header, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from server.config import settings
 from server.database import get_session
-from server.models.agent import Agent
-from server.utils.api_key import hash_api_key, validate_api_key_format
+from server.models.agent import Agent, AgentRole
+from server.models.types import utc_now
+from server.utils.api_key import api_key_prefix, hash_api_key, validate_api_key_format
+
+# Role bits, so a role requirement is a single mask test on the cached snapshot
+ROLE_TRADER = 1
+ROLE_MODERATOR = 2
+ROLE_BITS = {AgentRole.TRADER: ROLE_TRADER, AgentRole.MODERATOR: ROLE_MODERATOR}
+
+
+@dataclass(frozen=True, slots=True)
+class AgentAuth:
+    """Snapshot of the agent fields needed to authorize a request."""
+
+    id: UUID
+    role: AgentRole
+    role_bits: int
+
+    @classmethod
+    def for_agent(cls, agent: Agent) -> "AgentAuth":
+        return cls(id=agent.id, role=agent.role, role_bits=ROLE_BITS[agent.role])
+
+    @property
+    def can_trade(self) -> bool:
+        return bool(self.role_bits & ROLE_TRADER)
+
+    @property
+    def can_resolve(self) -> bool:
+        return bool(self.role_bits & ROLE_MODERATOR)
+
+
+# Verified, unrevoked API keys: blake2b(api_key) -> (expires at, AgentAuth), least
+# recently used first. Plain keys are never stored.
+_auth_cache: OrderedDict[bytes, tuple[float, AgentAuth]] = OrderedDict()
+# agent_id -> cache key, so an agent's entry can be dropped without its plain key
+_auth_cache_keys: dict[UUID, bytes] = {}
+
+
+def _auth_cache_key(api_key: str) -> bytes:
+    return hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+
+
+def _get_cached_auth(cache_key: bytes) -> AgentAuth | None:
+    entry = _auth_cache.get(cache_key)
+    if entry is None:
+        return None
+    expires_at, auth = entry
+    if expires_at <= time.monotonic():
+        _drop_cached_auth(cache_key)
+        return None
+    _auth_cache.move_to_end(cache_key)
+    return auth
+
+
+def _cache_auth(cache_key: bytes, auth: AgentAuth) -> None:
+    _auth_cache[cache_key] = (time.monotonic() + settings.AUTH_CACHE_TTL, auth)
+    _auth_cache.move_to_end(cache_key)
+    _auth_cache_keys[auth.id] = cache_key
+    while len(_auth_cache) > settings.AUTH_CACHE_SIZE:
+        _drop_cached_auth(next(iter(_auth_cache)))
+
+
+def _drop_cached_auth(cache_key: bytes) -> None:
+    entry = _auth_cache.pop(cache_key, None)
+    if entry is not None and _auth_cache_keys.get(entry[1].id) == cache_key:
+        del _auth_cache_keys[entry[1].id]
+
+
+def invalidate_agent_auth(agent_id: UUID) -> None:
+    """Drop an agent's cached API key lookup after its key or status changes."""
+    cache_key = _auth_cache_keys.get(agent_id)
+    if cache_key is not None:
+        _drop_cached_auth(cache_key)
 
 
 async def get_api_key(
@@ -29,11 +106,32 @@ async def get_api_key(
     return parts[1]
 
 
-async def get_current_agent(
+async def find_agent_by_api_key(session: AsyncSession, api_key: str) -> Agent | None:
+    """
+    Find the agent owning an API key.
+
+    Agents are looked up by the integer prefix of the key's hash and the full
+    hash is then compared in constant time.
+    """
+    key_hash = hash_api_key(api_key)
+    result = await session.execute(
+        select(Agent).where(Agent.api_key_prefix == api_key_prefix(key_hash))
+    )
+    for agent in result.scalars():
+        if agent.api_key_hash and hmac.compare_digest(agent.api_key_hash, key_hash):
+            return agent
+    return None
+
+
+async def get_agent_auth(
     api_key: str | None = Depends(get_api_key), session: AsyncSession = Depends(get_session)
-) -> Agent:
+) -> AgentAuth:
     """
-    Validate API key and return the authenticated agent.
+    Validate API key and return an authorization snapshot of the agent.
+
+    Lookups of verified, unrevoked keys are cached in process for
+    AUTH_CACHE_TTL seconds, so cache hits skip the database entirely. Use this
+    directly for endpoints that only need the agent's id or role.
 
     Raises HTTPException if:
     - No API key provided
@@ -55,11 +153,12 @@ async def get_current_agent(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Hash the provided key and look it up
-    key_hash = hash_api_key(api_key)
+    cache_key = _auth_cache_key(api_key)
+    auth = _get_cached_auth(cache_key)
+    if auth is not None:
+        return auth
 
-    result = await session.execute(select(Agent).where(Agent.api_key_hash == key_hash))
-    agent = result.scalar_one_or_none()
+    agent = await find_agent_by_api_key(session, api_key)
 
     if not agent:
         raise HTTPException(
@@ -80,13 +179,30 @@ async def get_current_agent(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Update last used timestamp
-    # Database column is TIMESTAMP WITHOUT TIME ZONE, so we must use timezone-naive datetime
-    # Get UTC timezone-aware datetime, then convert to naive (still represents UTC time)
-    now_utc = datetime.now(UTC)
-    agent.api_key_last_used_at = now_utc.replace(tzinfo=None)
+    # Update last used timestamp (at most once per AUTH_CACHE_TTL while cached)
+    agent.api_key_last_used_at = utc_now()
     await session.commit()
 
+    auth = AgentAuth.for_agent(agent)
+    _cache_auth(cache_key, auth)
+    return auth
+
+
+async def get_current_agent(
+    auth: AgentAuth = Depends(get_agent_auth), session: AsyncSession = Depends(get_session)
+) -> Agent:
+    """
+    Validate API key and return the authenticated agent.
+
+    The agent is loaded by primary key, which is served from the session's
+    identity map when ``get_agent_auth`` just looked it up.
+    """
+    agent = await session.get(Agent, auth.id)
+    if not agent:
+        invalidate_agent_auth(auth.id)
+        raise HTTPException(
+            status_code=401, detail="Invalid API key.", headers={"WWW-Authenticate": "Bearer"}
+        )
     return agent
 
 
@@ -101,101 +217,27 @@ async def get_current_agent_optional(
         return None
 
     try:
-        return await get_current_agent(api_key=api_key, session=session)
+        auth = await get_agent_auth(api_key=api_key, session=session)
+        return await get_current_agent(auth=auth, session=session)
     except HTTPException:
         return None
 
 
-async def get_current_trader(agent: Agent = Depends(get_current_agent)) -> Agent:
-    """
-    Get authenticated agent and verify they are a trader (not moderator).
-    """
-    if not agent.can_trade:
-        raise HTTPException(
-            status_code=403,
-            detail="Only trader agents can perform this action. Moderators cannot trade.",
-        )
-    return agent
-
-
-async def get_current_moderator(agent: Agent = Depends(get_current_agent)) -> Agent:
-    """
-    Get authenticated agent and verify they are a moderator.
-    """
-    if not agent.can_resolve:
-        raise HTTPException(
-            status_code=403, detail="Only moderator agents can perform this action."
-        )
-    return agent
+def require_role(mask: int, detail: str):
+    """Dependency factory accepting agents whose role bits intersect ``mask``."""
 
+    async def dependency(auth: AgentAuth = Depends(get_agent_auth)) -> AgentAuth:
+        if not auth.role_bits & mask:
+            raise HTTPException(status_code=403, detail=detail)
+        return auth
 
-async def check_rate_limit(
-    agent: Agent, session: AsyncSession, limit_type: str = "general"
-) -> None:
-    """
-    Check and update rate limits for an agent.
+    return dependency
 
-    Limits:
-    - general: 50 requests per minute
-    - order: 10 orders per minute
-    - market: 1 market creation per hour
 
-    Raises HTTPException if rate limit exceeded.
-    """
-    # Use timezone-aware datetime for consistency with database
-    now = datetime.now(UTC)
-
-    # Normalize database datetimes to UTC-aware for comparison
-    def normalize_datetime(dt: datetime | None) -> datetime | None:
-        """Normalize datetime to UTC-aware for comparison."""
-        if dt is None:
-            return None
-        if dt.tzinfo is None:
-            # If naive, assume it's UTC and make it aware
-            return dt.replace(tzinfo=UTC)
-        # If aware, convert to UTC
-        return dt.astimezone(UTC)
-
-    last_request_reset_utc = normalize_datetime(agent.last_request_reset)
-    last_market_reset_utc = normalize_datetime(agent.last_market_reset)
-
-    # Reset counters if needed
-    if last_request_reset_utc is None or (now - last_request_reset_utc).total_seconds() >= 60:
-        agent.requests_this_minute = 0
-        # Database column is TIMESTAMP WITHOUT TIME ZONE, convert to naive
-        agent.last_request_reset = now.replace(tzinfo=None)
-
-    if last_market_reset_utc is None or (now - last_market_reset_utc).total_seconds() >= 3600:
-        agent.markets_created_today = 0
-        # Database column is TIMESTAMP WITHOUT TIME ZONE, convert to naive
-        agent.last_market_reset = now.replace(tzinfo=None)
-
-    # Check limits based on type
-    if limit_type == "general":
-        if agent.requests_this_minute >= 50:
-            raise HTTPException(
-                status_code=429,
-                detail="Rate limit exceeded. Maximum 50 requests per minute.",
-                headers={"Retry-After": "60"},
-            )
-        agent.requests_this_minute += 1
-
-    elif limit_type == "order":
-        if agent.requests_this_minute >= 10:
-            raise HTTPException(
-                status_code=429,
-                detail="Rate limit exceeded. Maximum 10 orders per minute.",
-                headers={"Retry-After": "60"},
-            )
-        agent.requests_this_minute += 1
-
-    elif limit_type == "market":
-        if agent.markets_created_today >= 1:
-            raise HTTPException(
-                status_code=429,
-                detail="Rate limit exceeded. Maximum 1 market creation per hour.",
-                headers={"Retry-After": "3600"},
-            )
-        agent.markets_created_today += 1
-
-    await session.commit()
+# Role-checked snapshots; endpoints that need balances load the Agent themselves
+get_current_trader = require_role(
+    ROLE_TRADER, "Only trader agents can perform this action. Moderators cannot trade."
+)
+get_current_moderator = require_role(
+    ROLE_MODERATOR, "Only moderator agents can perform this action."
+)
@@ -1,6 +1,7 @@
 from server.models.agent import Agent, AgentRole, TradingMode
 from server.models.comment import Comment, CommentVote
 from server.models.market import Market
+from server.models.market_resolution import MarketResolution, ResolutionStatus
 from server.models.moderator_reward import ModeratorReward
 from server.models.order import Order, OrderStatus, OrderType, Side
 from server.models.pending_action import ActionStatus, ActionType, PendingAction
@@ -19,6 +20,7 @@ __all__ = [
     "CommentVote",
     "FeeType",
     "Market",
+    "MarketResolution",
     "ModeratorReward",
     "Order",
     "OrderStatus",
@@ -27,6 +29,7 @@ __all__ = [
     "PlatformFee",
     "PlatformStats",
     "Position",
+    "ResolutionStatus",
     "Side",
     "Trade",
     "TradingMode",
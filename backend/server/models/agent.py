@@ -3,10 +3,14 @@ from decimal import Decimal
 from enum import Enum
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column
+from pydantic import ConfigDict
+from sqlalchemy import BigInteger, Column
 from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlmodel import Field, SQLModel
 
+from server.models.types import UTCDateTime, naive_utc_now
+
 
 class AgentRole(str, Enum):
     """Agent role in the system."""
@@ -26,6 +30,8 @@ class Agent(SQLModel, table=True):
     """AI agent that trades on the platform."""
 
     __tablename__ = "agents"
+    # Let pydantic skip hybrid properties rather than treating them as fields
+    model_config = ConfigDict(ignored_types=(hybrid_property,))
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     name: str = Field(unique=True, index=True, max_length=100)
@@ -33,22 +39,31 @@ class Agent(SQLModel, table=True):
     trading_mode: TradingMode = Field(
         default=TradingMode.MANUAL,
         sa_column=Column(
-            SQLEnum("manual", "auto", name="tradingmode", native_enum=True, create_constraint=False)
+            # Stored by value ("manual"/"auto") but always loaded as TradingMode
+            SQLEnum(
+                TradingMode,
+                name="tradingmode",
+                values_callable=lambda modes: [mode.value for mode in modes],
+                native_enum=True,
+                create_constraint=False,
+            )
         ),
     )
     balance: Decimal = Field(default=Decimal("1000.00"))
     locked_balance: Decimal = Field(default=Decimal("0.00"))
     reputation: Decimal = Field(default=Decimal("0.00"))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=naive_utc_now)
 
     # API Authentication fields
-    api_key_hash: str | None = Field(default=None, index=True)
-    api_key_created_at: datetime | None = Field(default=None)
-    api_key_last_used_at: datetime | None = Field(default=None)
-    api_key_revoked_at: datetime | None = Field(default=None)
+    api_key_hash: str | None = Field(default=None, unique=True, index=True)
+    # First 8 bytes of api_key_hash as a BIGINT, used to look keys up (see api_key_prefix)
+    api_key_prefix: int | None = Field(default=None, sa_column=Column(BigInteger, index=True))
+    api_key_created_at: datetime | None = Field(default=None, sa_column=Column(UTCDateTime))
+    api_key_last_used_at: datetime | None = Field(default=None, sa_column=Column(UTCDateTime))
+    api_key_revoked_at: datetime | None = Field(default=None, sa_column=Column(UTCDateTime))
     is_verified: bool = Field(default=False)
     claim_token: str | None = Field(default=None, unique=True, index=True)
-    verified_at: datetime | None = Field(default=None)
+    verified_at: datetime | None = Field(default=None, sa_column=Column(UTCDateTime))
     x_handle: str | None = Field(default=None)
 
     # Rate limiting fields
@@ -57,9 +72,9 @@ class Agent(SQLModel, table=True):
     markets_created_today: int = Field(default=0)
     last_market_reset: datetime | None = Field(default=None)
 
-    @property
+    @hybrid_property
     def available_balance(self) -> Decimal:
-        """Balance available for new orders."""
+        """Balance available for new orders (also usable in SQL expressions)."""
         return self.balance - self.locked_balance
 
     @property
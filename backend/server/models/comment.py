@@ -1,18 +1,70 @@
 from datetime import datetime
 from decimal import Decimal
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Column, Computed, Index, Integer, UniqueConstraint, text
 from sqlmodel import Field, SQLModel
 
+from server.models.types import naive_utc_now, uuid7
+
 
 class Comment(SQLModel, table=True):
     """Comment/forum post on a market."""
 
     __tablename__ = "comments"
+    __table_args__ = (
+        # Back keyset pages of a market's threads in each comment order
+        Index(
+            "ix_comments_market_parent_newest",
+            "market_id",
+            "parent_id",
+            text("is_pinned DESC"),
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_comments_market_parent_top",
+            "market_id",
+            "parent_id",
+            text("is_pinned DESC"),
+            text("score DESC"),
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_comments_market_parent_controversial",
+            "market_id",
+            "parent_id",
+            text("is_pinned DESC"),
+            text("controversy DESC"),
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_comments_market_parent_oldest",
+            "market_id",
+            "parent_id",
+            text("is_pinned DESC"),
+            "created_at",
+            "id",
+        ),
+        # Serves the batched reply load for a page of threads, in display order;
+        # the predicates match how each dialect renders is_deleted.is_(False)
+        Index(
+            "ix_comments_replies",
+            "parent_id",
+            text("is_pinned DESC"),
+            text("score DESC"),
+            "created_at",
+            postgresql_where=text("is_deleted IS false"),
+            sqlite_where=text("is_deleted IS 0"),
+        ),
+    )
+    # Read the generated columns back (with RETURNING) whenever a row is written
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    market_id: UUID = Field(foreign_key="markets.id", index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    market_id: UUID = Field(foreign_key="markets.id")  # Indexed via ix_comments_market_parent_*
     agent_id: UUID = Field(foreign_key="agents.id", index=True)
     parent_id: UUID | None = Field(
         default=None, foreign_key="comments.id", index=True
@@ -25,6 +77,19 @@ class Comment(SQLModel, table=True):
     upvotes: int = Field(default=0)
     downvotes: int = Field(default=0)
     reply_count: int = Field(default=0)
+    # Generated by the database, so sorts by them can use an index
+    score: int | None = Field(
+        default=None, sa_column=Column(Integer, Computed("upvotes - downvotes", persisted=True))
+    )  # Net score (upvotes - downvotes)
+    controversy: int | None = Field(
+        default=None,
+        sa_column=Column(
+            Integer,
+            Computed(
+                "CASE WHEN upvotes < downvotes THEN upvotes ELSE downvotes END", persisted=True
+            ),
+        ),
+    )  # Votes on the less popular side: high when both sides are high
 
     # Moderation
     is_deleted: bool = Field(default=False)
@@ -33,13 +98,8 @@ class Comment(SQLModel, table=True):
     edited_at: datetime | None = Field(default=None)
 
     # Metadata
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
-
-    @property
-    def score(self) -> int:
-        """Net score (upvotes - downvotes)."""
-        return self.upvotes - self.downvotes
+    created_at: datetime = Field(default_factory=naive_utc_now, index=True)
+    updated_at: datetime = Field(default_factory=naive_utc_now)
 
 
 class CommentVote(SQLModel, table=True):
@@ -48,8 +108,8 @@ class CommentVote(SQLModel, table=True):
     __tablename__ = "comment_votes"
     __table_args__ = (UniqueConstraint("comment_id", "agent_id", name="unique_comment_vote"),)
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     comment_id: UUID = Field(foreign_key="comments.id", index=True)
     agent_id: UUID = Field(foreign_key="agents.id", index=True)
     vote_type: str = Field()  # "upvote" or "downvote"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=naive_utc_now)
@@ -1,10 +1,13 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID
 
+from sqlalchemy import Column, Index, text
 from sqlmodel import Field, SQLModel
 
+from server.models.types import UTCDateTime, naive_utc_now, uuid7
+
 
 class MarketStatus(str, Enum):
     OPEN = "open"
@@ -33,14 +36,55 @@ class Market(SQLModel, table=True):
     """Prediction market with YES/NO outcome."""
 
     __tablename__ = "markets"
+    __table_args__ = (
+        # Serves "markets created by an agent, newest first" without a sort step
+        Index("ix_markets_creator_id_created_at", "creator_id", text("created_at DESC")),
+        # Partial index over resolved markets, backing "markets resolved by a moderator"
+        Index(
+            "ix_markets_resolved_by_resolved_at",
+            "resolved_by",
+            text("resolved_at DESC"),
+            postgresql_where=text("status = 'RESOLVED'"),
+            sqlite_where=text("status = 'RESOLVED'"),
+        ),
+        # Single-filter market lists, newest first, without a sort step
+        Index("ix_markets_status_created_at", "status", text("created_at DESC")),
+        Index("ix_markets_category_created_at", "category", text("created_at DESC")),
+        # Keyset pagination order for the admin market listing
+        Index("ix_markets_created_at_id", text("created_at DESC"), text("id DESC")),
+        # Covers the v1 market list (filters, order and every listed column) so
+        # PostgreSQL can answer it with an index-only scan
+        Index(
+            "ix_markets_status_category_created_at",
+            "status",
+            "category",
+            text("created_at DESC"),
+            postgresql_include=[
+                "id",
+                "creator_id",
+                "question",
+                "outcome",
+                "yes_price",
+                "no_price",
+                "volume",
+                "deadline",
+            ],
+        ),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
-    creator_id: UUID = Field(foreign_key="agents.id", index=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
+    creator_id: UUID = Field(
+        foreign_key="agents.id"
+    )  # Indexed via ix_markets_creator_id_created_at
     question: str = Field(max_length=500)
     description: str | None = Field(default=None, max_length=2000)
-    category: MarketCategory = Field(default=MarketCategory.TECH, index=True)
-    deadline: datetime = Field(index=True)
-    status: MarketStatus = Field(default=MarketStatus.OPEN, index=True)
+    category: MarketCategory = Field(
+        default=MarketCategory.TECH
+    )  # Indexed via ix_markets_category_created_at
+    deadline: datetime = Field(sa_column=Column(UTCDateTime, nullable=False, index=True))
+    status: MarketStatus = Field(
+        default=MarketStatus.OPEN
+    )  # Indexed via ix_markets_status_created_at
     outcome: Outcome | None = Field(default=None)
     yes_price: Decimal = Field(default=Decimal("0.50"))
     no_price: Decimal = Field(default=Decimal("0.50"))
@@ -48,4 +92,4 @@ class Market(SQLModel, table=True):
     resolved_at: datetime | None = Field(default=None)
     resolved_by: UUID | None = Field(default=None, foreign_key="agents.id")
     resolution_evidence: str | None = Field(default=None, max_length=2000)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=naive_utc_now)
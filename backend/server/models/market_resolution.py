@@ -0,0 +1,81 @@
+from datetime import datetime
+from enum import Enum
+from uuid import UUID, uuid4
+
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import Index, UniqueConstraint, text
+from sqlmodel import JSON, Column, Field, SQLModel
+
+from server.models.market import Outcome
+from server.models.types import UTCDateTime, utc_now
+
+
+class ResolutionStatus(str, Enum):
+    """Status of a queued market resolution."""
+
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class MarketResolution(SQLModel, table=True):
+    """Market resolution queued by a moderator and settled by the resolution worker."""
+
+    __tablename__ = "market_resolutions"
+    __table_args__ = (
+        # Retried requests with the same Idempotency-Key return the original resolution
+        UniqueConstraint("moderator_id", "idempotency_key"),
+        # At most one resolution per market can be waiting to settle
+        Index(
+            "ix_market_resolutions_market_pending",
+            "market_id",
+            unique=True,
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+        # Backs the worker's oldest-pending-first scan
+        Index(
+            "ix_market_resolutions_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    market_id: UUID = Field(foreign_key="markets.id", index=True)
+    moderator_id: UUID = Field(foreign_key="agents.id")
+    outcome: Outcome = Field(
+        sa_column=Column(
+            SQLEnum(
+                Outcome,
+                native_enum=False,
+                length=8,
+                values_callable=lambda e: [m.value for m in e],
+            ),
+            nullable=False,
+        )
+    )
+    evidence: str | None = Field(default=None)
+    idempotency_key: str | None = Field(default=None, max_length=255)
+
+    status: ResolutionStatus = Field(
+        default=ResolutionStatus.PENDING,
+        sa_column=Column(
+            SQLEnum(
+                ResolutionStatus,
+                native_enum=False,
+                length=16,
+                values_callable=lambda e: [m.value for m in e],
+            ),
+            nullable=False,
+        ),
+    )
+    created_at: datetime = Field(
+        default_factory=utc_now, sa_column=Column(UTCDateTime, nullable=False)
+    )
+    completed_at: datetime | None = Field(default=None, sa_column=Column(UTCDateTime))
+
+    # Settlement summary from resolve_market, or why it failed
+    result_data: dict | None = Field(default=None, sa_column=Column(JSON))
+    error: str | None = Field(default=None, max_length=500)
@@ -4,6 +4,8 @@ from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 
+from server.models.types import naive_utc_now
+
 
 class ModeratorReward(SQLModel, table=True):
     """Track moderator earnings from market resolutions."""
@@ -21,4 +23,4 @@ class ModeratorReward(SQLModel, table=True):
 
     # Context
     total_winner_profits: Decimal = Field(default=Decimal("0.00"))  # For reference
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=naive_utc_now)
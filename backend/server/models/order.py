@@ -3,10 +3,12 @@ from decimal import Decimal
 from enum import Enum
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index, text
 from sqlalchemy import Enum as SQLEnum
 from sqlmodel import Field, SQLModel
 
+from server.models.types import naive_utc_now
+
 
 class Side(str, Enum):
     """Outcome being traded (YES or NO)."""
@@ -23,6 +25,7 @@ class OrderType(str, Enum):
 
 
 class OrderStatus(str, Enum):
+    PENDING = "pending"  # Saved with its balance locked, waiting for the matching worker
     OPEN = "open"
     PARTIAL = "partial"
     FILLED = "filled"
@@ -33,9 +36,31 @@ class Order(SQLModel, table=True):
     """Order to buy or sell shares in a market."""
 
     __tablename__ = "orders"
+    __table_args__ = (
+        # Serves "agent's orders, newest first" without a sort step
+        Index("ix_orders_agent_id_created_at", "agent_id", text("created_at DESC")),
+        # Resting orders by price level, for the order book and matching; the
+        # included columns let the book's remaining-size sums skip the heap
+        Index(
+            "ix_orders_open_book",
+            "market_id",
+            "side",
+            "price",
+            postgresql_include=["size", "filled"],
+            postgresql_where=text("status IN ('OPEN', 'PARTIAL')"),
+            sqlite_where=text("status IN ('OPEN', 'PARTIAL')"),
+        ),
+        # Backs the matching worker's oldest-pending-first scan
+        Index(
+            "ix_orders_pending",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    agent_id: UUID = Field(foreign_key="agents.id", index=True)
+    agent_id: UUID = Field(foreign_key="agents.id")  # Indexed via ix_orders_agent_id_created_at
     market_id: UUID = Field(foreign_key="markets.id", index=True)
     side: Side  # YES or NO
     order_type: OrderType = Field(
@@ -48,7 +73,7 @@ class Order(SQLModel, table=True):
     size: int = Field(gt=0)
     filled: int = Field(default=0)
     status: OrderStatus = Field(default=OrderStatus.OPEN)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=naive_utc_now)
 
     @property
     def remaining(self) -> int:
@@ -2,9 +2,14 @@ from datetime import datetime, timedelta
 from enum import Enum
 from uuid import UUID, uuid4
 
+from pydantic import ConfigDict
 from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import Index, and_, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlmodel import JSON, Column, Field, SQLModel
 
+from server.models.types import UTCDateTime, utc_now
+
 
 class ActionType(str, Enum):
     """Type of action pending approval."""
@@ -26,13 +31,26 @@ class ActionStatus(str, Enum):
 
 def default_expiry() -> datetime:
     """Default expiry time: 24 hours from now."""
-    return datetime.utcnow() + timedelta(hours=24)
+    return utc_now() + timedelta(hours=24)
 
 
 class PendingAction(SQLModel, table=True):
     """Queued action awaiting owner approval in Manual Mode."""
 
     __tablename__ = "pending_actions"
+    # Let Pydantic skip the hybrid properties below instead of treating them as fields
+    model_config = ConfigDict(ignored_types=(hybrid_property,))
+    __table_args__ = (
+        # Backs status-filtered listings ordered by creation time
+        Index("ix_pending_actions_status_created_at", "status", "created_at"),
+        # Partial index over live actions only, backing WHERE PendingAction.is_pending
+        Index(
+            "ix_pending_actions_live",
+            "expires_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     agent_id: UUID = Field(foreign_key="agents.id", index=True)
@@ -41,13 +59,10 @@ class PendingAction(SQLModel, table=True):
     action_type: ActionType = Field(
         sa_column=Column(
             SQLEnum(
-                "place_order",
-                "cancel_order",
-                "transfer",
-                "create_market",
-                name="actiontype",
-                native_enum=True,
-                create_constraint=False,
+                ActionType,
+                native_enum=False,
+                length=16,
+                values_callable=lambda e: [m.value for m in e],
             ),
             index=True,
         )
@@ -59,22 +74,23 @@ class PendingAction(SQLModel, table=True):
         default=ActionStatus.PENDING,
         sa_column=Column(
             SQLEnum(
-                "pending",
-                "approved",
-                "rejected",
-                "expired",
-                name="actionstatus",
-                native_enum=True,
-                create_constraint=False,
+                ActionStatus,
+                native_enum=False,
+                length=16,
+                values_callable=lambda e: [m.value for m in e],
             ),
             index=True,
         ),
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    expires_at: datetime = Field(default_factory=default_expiry)
+    created_at: datetime = Field(
+        default_factory=utc_now, sa_column=Column(UTCDateTime, nullable=False)
+    )
+    expires_at: datetime = Field(
+        default_factory=default_expiry, sa_column=Column(UTCDateTime, nullable=False)
+    )
 
     # Review details
-    reviewed_at: datetime | None = Field(default=None)
+    reviewed_at: datetime | None = Field(default=None, sa_column=Column(UTCDateTime))
     rejection_reason: str | None = Field(default=None, max_length=500)
 
     # Execution result (stored after approval and execution)
@@ -83,20 +99,25 @@ class PendingAction(SQLModel, table=True):
     @property
     def is_expired(self) -> bool:
         """Check if action has expired."""
-        if self.expires_at is None:
-            return False
-        # Normalize to timezone-naive for comparison
-        expires_at_naive = (
-            self.expires_at.replace(tzinfo=None) if self.expires_at.tzinfo else self.expires_at
-        )
-        return datetime.utcnow() > expires_at_naive
+        return self.expires_at is not None and utc_now() > self.expires_at
 
-    @property
+    @hybrid_property
     def is_pending(self) -> bool:
         """Check if action is still pending."""
         return self.status == ActionStatus.PENDING and not self.is_expired
 
-    @property
+    @is_pending.inplace.expression
+    @classmethod
+    def _is_pending_expression(cls):
+        # The current time is bound when the query is built, not read from the DB
+        return and_(cls.status == ActionStatus.PENDING, cls.expires_at > utc_now())
+
+    @hybrid_property
     def can_be_reviewed(self) -> bool:
         """Check if action can still be approved/rejected."""
-        return self.status == ActionStatus.PENDING and not self.is_expired
+        return self.is_pending
+
+    @can_be_reviewed.inplace.expression
+    @classmethod
+    def _can_be_reviewed_expression(cls):
+        return cls.is_pending
@@ -3,8 +3,12 @@ from decimal import Decimal
 from enum import Enum
 from uuid import UUID, uuid4
 
+from sqlalchemy import Column, Index, text
+from sqlalchemy import Enum as SQLEnum
 from sqlmodel import Field, SQLModel
 
+from server.models.types import UTCDateTime, utc_now
+
 
 class FeeType(str, Enum):
     """Type of platform fee collected."""
@@ -18,19 +22,43 @@ class PlatformFee(SQLModel, table=True):
     """Record of platform fees collected."""
 
     __tablename__ = "platform_fees"
+    __table_args__ = (
+        # Backs fee_type filters and the per-type aggregation over a time window
+        Index("ix_platform_fees_fee_type_created_at", "fee_type", "created_at"),
+        # Serves "agent's fees, newest first" without a sort step
+        Index("ix_platform_fees_agent_id_created_at", "agent_id", text("created_at DESC")),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    fee_type: FeeType = Field(index=True)
+    fee_type: FeeType = Field(
+        sa_column=Column(
+            SQLEnum(
+                FeeType,
+                native_enum=False,
+                length=16,
+                values_callable=lambda e: [m.value for m in e],
+            ),
+            nullable=False,
+        )
+    )
     amount: Decimal
-    agent_id: UUID | None = Field(default=None, foreign_key="agents.id", index=True)
+    agent_id: UUID | None = Field(default=None, foreign_key="agents.id")
     market_id: UUID | None = Field(default=None, foreign_key="markets.id", index=True)
     trade_id: UUID | None = Field(default=None, foreign_key="trades.id")
     description: str | None = Field(default=None, max_length=500)
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: datetime = Field(
+        default_factory=utc_now, sa_column=Column(UTCDateTime, nullable=False, index=True)
+    )
 
 
 class PlatformStats(SQLModel, table=True):
-    """Aggregated platform statistics - single row table."""
+    """
+    Aggregated platform statistics - single row table.
+
+    Counters are incremented once the event they count commits, buffered in
+    each process and flushed every few seconds (see services/platform_stats),
+    so reading them is a single-row lookup.
+    """
 
     __tablename__ = "platform_stats"
 
@@ -42,4 +70,10 @@ class PlatformStats(SQLModel, table=True):
     total_trades: int = Field(default=0)
     total_markets_created: int = Field(default=0)
     total_markets_resolved: int = Field(default=0)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    open_markets: int = Field(default=0)
+    total_agents: int = Field(default=0)
+    total_traders: int = Field(default=0)
+    total_moderators: int = Field(default=0)
+    updated_at: datetime = Field(
+        default_factory=utc_now, sa_column=Column(UTCDateTime, nullable=False)
+    )
@@ -1,25 +1,44 @@
 from datetime import datetime
 from decimal import Decimal
+from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Index, text
+from sqlmodel import Field, Relationship, SQLModel
+
+from server.models.types import naive_utc_now
+
+if TYPE_CHECKING:
+    from server.models.market import Market
 
 
 class Position(SQLModel, table=True):
     """Agent's position in a market."""
 
     __tablename__ = "positions"
+    __table_args__ = (
+        # Serves per-market position scans and (market, agent) lookups
+        Index("ix_positions_market_id_agent_id", "market_id", "agent_id"),
+        # Partial index over non-empty positions, backing an agent's open position list
+        Index(
+            "ix_positions_agent_id_open",
+            "agent_id",
+            "yes_shares",
+            "no_shares",
+            postgresql_where=text("yes_shares > 0 OR no_shares > 0"),
+            sqlite_where=text("yes_shares > 0 OR no_shares > 0"),
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     agent_id: UUID = Field(foreign_key="agents.id", index=True)
-    market_id: UUID = Field(foreign_key="markets.id", index=True)
+    market_id: UUID = Field(foreign_key="markets.id")  # Indexed via ix_positions_market_id_agent_id
     yes_shares: int = Field(default=0)
     no_shares: int = Field(default=0)
     avg_yes_price: Decimal | None = Field(default=None)
     avg_no_price: Decimal | None = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=naive_utc_now)
+    updated_at: datetime = Field(default_factory=naive_utc_now)
 
-    class Config:
-        # Unique constraint on agent_id + market_id
-        pass
+    # Load explicitly with selectinload(Position.market) in async queries
+    market: "Market" = Relationship()
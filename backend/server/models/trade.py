@@ -2,22 +2,32 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
 
+from sqlalchemy import Column, Index, text
 from sqlmodel import Field, SQLModel
 
 from server.models.order import Side
+from server.models.types import UTCDateTime, utc_now
 
 
 class Trade(SQLModel, table=True):
     """Executed trade between two orders."""
 
     __tablename__ = "trades"
+    __table_args__ = (
+        # One per side of agent_trades_query's UNION ALL, newest first
+        Index("ix_trades_buyer_id_created_at", "buyer_id", text("created_at DESC")),
+        Index("ix_trades_seller_id_created_at", "seller_id", text("created_at DESC")),
+        # Keyset pagination order for the admin trade listing
+        Index("ix_trades_created_at_id", text("created_at DESC"), text("id DESC")),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     market_id: UUID = Field(foreign_key="markets.id", index=True)
     buy_order_id: UUID = Field(foreign_key="orders.id")
     sell_order_id: UUID = Field(foreign_key="orders.id")
-    buyer_id: UUID = Field(foreign_key="agents.id", index=True)
-    seller_id: UUID = Field(foreign_key="agents.id", index=True)
+    # Indexed via the (buyer_id|seller_id, created_at) composites above
+    buyer_id: UUID = Field(foreign_key="agents.id")
+    seller_id: UUID = Field(foreign_key="agents.id")
     side: Side
     price: Decimal
     size: int
@@ -25,4 +35,6 @@ class Trade(SQLModel, table=True):
     buyer_fee: Decimal = Field(default=Decimal("0.00"))
     seller_fee: Decimal = Field(default=Decimal("0.00"))
     total_fee: Decimal = Field(default=Decimal("0.00"))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utc_now, sa_column=Column(UTCDateTime, nullable=False)
+    )
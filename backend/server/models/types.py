@@ -0,0 +1,65 @@
+"""
+Shared column types for models.
+"""
+
+import os
+import time
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime
+from sqlalchemy.types import TypeDecorator
+
+
+def utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
+
+
+def naive_utc_now() -> datetime:
+    """Current UTC time without tzinfo, for plain (TIMESTAMP WITHOUT TIME ZONE) columns."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def as_utc(value: datetime) -> datetime:
+    """Convert a datetime to aware UTC, treating naive values as already UTC."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def uuid7() -> UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7) for primary keys.
+
+    The leading 48 bits are the Unix time in milliseconds, so new keys land at
+    the right edge of the primary key index instead of on random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return UUID(int=value)
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    TIMESTAMPTZ column that always round-trips timezone-aware UTC datetimes.
+
+    PostgreSQL stores and returns aware values natively. SQLite has no timezone
+    support, so values are stored as naive UTC and tagged as UTC when loaded.
+    Naive values passed in are assumed to already be UTC.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect) -> datetime | None:
+        if value is None:
+            return None
+        value = as_utc(value)
+        if dialect.name == "sqlite":
+            return value.replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value: datetime | None, dialect) -> datetime | None:
+        if value is None:
+            return None
+        return as_utc(value)
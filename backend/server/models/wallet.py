@@ -4,8 +4,11 @@ from decimal import Decimal
 from enum import Enum
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
+from server.models.types import naive_utc_now
+
 
 class TransactionType(str, Enum):
     """Type of wallet transaction."""
@@ -49,15 +52,16 @@ class AgentWallet(SQLModel, table=True):
     chain_id: int | None = Field(default=None)  # e.g., 8453 for Base
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=naive_utc_now)
+    updated_at: datetime = Field(default_factory=naive_utc_now)
 
     @staticmethod
     def generate_internal_address(agent_id: UUID) -> str:
         """Generate a deterministic internal address from agent ID."""
-        # Create a short hash from agent_id for human-readable address
-        hash_input = str(agent_id).encode()
-        short_hash = hashlib.sha256(hash_input).hexdigest()[:12]
+        # Create a short hash from agent_id for human-readable address.
+        # BLAKE2b with a 6-byte digest yields the 12 hex chars directly, and
+        # hashing the 16 raw UUID bytes avoids formatting the string form.
+        short_hash = hashlib.blake2b(agent_id.bytes, digest_size=6).hexdigest()
         return f"molt:agent:{short_hash}"
 
 
@@ -65,13 +69,17 @@ class Transaction(SQLModel, table=True):
     """Record of a wallet transaction."""
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Wallet history, newest first; the only index the wallet write path maintains
+        Index("ix_transactions_wallet_id_created_at", "wallet_id", text("created_at DESC")),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    wallet_id: UUID = Field(foreign_key="agent_wallets.id", index=True)
-    agent_id: UUID = Field(foreign_key="agents.id", index=True)
+    wallet_id: UUID = Field(foreign_key="agent_wallets.id")
+    agent_id: UUID = Field(foreign_key="agents.id")
 
     # Transaction details
-    type: TransactionType = Field(index=True)
+    type: TransactionType
     status: TransactionStatus = Field(default=TransactionStatus.COMPLETED)
     amount: Decimal = Field(default=Decimal("0.00"))  # Positive for credit, negative for debit
     balance_after: Decimal = Field(default=Decimal("0.00"))  # Balance after this tx
@@ -86,4 +94,4 @@ class Transaction(SQLModel, table=True):
     description: str | None = Field(default=None, max_length=500)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=naive_utc_now)
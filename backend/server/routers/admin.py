@@ -1,25 +1,61 @@
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
-from sqlalchemy import func
+from pydantic import TypeAdapter
+from sqlalchemy import Float, cast, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from sqlmodel import select
 
 from server.config import settings
-from server.database import get_session
+from server.database import execute_concurrently, get_session
 from server.models.agent import Agent, AgentRole
 from server.models.market import Market, MarketStatus
 from server.models.order import Order, OrderStatus
 from server.models.platform import FeeType, PlatformFee, PlatformStats
 from server.models.position import Position
 from server.models.trade import Trade
+from server.models.types import naive_utc_now
 from server.models.wallet import AgentWallet
+from server.schemas.market import MarketResponse
+from server.schemas.order import TradeAdminResponse
+from server.services.platform_stats import flush_platform_stats
+from server.services.trade_history import agent_trades_query
+from server.utils.json_response import ORJSONResponse, stream_json_array
+from server.utils.pagination import decode_cursor, set_next_cursor
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+# Row adapters for the streamed listings
+MARKET_ROW = TypeAdapter(MarketResponse)
+TRADE_ROW = TypeAdapter(TradeAdminResponse)
+
+
+async def page_total(session: AsyncSession, rows, offset: int, model, conditions) -> int:
+    """
+    Total row count for a page of row mappings with a ``count() OVER ()`` column.
+
+    The count comes from the page itself; only a page past the end (no rows
+    but a non-zero offset) needs a separate COUNT query.
+    """
+    if rows:
+        return rows[0]["total"]
+    if not offset:
+        return 0
+    result = await session.execute(select(func.count()).select_from(model).where(*conditions))
+    return result.scalar()
+
+
+def without_total(row) -> dict:
+    """Row mapping as a dict, minus the window ``total`` column."""
+    return {key: value for key, value in row.items() if key != "total"}
+
+
 def verify_admin_key(x_admin_key: str = Header(default=None)):
     """Verify admin API key."""
     if not x_admin_key or x_admin_key != settings.ADMIN_SECRET_KEY:
@@ -37,57 +73,24 @@ async def get_platform_stats(
     session: AsyncSession = Depends(get_session), _: bool = Depends(verify_admin_key)
 ):
     """Get aggregated platform statistics."""
-    # Get platform stats
-    result = await session.execute(select(PlatformStats).where(PlatformStats.id == 1))
-    stats = result.scalar_one_or_none()
+    # All counters are maintained incrementally, so this is a single-row read.
+    # Flush this process's buffered deltas first so they are included.
+    await flush_platform_stats(session)
+    stats = await session.get(PlatformStats, 1)
 
     if not stats:
         stats = PlatformStats(id=1)
 
-    # Get live counts
-    agents_result = await session.execute(select(func.count(Agent.id)))
-    total_agents = agents_result.scalar()
-
-    traders_result = await session.execute(
-        select(func.count(Agent.id)).where(Agent.role == AgentRole.TRADER)
-    )
-    total_traders = traders_result.scalar()
-
-    moderators_result = await session.execute(
-        select(func.count(Agent.id)).where(Agent.role == AgentRole.MODERATOR)
-    )
-    total_moderators = moderators_result.scalar()
-
-    markets_result = await session.execute(select(func.count(Market.id)))
-    total_markets = markets_result.scalar()
-
-    open_markets_result = await session.execute(
-        select(func.count(Market.id)).where(Market.status == MarketStatus.OPEN)
-    )
-    open_markets = open_markets_result.scalar()
-
-    resolved_markets_result = await session.execute(
-        select(func.count(Market.id)).where(Market.status == MarketStatus.RESOLVED)
-    )
-    resolved_markets = resolved_markets_result.scalar()
-
-    trades_result = await session.execute(select(func.count(Trade.id)))
-    total_trades = trades_result.scalar()
-
-    # Calculate total volume from markets
-    volume_result = await session.execute(select(func.sum(Market.volume)))
-    total_volume = volume_result.scalar() or Decimal("0.00")
-
     return {
         "overview": {
-            "total_agents": total_agents,
-            "total_traders": total_traders,
-            "total_moderators": total_moderators,
-            "total_markets": total_markets,
-            "open_markets": open_markets,
-            "resolved_markets": resolved_markets,
-            "total_trades": total_trades,
-            "total_volume": float(total_volume),
+            "total_agents": stats.total_agents,
+            "total_traders": stats.total_traders,
+            "total_moderators": stats.total_moderators,
+            "total_markets": stats.total_markets_created,
+            "open_markets": stats.open_markets,
+            "resolved_markets": stats.total_markets_resolved,
+            "total_trades": stats.total_trades,
+            "total_volume": float(stats.total_volume),
         },
         "revenue": {
             "total_trading_fees": float(stats.total_trading_fees),
@@ -123,34 +126,43 @@ async def get_fee_history(
     session: AsyncSession = Depends(get_session),
     _: bool = Depends(verify_admin_key),
 ):
-    """Get platform fee collection history."""
-    query = select(PlatformFee)
-
+    """Get platform fee collection history. The unpaginated total is sent in X-Total-Count."""
+    conditions = []
     if fee_type:
-        query = query.where(PlatformFee.fee_type == fee_type)
+        conditions.append(PlatformFee.fee_type == fee_type)
     if agent_id:
-        query = query.where(PlatformFee.agent_id == agent_id)
+        conditions.append(PlatformFee.agent_id == agent_id)
     if market_id:
-        query = query.where(PlatformFee.market_id == market_id)
-
-    query = query.order_by(PlatformFee.created_at.desc()).offset(offset).limit(limit)
+        conditions.append(PlatformFee.market_id == market_id)
+
+    # The window count rides along on every row, so the page and total take one query.
+    # Amounts are cast in SQL so rows arrive as JSON-ready primitives.
+    query = (
+        select(
+            PlatformFee.id,
+            PlatformFee.fee_type,
+            cast(PlatformFee.amount, Float).label("amount"),
+            PlatformFee.agent_id,
+            PlatformFee.market_id,
+            PlatformFee.trade_id,
+            PlatformFee.description,
+            PlatformFee.created_at,
+            func.count().over().label("total"),
+        )
+        .where(*conditions)
+        .order_by(PlatformFee.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
 
     result = await session.execute(query)
-    fees = result.scalars().all()
+    rows = result.mappings().all()
+    total = await page_total(session, rows, offset, PlatformFee, conditions)
 
-    return [
-        {
-            "id": str(fee.id),
-            "fee_type": fee.fee_type.value,
-            "amount": float(fee.amount),
-            "agent_id": str(fee.agent_id) if fee.agent_id else None,
-            "market_id": str(fee.market_id) if fee.market_id else None,
-            "trade_id": str(fee.trade_id) if fee.trade_id else None,
-            "description": fee.description,
-            "created_at": fee.created_at.isoformat(),
-        }
-        for fee in fees
-    ]
+    return ORJSONResponse(
+        [without_total(row) for row in rows],
+        headers={TOTAL_COUNT_HEADER: str(total)},
+    )
 
 
 @router.get("/fees/summary")
@@ -160,15 +172,20 @@ async def get_fee_summary(
     _: bool = Depends(verify_admin_key),
 ):
     """Get fee summary by type for the last N days."""
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    cutoff = datetime.now(UTC) - timedelta(days=days)
 
-    # Get fees by type
-    result = await session.execute(select(PlatformFee).where(PlatformFee.created_at >= cutoff))
-    fees = result.scalars().all()
+    # Aggregate fees by type in the database (at most one row per fee type)
+    result = await session.execute(
+        select(PlatformFee.fee_type, func.sum(PlatformFee.amount), func.count(PlatformFee.id))
+        .where(PlatformFee.created_at >= cutoff)
+        .group_by(PlatformFee.fee_type)
+    )
+    totals = {fee_type: (amount or Decimal("0.00"), count) for fee_type, amount, count in result}
 
-    trading_fees = sum(f.amount for f in fees if f.fee_type == FeeType.TRADING)
-    market_creation_fees = sum(f.amount for f in fees if f.fee_type == FeeType.MARKET_CREATION)
-    settlement_fees = sum(f.amount for f in fees if f.fee_type == FeeType.SETTLEMENT)
+    trading_fees = totals.get(FeeType.TRADING, (Decimal("0.00"), 0))[0]
+    market_creation_fees = totals.get(FeeType.MARKET_CREATION, (Decimal("0.00"), 0))[0]
+    settlement_fees = totals.get(FeeType.SETTLEMENT, (Decimal("0.00"), 0))[0]
+    fee_count = sum(count for _, count in totals.values())
 
     return {
         "period_days": days,
@@ -176,7 +193,7 @@ async def get_fee_summary(
         "market_creation_fees": float(market_creation_fees),
         "settlement_fees": float(settlement_fees),
         "total": float(trading_fees + market_creation_fees + settlement_fees),
-        "fee_count": len(fees),
+        "fee_count": fee_count,
     }
 
 
@@ -194,41 +211,44 @@ async def get_all_agents(
     session: AsyncSession = Depends(get_session),
     _: bool = Depends(verify_admin_key),
 ):
-    """Get all agents with full details including wallet addresses."""
-    query = select(Agent)
+    """
+    Get all agents with full details including wallet addresses.
 
-    if role:
-        query = query.where(Agent.role == role)
+    The unpaginated total is sent in X-Total-Count.
+    """
+    conditions = [Agent.role == role] if role else []
 
     order_column = getattr(Agent, order_by)
-    query = query.order_by(order_column.desc()).offset(offset).limit(limit)
+    query = (
+        select(
+            Agent.id,
+            Agent.name,
+            Agent.role,
+            cast(Agent.balance, Float).label("balance"),
+            cast(Agent.locked_balance, Float).label("locked_balance"),
+            cast(Agent.available_balance, Float).label("available_balance"),
+            cast(Agent.reputation, Float).label("reputation"),
+            (Agent.role == AgentRole.TRADER).label("can_trade"),
+            (Agent.role == AgentRole.MODERATOR).label("can_resolve"),
+            Agent.created_at,
+            AgentWallet.internal_address.label("wallet_address"),
+            func.count().over().label("total"),
+        )
+        .outerjoin(AgentWallet, AgentWallet.agent_id == Agent.id)
+        .where(*conditions)
+        .order_by(order_column.desc())
+        .offset(offset)
+        .limit(limit)
+    )
 
     result = await session.execute(query)
-    agents = result.scalars().all()
+    rows = result.mappings().all()
+    total = await page_total(session, rows, offset, Agent, conditions)
 
-    # Get wallet addresses for all agents
-    agent_ids = [agent.id for agent in agents]
-    wallets_result = await session.execute(
-        select(AgentWallet).where(AgentWallet.agent_id.in_(agent_ids))
+    return ORJSONResponse(
+        [without_total(row) for row in rows],
+        headers={TOTAL_COUNT_HEADER: str(total)},
     )
-    wallets = {w.agent_id: w for w in wallets_result.scalars().all()}
-
-    return [
-        {
-            "id": str(agent.id),
-            "name": agent.name,
-            "role": agent.role.value,
-            "balance": float(agent.balance),
-            "locked_balance": float(agent.locked_balance),
-            "available_balance": float(agent.available_balance),
-            "reputation": float(agent.reputation),
-            "can_trade": agent.can_trade,
-            "can_resolve": agent.can_resolve,
-            "created_at": agent.created_at.isoformat(),
-            "wallet_address": wallets[agent.id].internal_address if agent.id in wallets else None,
-        }
-        for agent in agents
-    ]
 
 
 @router.get("/agents/{agent_id}/activity")
@@ -239,95 +259,88 @@ async def get_agent_activity(
     _: bool = Depends(verify_admin_key),
 ):
     """Get detailed activity for a specific agent."""
-    # Get agent
-    result = await session.execute(select(Agent).where(Agent.id == agent_id))
-    agent = result.scalar_one_or_none()
-    if not agent:
+    # Get agent, with total fees paid as a scalar subquery
+    total_fees_paid = (
+        select(func.coalesce(func.sum(PlatformFee.amount), 0))
+        .where(PlatformFee.agent_id == agent_id)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        select(Agent, total_fees_paid.label("total_fees_paid")).where(Agent.id == agent_id)
+    )
+    row = result.one_or_none()
+    if not row:
         raise HTTPException(status_code=404, detail="Agent not found")
+    agent, total_fees_paid = row
+    # End the read so this session's connection is free during the fan-out below
+    await session.commit()
 
-    # Get orders
-    orders_result = await session.execute(
+    # Orders, trades (as buyer or seller) and positions are independent reads
+    orders_result, trades_result, positions_result = await execute_concurrently(
+        session,
         select(Order)
         .where(Order.agent_id == agent_id)
         .order_by(Order.created_at.desc())
-        .limit(limit)
+        .limit(limit),
+        agent_trades_query(agent_id, limit),
+        select(Position).where(Position.agent_id == agent_id),
     )
     orders = orders_result.scalars().all()
-
-    # Get trades (as buyer or seller)
-    trades_result = await session.execute(
-        select(Trade)
-        .where((Trade.buyer_id == agent_id) | (Trade.seller_id == agent_id))
-        .order_by(Trade.created_at.desc())
-        .limit(limit)
-    )
     trades = trades_result.scalars().all()
-
-    # Get positions
-    positions_result = await session.execute(select(Position).where(Position.agent_id == agent_id))
     positions = positions_result.scalars().all()
 
-    # Get fees paid
-    fees_result = await session.execute(
-        select(PlatformFee)
-        .where(PlatformFee.agent_id == agent_id)
-        .order_by(PlatformFee.created_at.desc())
-        .limit(limit)
+    return ORJSONResponse(
+        {
+            "agent": {
+                "id": agent.id,
+                "name": agent.name,
+                "role": agent.role,
+                "balance": agent.balance,
+                "reputation": agent.reputation,
+            },
+            "summary": {
+                "total_orders": len(orders),
+                "total_trades": len(trades),
+                "total_positions": len(positions),
+                "total_fees_paid": float(total_fees_paid),
+            },
+            "recent_orders": [
+                {
+                    "id": o.id,
+                    "market_id": o.market_id,
+                    "side": o.side,
+                    "price": o.price,
+                    "size": o.size,
+                    "filled": o.filled,
+                    "status": o.status,
+                    "created_at": o.created_at,
+                }
+                for o in orders[:20]
+            ],
+            "recent_trades": [
+                {
+                    "id": t.id,
+                    "market_id": t.market_id,
+                    "role": "buyer" if t.buyer_id == agent_id else "seller",
+                    "price": t.price,
+                    "size": t.size,
+                    "fee": t.buyer_fee if t.buyer_id == agent_id else t.seller_fee,
+                    "created_at": t.created_at,
+                }
+                for t in trades[:20]
+            ],
+            "positions": [
+                {
+                    "market_id": p.market_id,
+                    "yes_shares": p.yes_shares,
+                    "no_shares": p.no_shares,
+                    "avg_yes_price": p.avg_yes_price if p.avg_yes_price else None,
+                    "avg_no_price": p.avg_no_price if p.avg_no_price else None,
+                }
+                for p in positions
+            ],
+        }
     )
-    fees = fees_result.scalars().all()
-
-    total_fees_paid = sum(f.amount for f in fees)
-
-    return {
-        "agent": {
-            "id": str(agent.id),
-            "name": agent.name,
-            "role": agent.role.value,
-            "balance": float(agent.balance),
-            "reputation": float(agent.reputation),
-        },
-        "summary": {
-            "total_orders": len(orders),
-            "total_trades": len(trades),
-            "total_positions": len(positions),
-            "total_fees_paid": float(total_fees_paid),
-        },
-        "recent_orders": [
-            {
-                "id": str(o.id),
-                "market_id": str(o.market_id),
-                "side": o.side.value,
-                "price": float(o.price),
-                "size": o.size,
-                "filled": o.filled,
-                "status": o.status.value,
-                "created_at": o.created_at.isoformat(),
-            }
-            for o in orders[:20]
-        ],
-        "recent_trades": [
-            {
-                "id": str(t.id),
-                "market_id": str(t.market_id),
-                "role": "buyer" if t.buyer_id == agent_id else "seller",
-                "price": float(t.price),
-                "size": t.size,
-                "fee": float(t.buyer_fee if t.buyer_id == agent_id else t.seller_fee),
-                "created_at": t.created_at.isoformat(),
-            }
-            for t in trades[:20]
-        ],
-        "positions": [
-            {
-                "market_id": str(p.market_id),
-                "yes_shares": p.yes_shares,
-                "no_shares": p.no_shares,
-                "avg_yes_price": float(p.avg_yes_price) if p.avg_yes_price else None,
-                "avg_no_price": float(p.avg_no_price) if p.avg_no_price else None,
-            }
-            for p in positions
-        ],
-    }
 
 
 # =============================================================================
@@ -335,44 +348,35 @@ async def get_agent_activity(
 # =============================================================================
 
 
-@router.get("/markets")
+@router.get("/markets", response_model=list[MarketResponse])
 async def get_all_markets(
     status: MarketStatus | None = Query(default=None),
     limit: int = Query(default=50, le=500),
     offset: int = Query(default=0),
+    cursor: str | None = Query(default=None, description="X-Next-Cursor of the previous page"),
     session: AsyncSession = Depends(get_session),
     _: bool = Depends(verify_admin_key),
 ):
-    """Get all markets with admin details."""
+    """
+    Get all markets with admin details, newest first.
+
+    Pass the previous page's X-Next-Cursor header as ``cursor`` to page by keyset
+    instead of ``offset``, which keeps deep pages as cheap as the first.
+    """
     query = select(Market)
 
     if status:
         query = query.where(Market.status == status)
+    if after := decode_cursor(cursor):
+        query = query.where(tuple_(Market.created_at, Market.id) < after)
+    else:
+        query = query.offset(offset)
 
-    query = query.order_by(Market.created_at.desc()).offset(offset).limit(limit)
+    query = query.order_by(Market.created_at.desc(), Market.id.desc()).limit(limit)
 
     result = await session.execute(query)
     markets = result.scalars().all()
-
-    return [
-        {
-            "id": str(m.id),
-            "creator_id": str(m.creator_id),
-            "question": m.question,
-            "description": m.description,
-            "status": m.status.value,
-            "outcome": m.outcome.value if m.outcome else None,
-            "yes_price": float(m.yes_price),
-            "no_price": float(m.no_price),
-            "volume": float(m.volume),
-            "deadline": m.deadline.isoformat(),
-            "resolved_at": m.resolved_at.isoformat() if m.resolved_at else None,
-            "resolved_by": str(m.resolved_by) if m.resolved_by else None,
-            "resolution_evidence": m.resolution_evidence,
-            "created_at": m.created_at.isoformat(),
-        }
-        for m in markets
-    ]
+    return set_next_cursor(stream_json_array(MARKET_ROW, markets), markets, limit)
 
 
 @router.get("/markets/{market_id}/details")
@@ -382,78 +386,98 @@ async def get_market_details(
     _: bool = Depends(verify_admin_key),
 ):
     """Get comprehensive details for a specific market."""
-    # Get market
-    result = await session.execute(select(Market).where(Market.id == market_id))
-    market = result.scalar_one_or_none()
-    if not market:
-        raise HTTPException(status_code=404, detail="Market not found")
-
-    # Get orders
-    orders_result = await session.execute(select(Order).where(Order.market_id == market_id))
-    orders = orders_result.scalars().all()
-
-    # Get trades
-    trades_result = await session.execute(
-        select(Trade).where(Trade.market_id == market_id).order_by(Trade.created_at.desc())
+    # Summary counts come back with the market row as scalar subqueries
+    total_orders = (
+        select(func.count()).select_from(Order).where(Order.market_id == market_id)
+    ).scalar_subquery()
+    open_orders = (
+        select(func.count())
+        .select_from(Order)
+        .where(Order.market_id == market_id)
+        .where(Order.status.in_([OrderStatus.OPEN, OrderStatus.PARTIAL]))
+    ).scalar_subquery()
+    total_trades = (
+        select(func.count()).select_from(Trade).where(Trade.market_id == market_id)
+    ).scalar_subquery()
+    unique_traders = (
+        select(func.count(func.distinct(Position.agent_id))).where(Position.market_id == market_id)
+    ).scalar_subquery()
+    total_fees = (
+        select(cast(func.coalesce(func.sum(PlatformFee.amount), 0), Float)).where(
+            PlatformFee.market_id == market_id
+        )
+    ).scalar_subquery()
+
+    summary_result, trades_result, positions_result = await execute_concurrently(
+        session,
+        select(
+            Market,
+            total_orders.label("total_orders"),
+            open_orders.label("open_orders"),
+            total_trades.label("total_trades"),
+            unique_traders.label("unique_traders"),
+            total_fees.label("total_fees_collected"),
+        )
+        .options(raiseload("*"))
+        .where(Market.id == market_id),
+        select(Trade)
+        .options(raiseload("*"))
+        .where(Trade.market_id == market_id)
+        .order_by(Trade.created_at.desc())
+        .limit(50),
+        select(Position.agent_id, Position.yes_shares, Position.no_shares).where(
+            Position.market_id == market_id
+        ),
     )
+    summary = summary_result.one_or_none()
+    if not summary:
+        raise HTTPException(status_code=404, detail="Market not found")
+    market = summary.Market
     trades = trades_result.scalars().all()
+    positions = positions_result.all()
 
-    # Get positions
-    positions_result = await session.execute(
-        select(Position).where(Position.market_id == market_id)
-    )
-    positions = positions_result.scalars().all()
-
-    # Get fees from this market
-    fees_result = await session.execute(
-        select(PlatformFee).where(PlatformFee.market_id == market_id)
+    return ORJSONResponse(
+        {
+            "market": {
+                "id": market.id,
+                "creator_id": market.creator_id,
+                "question": market.question,
+                "description": market.description,
+                "status": market.status,
+                "outcome": market.outcome,
+                "yes_price": market.yes_price,
+                "no_price": market.no_price,
+                "volume": market.volume,
+                "deadline": market.deadline,
+                "resolved_at": market.resolved_at,
+                "resolved_by": market.resolved_by,
+                "created_at": market.created_at,
+            },
+            "summary": {
+                "total_orders": summary.total_orders,
+                "open_orders": summary.open_orders,
+                "total_trades": summary.total_trades,
+                "unique_traders": summary.unique_traders,
+                "total_fees_collected": summary.total_fees_collected,
+            },
+            "trades": [
+                {
+                    "id": t.id,
+                    "buyer_id": t.buyer_id,
+                    "seller_id": t.seller_id,
+                    "price": t.price,
+                    "size": t.size,
+                    "total_fee": t.total_fee,
+                    "created_at": t.created_at,
+                }
+                for t in trades
+            ],
+            "positions": [
+                {"agent_id": p.agent_id, "yes_shares": p.yes_shares, "no_shares": p.no_shares}
+                for p in positions
+            ],
+        }
     )
-    fees = fees_result.scalars().all()
-
-    total_fees = sum(f.amount for f in fees)
-
-    return {
-        "market": {
-            "id": str(market.id),
-            "creator_id": str(market.creator_id),
-            "question": market.question,
-            "description": market.description,
-            "status": market.status.value,
-            "outcome": market.outcome.value if market.outcome else None,
-            "yes_price": float(market.yes_price),
-            "no_price": float(market.no_price),
-            "volume": float(market.volume),
-            "deadline": market.deadline.isoformat(),
-            "resolved_at": market.resolved_at.isoformat() if market.resolved_at else None,
-            "resolved_by": str(market.resolved_by) if market.resolved_by else None,
-            "created_at": market.created_at.isoformat(),
-        },
-        "summary": {
-            "total_orders": len(orders),
-            "open_orders": len(
-                [o for o in orders if o.status in [OrderStatus.OPEN, OrderStatus.PARTIAL]]
-            ),
-            "total_trades": len(trades),
-            "unique_traders": len({p.agent_id for p in positions}),
-            "total_fees_collected": float(total_fees),
-        },
-        "trades": [
-            {
-                "id": str(t.id),
-                "buyer_id": str(t.buyer_id),
-                "seller_id": str(t.seller_id),
-                "price": float(t.price),
-                "size": t.size,
-                "total_fee": float(t.total_fee),
-                "created_at": t.created_at.isoformat(),
-            }
-            for t in trades[:50]
-        ],
-        "positions": [
-            {"agent_id": str(p.agent_id), "yes_shares": p.yes_shares, "no_shares": p.no_shares}
-            for p in positions
-        ],
-    }
 
 
 # =============================================================================
@@ -461,44 +485,40 @@ async def get_market_details(
 # =============================================================================
 
 
-@router.get("/trades")
+@router.get("/trades", response_model=list[TradeAdminResponse])
 async def get_all_trades(
     market_id: UUID | None = Query(default=None),
     agent_id: UUID | None = Query(default=None),
     limit: int = Query(default=100, le=500),
     offset: int = Query(default=0),
+    cursor: str | None = Query(default=None, description="X-Next-Cursor of the previous page"),
     session: AsyncSession = Depends(get_session),
     _: bool = Depends(verify_admin_key),
 ):
-    """Get all trades with filtering."""
-    query = select(Trade)
+    """
+    Get all trades with filtering, newest first.
 
-    if market_id:
-        query = query.where(Trade.market_id == market_id)
+    Pass the previous page's X-Next-Cursor header as ``cursor`` to page by keyset
+    instead of ``offset``.
+    """
+    after = decode_cursor(cursor)
     if agent_id:
-        query = query.where((Trade.buyer_id == agent_id) | (Trade.seller_id == agent_id))
-
-    query = query.order_by(Trade.created_at.desc()).offset(offset).limit(limit)
+        query = agent_trades_query(
+            agent_id, limit, offset=0 if after else offset, market_id=market_id, after=after
+        )
+    else:
+        query = select(Trade)
+        if market_id:
+            query = query.where(Trade.market_id == market_id)
+        if after:
+            query = query.where(tuple_(Trade.created_at, Trade.id) < after)
+        else:
+            query = query.offset(offset)
+        query = query.order_by(Trade.created_at.desc(), Trade.id.desc()).limit(limit)
 
     result = await session.execute(query)
     trades = result.scalars().all()
-
-    return [
-        {
-            "id": str(t.id),
-            "market_id": str(t.market_id),
-            "buyer_id": str(t.buyer_id),
-            "seller_id": str(t.seller_id),
-            "side": t.side.value,
-            "price": float(t.price),
-            "size": t.size,
-            "buyer_fee": float(t.buyer_fee),
-            "seller_fee": float(t.seller_fee),
-            "total_fee": float(t.total_fee),
-            "created_at": t.created_at.isoformat(),
-        }
-        for t in trades
-    ]
+    return set_next_cursor(stream_json_array(TRADE_ROW, trades), trades, limit)
 
 
 # =============================================================================
@@ -522,5 +542,5 @@ async def admin_health_check(
         "status": "ok" if db_status == "healthy" else "degraded",
         "database": db_status,
         "environment": settings.ENVIRONMENT,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": naive_utc_now().isoformat(),
     }
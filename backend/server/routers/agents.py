@@ -1,19 +1,20 @@
 from decimal import Decimal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import case, func, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 from sqlmodel import select
 
-from server.database import get_session
+from server.database import execute_concurrently, get_session
 from server.middleware.auth import get_current_agent
 from server.models.agent import Agent, AgentRole
 from server.models.market import Market, MarketStatus, Outcome
 from server.models.order import Order
 from server.models.platform import PlatformFee
 from server.models.position import Position
-from server.models.trade import Trade
 from server.schemas.agent import (
     ActivePosition,
     AgentCreate,
@@ -26,24 +27,40 @@ from server.schemas.agent import (
     ProfileStats,
     RecentTrade,
 )
+from server.services.agents import insert_agent
+from server.services.matching import update_platform_stats
+from server.services.profile_cache import cache_profile, get_cached_profile
+from server.services.rankings import STARTING_BALANCE, live_rankings_query, rankings_query
+from server.services.trade_history import agent_trades_query
+from server.utils.json_response import model_response
 
 router = APIRouter(prefix="/agents", tags=["agents"])
 
+AGENT_RESPONSE = TypeAdapter(AgentResponse)
+AGENT_LIST_RESPONSE = TypeAdapter(list[AgentResponse])
+
 
 @router.post("", response_model=AgentResponse)
 async def register_agent(data: AgentCreate, session: AsyncSession = Depends(get_session)):
     """Register a new agent with starting balance of 1000."""
-    # Check if name already exists
-    result = await session.execute(select(Agent).where(Agent.name == data.name))
-    existing = result.scalar_one_or_none()
-    if existing:
-        raise HTTPException(status_code=400, detail="Agent name already exists")
-
     agent = Agent(name=data.name, role=data.role)
     session.add(agent)
+    await insert_agent(session, agent)
+    await update_platform_stats(
+        session,
+        agents_created=1,
+        traders_created=int(agent.role == AgentRole.TRADER),
+        moderators_created=int(agent.role == AgentRole.MODERATOR),
+    )
     await session.commit()
-    await session.refresh(agent)
-    return agent
+    return model_response(AGENT_RESPONSE, agent)
+
+
+@router.get("/moderators", response_model=list[AgentResponse])
+async def list_moderators(session: AsyncSession = Depends(get_session)):
+    """List all moderator agents who can resolve markets."""
+    result = await session.execute(select(Agent).where(Agent.role == AgentRole.MODERATOR))
+    return model_response(AGENT_LIST_RESPONSE, result.scalars().all())
 
 
 @router.get("/{agent_id}", response_model=AgentResponse)
@@ -53,7 +70,7 @@ async def get_agent(agent_id: UUID, session: AsyncSession = Depends(get_session)
     agent = result.scalar_one_or_none()
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
-    return agent
+    return model_response(AGENT_RESPONSE, agent)
 
 
 @router.get("", response_model=list[AgentResponse])
@@ -75,14 +92,7 @@ async def list_agents(
     query = query.order_by(order_column.desc()).limit(limit)
 
     result = await session.execute(query)
-    return result.scalars().all()
-
-
-@router.get("/moderators", response_model=list[AgentResponse])
-async def list_moderators(session: AsyncSession = Depends(get_session)):
-    """List all moderator agents who can resolve markets."""
-    result = await session.execute(select(Agent).where(Agent.role == AgentRole.MODERATOR))
-    return result.scalars().all()
+    return model_response(AGENT_LIST_RESPONSE, result.scalars().all())
 
 
 @router.patch("/{agent_id}/settings", response_model=AgentResponse)
@@ -136,94 +146,161 @@ async def get_agent_profile(agent_id: UUID, session: AsyncSession = Depends(get_
     """
     Get comprehensive agent profile with statistics, rankings, and activity.
     Public endpoint - no authentication required.
+    Served from the profile cache when one is configured.
     """
-    # Get agent
-    result = await session.execute(select(Agent).where(Agent.id == agent_id))
-    agent = result.scalar_one_or_none()
-    if not agent:
-        raise HTTPException(status_code=404, detail="Agent not found")
+    cached = await get_cached_profile(agent_id)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
+
+    # Trade aggregates (as buyer or seller)
+    agent_trades = agent_trades_query(agent_id).subquery()
+    trade_stats = select(
+        func.count().label("total_trades"),
+        func.coalesce(func.sum(agent_trades.c.price * agent_trades.c.size), 0).label(
+            "total_volume"
+        ),
+    ).subquery()
 
-    # Get trades (as buyer or seller)
-    trades_result = await session.execute(
-        select(Trade)
-        .where((Trade.buyer_id == agent_id) | (Trade.seller_id == agent_id))
-        .order_by(Trade.created_at.desc())
+    # Markets created (for traders) and resolved (for moderators)
+    markets_created_filter = Market.creator_id == agent_id
+    markets_resolved_filter = (Market.resolved_by == agent_id) & (
+        Market.status == MarketStatus.RESOLVED
     )
-    all_trades = trades_result.scalars().all()
 
-    # Get orders
-    orders_result = await session.execute(
-        select(Order).where(Order.agent_id == agent_id).order_by(Order.created_at.desc())
+    # Realized PnL per position in resolved markets: payout of 1.00 per winning share
+    # minus its average cost. Positions without winning shares yield NULL and are
+    # skipped by the aggregates.
+    realized_pnl = case(
+        (
+            (Market.outcome == Outcome.YES)
+            & (Position.yes_shares > 0)
+            & Position.avg_yes_price.is_not(None),
+            (1 - Position.avg_yes_price) * Position.yes_shares,
+        ),
+        (
+            (Market.outcome == Outcome.NO)
+            & (Position.no_shares > 0)
+            & Position.avg_no_price.is_not(None),
+            (1 - Position.avg_no_price) * Position.no_shares,
+        ),
     )
-    all_orders = orders_result.scalars().all()
-
-    # Get positions
-    positions_result = await session.execute(
-        select(Position, Market)
-        .join(Market, Position.market_id == Market.id)
+    pnl_stats = (
+        select(
+            func.coalesce(func.sum(realized_pnl), 0).label("total_pnl"),
+            func.count().filter(realized_pnl > 0).label("profitable_trades"),
+            func.max(realized_pnl).label("best_pnl"),
+            func.min(realized_pnl).label("worst_pnl"),
+        )
+        .select_from(Position)
+        .join(Market, Market.id == Position.market_id)
         .where(Position.agent_id == agent_id)
+        .where(Market.status == MarketStatus.RESOLVED)
+    ).subquery()
+
+    # The agent row with every count and sum, in one statement and one snapshot.
+    # The aggregate subqueries always return a single row, so they cross join.
+    summary_result = await session.execute(
+        select(
+            Agent,
+            trade_stats.c.total_trades,
+            trade_stats.c.total_volume,
+            pnl_stats.c.total_pnl,
+            pnl_stats.c.profitable_trades,
+            pnl_stats.c.best_pnl,
+            pnl_stats.c.worst_pnl,
+            select(func.count())
+            .select_from(Order)
+            .where(Order.agent_id == agent_id)
+            .scalar_subquery()
+            .label("total_orders"),
+            select(func.count())
+            .select_from(Market)
+            .where(markets_created_filter)
+            .scalar_subquery()
+            .label("markets_created"),
+            select(func.count())
+            .select_from(Market)
+            .where(markets_resolved_filter)
+            .scalar_subquery()
+            .label("markets_resolved"),
+            select(func.coalesce(func.sum(PlatformFee.amount), 0))
+            .where(PlatformFee.agent_id == agent_id)
+            .scalar_subquery()
+            .label("total_fees_paid"),
+        )
+        .options(raiseload("*"))
+        .select_from(Agent)
+        .join(trade_stats, true())
+        .join(pnl_stats, true())
+        .where(Agent.id == agent_id)
     )
-    positions_data = positions_result.all()
+    summary = summary_result.one_or_none()
+    if not summary:
+        raise HTTPException(status_code=404, detail="Agent not found")
+    # End the read so this session's connection is free during the fan-out below
+    await session.commit()
 
-    # Get markets created (for traders)
-    markets_created_result = await session.execute(
-        select(Market).where(Market.creator_id == agent_id).order_by(Market.created_at.desc())
+    agent = summary.Agent
+    total_trades = summary.total_trades
+    total_orders = summary.total_orders
+    markets_created = summary.markets_created
+    markets_resolved = summary.markets_resolved
+    total_fees_paid = float(summary.total_fees_paid)
+    profitable_trades = summary.profitable_trades
+
+    # Only the list reads fan out, and lists the counts show are empty are skipped.
+    # Entity queries use raiseload("*") so an unplanned relationship access fails
+    # instead of lazy loading.
+    list_queries = {
+        "positions": select(Position)
+        .options(selectinload(Position.market), raiseload("*"))
+        .where(Position.agent_id == agent_id),
+    }
+    if total_trades:
+        list_queries["recent_trades"] = agent_trades_query(agent_id, limit=20).options(
+            raiseload("*")
+        )
+    if markets_created:
+        list_queries["markets_created"] = (
+            select(Market)
+            .options(raiseload("*"))
+            .where(markets_created_filter)
+            .order_by(Market.created_at.desc())
+            .limit(20)
+        )
+    if markets_resolved:
+        list_queries["markets_resolved"] = (
+            select(Market)
+            .options(raiseload("*"))
+            .where(markets_resolved_filter)
+            .order_by(Market.resolved_at.desc())
+            .limit(20)
+        )
+    list_results = dict(
+        zip(
+            list_queries,
+            await execute_concurrently(session, *list_queries.values()),
+            strict=True,
+        )
     )
-    markets_created_list = markets_created_result.scalars().all()
 
-    # Get markets resolved (for moderators)
-    markets_resolved_result = await session.execute(
-        select(Market)
-        .where(Market.resolved_by == agent_id)
-        .where(Market.status == MarketStatus.RESOLVED)
-        .order_by(Market.resolved_at.desc())
-    )
-    markets_resolved_list = markets_resolved_result.scalars().all()
+    def list_rows(name: str) -> list:
+        return list_results[name].scalars().all() if name in list_results else []
+
+    positions = list_rows("positions")
+    recent_trade_rows = list_rows("recent_trades")
+    markets_created_list = list_rows("markets_created")
+    markets_resolved_list = list_rows("markets_resolved")
 
-    # Get fees paid
-    fees_result = await session.execute(select(PlatformFee).where(PlatformFee.agent_id == agent_id))
-    fees = fees_result.scalars().all()
+    rankings = (await session.execute(rankings_query(session, agent_id))).one_or_none()
+    if rankings is None:
+        # Registered since the rankings view was last refreshed
+        rankings_result = await session.execute(live_rankings_query(agent_id))
+        rankings = rankings_result.one()
 
     # Calculate statistics
-    total_trades = len(all_trades)
-    total_orders = len(all_orders)
-    total_positions = len(positions_data)
-    markets_created = len(markets_created_list)
-    markets_resolved = len(markets_resolved_list)
-
-    # Calculate total volume traded
-    total_volume_traded = sum(float(trade.price * trade.size) for trade in all_trades)
-
-    # Calculate total fees paid
-    total_fees_paid = sum(float(fee.amount) for fee in fees)
-
-    # Calculate PnL from resolved markets
-    total_pnl = Decimal("0.00")
-    profitable_trades = 0
-    trade_pnls = []
-    STARTING_BALANCE = Decimal("1000.00")
-
-    # Calculate realized PnL from resolved markets
-    for position, market in positions_data:
-        if market.status == MarketStatus.RESOLVED and market.outcome:
-            if market.outcome == Outcome.YES and position.yes_shares > 0:
-                if position.avg_yes_price:
-                    cost = position.avg_yes_price * position.yes_shares
-                    payout = Decimal("1.00") * position.yes_shares
-                    pnl = payout - cost
-                    total_pnl += pnl
-                    trade_pnls.append(float(pnl))
-                    if pnl > 0:
-                        profitable_trades += 1
-            elif market.outcome == Outcome.NO and position.no_shares > 0:
-                if position.avg_no_price:
-                    cost = position.avg_no_price * position.no_shares
-                    payout = Decimal("1.00") * position.no_shares
-                    pnl = payout - cost
-                    total_pnl += pnl
-                    trade_pnls.append(float(pnl))
-                    if pnl > 0:
-                        profitable_trades += 1
+    total_positions = len(positions)
+    total_volume_traded = float(summary.total_volume)
 
     # Calculate win rate
     win_rate = (profitable_trades / total_trades * 100) if total_trades > 0 else 0.0
@@ -239,77 +316,25 @@ async def get_agent_profile(agent_id: UUID, session: AsyncSession = Depends(get_
     avg_trade_size = (total_volume_traded / total_trades) if total_trades > 0 else 0.0
 
     # Best and worst trades
-    best_trade = max(trade_pnls) if trade_pnls else None
-    worst_trade = min(trade_pnls) if trade_pnls else None
-
-    # Calculate rankings
-    # Get all agents for ranking calculations
-    all_agents_result = await session.execute(select(Agent))
-    all_agents = all_agents_result.scalars().all()
-
-    # Calculate rankings
-    rank_by_profit = None
-    rank_by_balance = None
-    rank_by_reputation = None
-    rank_by_volume = None
-
-    # Rank by profit (balance - starting balance)
-    agents_by_profit = sorted(
-        all_agents, key=lambda a: float(a.balance - STARTING_BALANCE), reverse=True
-    )
-    for idx, a in enumerate(agents_by_profit, 1):
-        if a.id == agent_id:
-            rank_by_profit = idx
-            break
-
-    # Rank by balance
-    agents_by_balance = sorted(all_agents, key=lambda a: float(a.balance), reverse=True)
-    for idx, a in enumerate(agents_by_balance, 1):
-        if a.id == agent_id:
-            rank_by_balance = idx
-            break
-
-    # Rank by reputation
-    agents_by_reputation = sorted(all_agents, key=lambda a: float(a.reputation), reverse=True)
-    for idx, a in enumerate(agents_by_reputation, 1):
-        if a.id == agent_id:
-            rank_by_reputation = idx
-            break
-
-    # Rank by volume (need to calculate for all agents)
-    agent_volumes = {}
-    for a in all_agents:
-        agent_trades_result = await session.execute(
-            select(func.sum(Trade.price * Trade.size)).where(
-                (Trade.buyer_id == a.id) | (Trade.seller_id == a.id)
-            )
-        )
-        volume = agent_trades_result.scalar() or Decimal("0.00")
-        agent_volumes[a.id] = float(volume)
+    best_trade = float(summary.best_pnl) if summary.best_pnl is not None else None
+    worst_trade = float(summary.worst_pnl) if summary.worst_pnl is not None else None
 
-    agents_by_volume = sorted(all_agents, key=lambda a: agent_volumes.get(a.id, 0.0), reverse=True)
-    for idx, a in enumerate(agents_by_volume, 1):
-        if a.id == agent_id:
-            rank_by_volume = idx
-            break
+    # Build recent trades (last 20), batch-loading their markets
+    recent_market_ids = {trade.market_id for trade in recent_trade_rows}
+    recent_markets_result = await session.execute(
+        select(Market).options(raiseload("*")).where(Market.id.in_(recent_market_ids))
+    )
+    recent_markets = {m.id: m for m in recent_markets_result.scalars()}
+    positions_by_market = {p.market_id: p for p in positions}
 
-    # Build recent trades (last 20)
     recent_trades = []
-    for trade in all_trades[:20]:
-        # Get market info
-        market_result = await session.execute(select(Market).where(Market.id == trade.market_id))
-        market = market_result.scalar_one_or_none()
+    for trade in recent_trade_rows:
+        market = recent_markets.get(trade.market_id)
 
         # Calculate PnL if market is resolved
         pnl = None
         if market and market.status == MarketStatus.RESOLVED:
-            # Get position for this trade
-            pos_result = await session.execute(
-                select(Position)
-                .where(Position.agent_id == agent_id)
-                .where(Position.market_id == trade.market_id)
-            )
-            position = pos_result.scalar_one_or_none()
+            position = positions_by_market.get(trade.market_id)
             if position:
                 if market.outcome == Outcome.YES and position.yes_shares > 0:
                     if position.avg_yes_price:
@@ -338,7 +363,8 @@ async def get_agent_profile(agent_id: UUID, session: AsyncSession = Depends(get_
 
     # Build active positions (only open markets)
     active_positions = []
-    for position, market in positions_data:
+    for position in positions:
+        market = position.market
         if market.status == MarketStatus.OPEN:
             # Calculate unrealized PnL based on current market prices
             unrealized_pnl = None
@@ -373,33 +399,24 @@ async def get_agent_profile(agent_id: UUID, session: AsyncSession = Depends(get_
             volume=float(m.volume),
             created_at=m.created_at.isoformat(),
         )
-        for m in markets_created_list[:20]  # Limit to 20
+        for m in markets_created_list
     ]
 
-    # Build markets resolved (with rewards)
-    markets_resolved_data = []
-    for market in markets_resolved_list[:20]:  # Limit to 20
-        # Get moderator reward if exists
-        reward_result = await session.execute(
-            select(PlatformFee)
-            .where(PlatformFee.market_id == market.id)
-            .where(PlatformFee.agent_id == agent_id)
-        )
-        # Note: Moderator rewards are stored differently, this is simplified
-        reward = 0.0  # Would need to query ModeratorReward table
-
-        markets_resolved_data.append(
-            MarketResolved(
-                id=str(market.id),
-                question=market.question,
-                outcome=market.outcome.value if market.outcome else "UNKNOWN",
-                reward=reward,
-                resolved_at=market.resolved_at.isoformat() if market.resolved_at else "",
-            )
+    # Build markets resolved. Moderator rewards aren't recorded per market yet,
+    # so the reward is reported as 0.
+    markets_resolved_data = [
+        MarketResolved(
+            id=str(market.id),
+            question=market.question,
+            outcome=market.outcome.value if market.outcome else "UNKNOWN",
+            reward=0.0,
+            resolved_at=market.resolved_at.isoformat() if market.resolved_at else "",
         )
+        for market in markets_resolved_list
+    ]
 
     # Build response
-    return AgentProfileResponse(
+    profile = AgentProfileResponse(
         agent=AgentResponse.model_validate(agent),
         stats=ProfileStats(
             total_trades=total_trades,
@@ -410,20 +427,23 @@ async def get_agent_profile(agent_id: UUID, session: AsyncSession = Depends(get_
             total_volume_traded=total_volume_traded,
             total_fees_paid=total_fees_paid,
             win_rate=win_rate,
-            total_pnl=float(total_pnl),
+            total_pnl=float(summary.total_pnl),
             pnl_percentage=float(pnl_percentage),
             avg_trade_size=avg_trade_size,
             best_trade=best_trade,
             worst_trade=worst_trade,
         ),
         rankings=ProfileRankings(
-            rank_by_profit=rank_by_profit,
-            rank_by_balance=rank_by_balance,
-            rank_by_reputation=rank_by_reputation,
-            rank_by_volume=rank_by_volume,
+            rank_by_profit=rankings.rank_by_profit,
+            rank_by_balance=rankings.rank_by_balance,
+            rank_by_reputation=rankings.rank_by_reputation,
+            rank_by_volume=rankings.rank_by_volume,
         ),
         recent_trades=recent_trades,
         active_positions=active_positions,
         markets_created=markets_created_data,
         markets_resolved=markets_resolved_data,
     )
+    content = profile.model_dump_json()
+    await cache_profile(agent_id, content)
+    return Response(content, media_type="application/json")
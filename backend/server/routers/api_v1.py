@@ -5,36 +5,62 @@ All endpoints require Bearer token authentication except registration.
 Rate limits: 50 req/min general, 10 orders/min, 1 market/hour
 """
 
-from datetime import UTC, datetime
+from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+from sqlalchemy import tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from server.config import settings
 from server.database import get_session
 from server.middleware.auth import (
-    check_rate_limit,
+    AgentAuth,
+    find_agent_by_api_key,
     get_api_key,
     get_current_agent,
     get_current_moderator,
     get_current_trader,
+    invalidate_agent_auth,
 )
-from server.models.agent import Agent, AgentRole
+from server.models.agent import Agent, AgentRole, TradingMode
 from server.models.market import Market, MarketCategory, MarketStatus, Outcome
-from server.models.order import Order, Side
+from server.models.market_resolution import MarketResolution
+from server.models.order import Order, OrderStatus, Side
 from server.models.position import Position
-from server.services.matching import match_order, update_market_price, update_platform_stats
-from server.services.settlement import resolve_market
+from server.models.types import as_utc, utc_now
+from server.services.agents import insert_agent
+from server.services.market_cache import (
+    cacheable_json_response,
+    content_etag,
+    get_market_snapshot,
+    market_list_cache,
+)
+from server.services.matching import (
+    charge_fee,
+    lock_balance_for_order,
+    match_order,
+    update_platform_stats,
+)
+from server.services.order_book_cache import invalidate_order_books
+from server.services.order_matching import notify_matching_worker
+from server.services.profile_cache import invalidate_profiles
+from server.services.rate_limit import rate_limit
+from server.services.resolutions import enqueue_resolution, notify_resolution_worker
+from server.services.verification import publish_verified, wait_for_verification
 from server.utils.api_key import (
+    api_key_prefix,
     generate_api_key,
     generate_claim_token,
-    hash_api_key,
     validate_api_key_format,
 )
+from server.utils.json_response import constructed_response, model_builder, stream_json_array
+from server.utils.pagination import NEXT_CURSOR_HEADER, decode_cursor, next_cursor
 
 router = APIRouter(prefix="/api/v1", tags=["API v1"])
 
@@ -82,7 +108,7 @@ class AgentInfoResponse(BaseModel):
     id: UUID
     name: str
     role: str
-    trading_mode: str  # "manual" or "auto"
+    trading_mode: TradingMode
     balance: float
     locked_balance: float
     available_balance: float
@@ -92,6 +118,10 @@ class AgentInfoResponse(BaseModel):
     can_resolve: bool
 
 
+# Response builders skip validation, so only pass trusted values of the field types
+build_agent_info_response = model_builder(AgentInfoResponse)
+
+
 class MarketCreateRequest(BaseModel):
     """Request to create a new market."""
 
@@ -100,6 +130,12 @@ class MarketCreateRequest(BaseModel):
     category: MarketCategory = Field(default=MarketCategory.TECH)
     deadline: datetime
 
+    @field_validator("deadline")
+    @classmethod
+    def deadline_as_utc(cls, value: datetime) -> datetime:
+        """Treat naive deadlines as UTC."""
+        return as_utc(value)
+
 
 class MarketResponse(BaseModel):
     """Market information response."""
@@ -118,17 +154,25 @@ class MarketResponse(BaseModel):
     created_at: datetime
 
 
+build_market_response = model_builder(MarketResponse)
+
+
 class BetRequest(BaseModel):
     """Request to place a bet (order)."""
 
     side: Side  # YES or NO
     amount: int = Field(..., gt=0, description="Number of shares to buy")
-    price: float | None = Field(
+    # Parsed straight from the JSON number, so no float round-trip is needed
+    price: Decimal | None = Field(
         None,
-        ge=0.01,
-        le=0.99,
+        ge=Decimal("0.01"),
+        le=Decimal("0.99"),
         description="Limit price (0.01-0.99). If not provided, uses market price.",
     )
+    execute: Literal["sync", "async"] = Field(
+        "sync",
+        description="sync matches before responding; async queues the order for matching.",
+    )
 
 
 class BetResponse(BaseModel):
@@ -145,6 +189,25 @@ class BetResponse(BaseModel):
     trades_executed: int
 
 
+build_bet_response = model_builder(BetResponse)
+
+
+class OrderStatusResponse(BaseModel):
+    """An order's fill status."""
+
+    order_id: UUID
+    market_id: UUID
+    side: str
+    price: float
+    size: int
+    filled: int
+    status: str  # pending until an async bet has been matched
+    created_at: datetime
+
+
+build_order_status_response = model_builder(OrderStatusResponse)
+
+
 class PositionResponse(BaseModel):
     """Position information response."""
 
@@ -157,6 +220,10 @@ class PositionResponse(BaseModel):
     market_status: str
 
 
+POSITION_RESPONSE = TypeAdapter(PositionResponse)
+build_position_response = model_builder(PositionResponse)
+
+
 class ResolveRequest(BaseModel):
     """Request to resolve a market."""
 
@@ -164,6 +231,36 @@ class ResolveRequest(BaseModel):
     evidence: str | None = Field(None, max_length=2000)
 
 
+class ResolutionResponse(BaseModel):
+    """A queued market resolution and, once settled, its summary."""
+
+    resolution_id: UUID
+    market_id: UUID
+    outcome: str
+    status: str  # pending, completed or failed
+    created_at: datetime
+    completed_at: datetime | None
+    result: dict | None  # Settlement summary when completed
+    error: str | None  # Why settlement failed
+
+
+build_resolution_response = model_builder(ResolutionResponse)
+
+
+def _resolution_to_response(resolution: MarketResolution) -> ResolutionResponse:
+    """Build a ResolutionResponse from a queued resolution without re-validating it."""
+    return build_resolution_response(
+        resolution_id=resolution.id,
+        market_id=resolution.market_id,
+        outcome=resolution.outcome.value,
+        status=resolution.status.value,
+        created_at=resolution.created_at,
+        completed_at=resolution.completed_at,
+        result=resolution.result_data,
+        error=resolution.error,
+    )
+
+
 # ============== Agent Endpoints ==============
 
 
@@ -175,11 +272,6 @@ async def register_agent(data: AgentRegisterRequest, session: AsyncSession = Dep
     Returns an API key (shown only once!) and a claim URL for verification.
     The API key is inactive until verification is complete.
     """
-    # Check if name exists
-    result = await session.execute(select(Agent).where(Agent.name == data.name))
-    if result.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Agent name already exists")
-
     # Generate API key and claim token
     api_key, api_key_hash = generate_api_key()
     claim_token = generate_claim_token()
@@ -189,13 +281,20 @@ async def register_agent(data: AgentRegisterRequest, session: AsyncSession = Dep
         name=data.name,
         role=data.role,
         api_key_hash=api_key_hash,
-        api_key_created_at=datetime.utcnow(),
+        api_key_prefix=api_key_prefix(api_key_hash),
+        api_key_created_at=utc_now(),
         claim_token=claim_token,
         is_verified=False,
     )
     session.add(agent)
+    await insert_agent(session, agent)
+    await update_platform_stats(
+        session,
+        agents_created=1,
+        traders_created=int(agent.role == AgentRole.TRADER),
+        moderators_created=int(agent.role == AgentRole.MODERATOR),
+    )
     await session.commit()
-    await session.refresh(agent)
 
     # Build claim URL using frontend URL from environment
     claim_url = f"{settings.FRONTEND_URL}/claim/{claim_token}"
@@ -218,45 +317,47 @@ async def verify_agent(data: AgentVerifyRequest, session: AsyncSession = Depends
     For now, verification is automatic when the claim token is provided.
     In production, this could verify an X post or other proof of ownership.
     """
-    # Find agent by claim token
-    result = await session.execute(select(Agent).where(Agent.claim_token == data.claim_token))
-    agent = result.scalar_one_or_none()
-
-    if not agent:
-        raise HTTPException(status_code=404, detail="Invalid claim token")
-
-    if agent.is_verified:
-        return AgentVerifyResponse(
-            verified=True, agent_id=agent.id, message="Agent already verified."
-        )
-
-    # Verify the agent
-    agent.is_verified = True
-    agent.verified_at = datetime.utcnow()
+    # Claim tokens are cleared on verification, so a token only ever matches an
+    # unverified agent; verify it in one UPDATE on the unique claim_token index
+    values = {"is_verified": True, "verified_at": utc_now(), "claim_token": None}
     if data.x_handle:
-        agent.x_handle = data.x_handle
+        values["x_handle"] = data.x_handle
+    result = await session.execute(
+        update(Agent)
+        .where(Agent.claim_token == data.claim_token)
+        .values(values)
+        .returning(Agent.id),
+        execution_options={"synchronize_session": "fetch"},
+    )
+    agent_id = result.scalar_one_or_none()
 
-    # Clear claim token after verification
-    agent.claim_token = None
+    if agent_id is None:
+        raise HTTPException(status_code=404, detail="Invalid claim token")
 
     await session.commit()
+    invalidate_agent_auth(agent_id)
+    await publish_verified(agent_id)
 
     return AgentVerifyResponse(
         verified=True,
-        agent_id=agent.id,
+        agent_id=agent_id,
         message="Agent verified successfully! Your API key is now active.",
     )
 
 
 @router.get("/agents/status", response_model=dict)
 async def get_agent_status(
-    api_key: str | None = Depends(get_api_key), session: AsyncSession = Depends(get_session)
+    wait: int = Query(0, ge=0, le=25, description="Seconds to wait for verification"),
+    api_key: str | None = Depends(get_api_key),
+    session: AsyncSession = Depends(get_session),
 ):
     """
     Check agent verification status (for polling during registration).
 
     Agents can poll this endpoint to check if their account has been verified.
-    Returns status without requiring full authentication.
+    Returns status without requiring full authentication. With ``wait``, a
+    pending agent's request is held until verification or the timeout, so one
+    long poll replaces many short ones.
     """
     if not api_key:
         raise HTTPException(
@@ -272,16 +373,19 @@ async def get_agent_status(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Hash the provided key and look it up
-    key_hash = hash_api_key(api_key)
-    result = await session.execute(select(Agent).where(Agent.api_key_hash == key_hash))
-    agent = result.scalar_one_or_none()
+    agent = await find_agent_by_api_key(session, api_key)
 
     if not agent:
         raise HTTPException(
             status_code=401, detail="Invalid API key.", headers={"WWW-Authenticate": "Bearer"}
         )
 
+    if wait and not agent.is_verified:
+        # End the read transaction so no connection is held while waiting
+        await session.commit()
+        await wait_for_verification(agent.id, wait)
+        await session.refresh(agent)
+
     return {
         "agent_id": str(agent.id),
         "name": agent.name,
@@ -297,28 +401,25 @@ async def get_agent_status(
 
 @router.get("/agents/me", response_model=AgentInfoResponse)
 async def get_current_agent_info(
-    agent: Agent = Depends(get_current_agent), session: AsyncSession = Depends(get_session)
+    agent: Agent = Depends(rate_limit("general", get_current_agent)),
+    session: AsyncSession = Depends(get_session),
 ):
     """Get information about the authenticated agent."""
-    await check_rate_limit(agent, session, "general")
-
-    # Handle trading_mode - it can be an enum or a string from the database
-    trading_mode_value = agent.trading_mode
-    if hasattr(trading_mode_value, "value"):
-        trading_mode_value = trading_mode_value.value
-
-    return AgentInfoResponse(
-        id=agent.id,
-        name=agent.name,
-        role=agent.role.value,
-        trading_mode=trading_mode_value,
-        balance=float(agent.balance),
-        locked_balance=float(agent.locked_balance),
-        available_balance=float(agent.available_balance),
-        reputation=float(agent.reputation),
-        is_verified=agent.is_verified,
-        can_trade=agent.can_trade,
-        can_resolve=agent.can_resolve,
+    # Trusted DB values already of the response types, so skip construction validation
+    return constructed_response(
+        build_agent_info_response(
+            id=agent.id,
+            name=agent.name,
+            role=agent.role.value,
+            trading_mode=agent.trading_mode,
+            balance=float(agent.balance),
+            locked_balance=float(agent.locked_balance),
+            available_balance=float(agent.available_balance),
+            reputation=float(agent.reputation),
+            is_verified=agent.is_verified,
+            can_trade=agent.can_trade,
+            can_resolve=agent.can_resolve,
+        )
     )
 
 
@@ -333,15 +434,14 @@ class ApiKeyInfoResponse(BaseModel):
 
 @router.get("/agents/me/api-key", response_model=ApiKeyInfoResponse)
 async def get_api_key_info(
-    agent: Agent = Depends(get_current_agent), session: AsyncSession = Depends(get_session)
+    agent: Agent = Depends(rate_limit("general", get_current_agent)),
+    session: AsyncSession = Depends(get_session),
 ):
     """
     Get API key metadata (never returns the plain key for security).
 
     Returns information about when the key was created, last used, and if it's revoked.
     """
-    await check_rate_limit(agent, session, "general")
-
     return ApiKeyInfoResponse(
         created_at=agent.api_key_created_at,
         last_used_at=agent.api_key_last_used_at,
@@ -360,7 +460,8 @@ class RegenerateApiKeyResponse(BaseModel):
 
 @router.post("/agents/me/regenerate-api-key", response_model=RegenerateApiKeyResponse)
 async def regenerate_api_key(
-    agent: Agent = Depends(get_current_agent), session: AsyncSession = Depends(get_session)
+    agent: Agent = Depends(rate_limit("general", get_current_agent)),
+    session: AsyncSession = Depends(get_session),
 ):
     """
     Regenerate API key for the authenticated agent.
@@ -372,8 +473,6 @@ async def regenerate_api_key(
 
     The old key will immediately stop working.
     """
-    await check_rate_limit(agent, session, "general")
-
     # Generate new API key first
     api_key, api_key_hash = generate_api_key()
 
@@ -382,11 +481,13 @@ async def regenerate_api_key(
 
     # Set new key first, then revoke old one
     agent.api_key_hash = api_key_hash
-    agent.api_key_created_at = datetime.utcnow()
+    agent.api_key_prefix = api_key_prefix(api_key_hash)
+    agent.api_key_created_at = utc_now()
     agent.api_key_last_used_at = None  # Reset last used
     # Note: We don't set revoked_at here - the old key hash is replaced, so it's effectively revoked
 
     await session.commit()
+    invalidate_agent_auth(agent.id)
     await session.refresh(agent)
 
     return RegenerateApiKeyResponse(
@@ -405,78 +506,164 @@ async def list_markets(
     category: MarketCategory | None = Query(None),
     limit: int = Query(50, le=100),
     offset: int = Query(0),
-    agent: Agent = Depends(get_current_agent),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    if_none_match: str | None = Header(None),
+    agent: AgentAuth = Depends(rate_limit("general")),
     session: AsyncSession = Depends(get_session),
 ):
-    """List available markets with optional filters."""
-    await check_rate_limit(agent, session, "general")
+    """
+    List available markets with optional filters, newest first.
 
-    query = select(Market)
+    Pass the previous page's X-Next-Cursor header as ``cursor`` to page by keyset
+    instead of ``offset``, which keeps deep pages as cheap as the first.
+
+    Pages are cached in process for MARKET_LIST_CACHE_TTL seconds and carry an
+    ETag, so repeated polls can be answered with 304 Not Modified.
+    """
+    after = decode_cursor(cursor)
+    cache_key = (status, category, limit, offset, after)
+    page = market_list_cache.get(cache_key)
+    if page is None:
+        page = market_list_cache.put(
+            cache_key,
+            *await render_market_list(session, status, category, limit, offset, after=after),
+        )
+    response = cacheable_json_response(page.content, page.etag, if_none_match)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
+
+
+# Market columns read for responses. They are selected as plain rows, which
+# skips ORM instance construction and the identity map on these read paths.
+MARKET_COLUMNS = (
+    Market.id,
+    Market.creator_id,
+    Market.question,
+    Market.category,
+    Market.status,
+    Market.outcome,
+    Market.yes_price,
+    Market.no_price,
+    Market.volume,
+    Market.deadline,
+    Market.created_at,
+)
+
+
+def _market_to_response(m, description: str | None = None) -> MarketResponse:
+    """
+    Build a MarketResponse without re-validating it.
+
+    ``m`` is a Market or a MARKET_COLUMNS row; its values already have the
+    response types. The str enums are passed as-is rather than unpacked with
+    ``.value``, since pydantic-core writes a str subclass as its string value.
+    """
+    return build_market_response(
+        id=m.id,
+        creator_id=m.creator_id,
+        question=m.question,
+        description=description,
+        category=m.category,
+        status=m.status,
+        outcome=m.outcome,
+        yes_price=float(m.yes_price),
+        no_price=float(m.no_price),
+        volume=float(m.volume),
+        deadline=m.deadline,
+        created_at=m.created_at,
+    )
+
+
+def _position_to_response(row) -> PositionResponse:
+    """Build a PositionResponse from a positions row without re-validating it."""
+    return build_position_response(
+        market_id=row.market_id,
+        question=row.question,
+        yes_shares=row.yes_shares,
+        no_shares=row.no_shares,
+        avg_yes_price=float(row.avg_yes_price) if row.avg_yes_price else None,
+        avg_no_price=float(row.avg_no_price) if row.avg_no_price else None,
+        market_status=row.market_status,
+    )
+
+
+async def render_market_list(
+    session: AsyncSession,
+    status: MarketStatus | None,
+    category: MarketCategory | None,
+    limit: int,
+    offset: int,
+    *,
+    after: tuple[datetime, UUID] | None = None,
+) -> tuple[bytes, str | None]:
+    """Query and render a page of the v1 market list, with its next-page cursor."""
+    # The list omits descriptions, so they are not loaded
+    query = select(*MARKET_COLUMNS)
 
     if status:
         query = query.where(Market.status == status)
     if category:
         query = query.where(Market.category == category)
 
-    query = query.order_by(Market.created_at.desc()).offset(offset).limit(limit)
+    if after:
+        query = query.where(tuple_(Market.created_at, Market.id) < after)
+    else:
+        query = query.offset(offset)
+
+    query = query.order_by(Market.created_at.desc(), Market.id.desc()).limit(limit)
 
     result = await session.execute(query)
-    markets = result.scalars().all()
-
-    return [
-        MarketResponse(
-            id=m.id,
-            creator_id=m.creator_id,
-            question=m.question,
-            description=m.description,
-            category=m.category.value,
-            status=m.status.value,
-            outcome=m.outcome.value if m.outcome else None,
-            yes_price=float(m.yes_price),
-            no_price=float(m.no_price),
-            volume=float(m.volume),
-            deadline=m.deadline,
-            created_at=m.created_at,
-        )
-        for m in markets
-    ]
+    rows = result.all()
+    # Plain dicts in MarketResponse field order, rendered by orjson in one call.
+    # Enums and UUIDs serialize natively, and OPT_UTC_Z writes UTC datetimes the
+    # way pydantic does, so the body matches MarketResponse.
+    return orjson.dumps(
+        [
+            {
+                "id": row.id,
+                "creator_id": row.creator_id,
+                "question": row.question,
+                "description": None,
+                "category": row.category,
+                "status": row.status,
+                "outcome": row.outcome,
+                "yes_price": float(row.yes_price),
+                "no_price": float(row.no_price),
+                "volume": float(row.volume),
+                "deadline": row.deadline,
+                "created_at": row.created_at,
+            }
+            for row in rows
+        ],
+        option=orjson.OPT_UTC_Z,
+    ), next_cursor(rows, limit)
 
 
 @router.get("/markets/{market_id}", response_model=MarketResponse)
 async def get_market(
     market_id: UUID,
-    agent: Agent = Depends(get_current_agent),
+    if_none_match: str | None = Header(None),
+    agent: AgentAuth = Depends(rate_limit("general")),
     session: AsyncSession = Depends(get_session),
 ):
-    """Get details of a specific market."""
-    await check_rate_limit(agent, session, "general")
-
-    result = await session.execute(select(Market).where(Market.id == market_id))
-    market = result.scalar_one_or_none()
+    """Get details of a specific market (with an ETag for conditional requests)."""
+    result = await session.execute(
+        select(*MARKET_COLUMNS, Market.description).where(Market.id == market_id)
+    )
+    row = result.first()
 
-    if not market:
+    if not row:
         raise HTTPException(status_code=404, detail="Market not found")
 
-    return MarketResponse(
-        id=market.id,
-        creator_id=market.creator_id,
-        question=market.question,
-        description=market.description,
-        category=market.category.value,
-        status=market.status.value,
-        outcome=market.outcome.value if market.outcome else None,
-        yes_price=float(market.yes_price),
-        no_price=float(market.no_price),
-        volume=float(market.volume),
-        deadline=market.deadline,
-        created_at=market.created_at,
-    )
+    content = _market_to_response(row, row.description).model_dump_json().encode()
+    return cacheable_json_response(content, content_etag(content), if_none_match)
 
 
 @router.post("/markets", response_model=MarketResponse)
 async def create_market(
     data: MarketCreateRequest,
-    agent: Agent = Depends(get_current_trader),
+    agent: AgentAuth = Depends(rate_limit("market", get_current_trader)),
     session: AsyncSession = Depends(get_session),
 ):
     """
@@ -485,31 +672,17 @@ async def create_market(
     Rate limit: 1 market per hour.
     Cost: Market creation fee (default 10 tokens).
     """
-    await check_rate_limit(agent, session, "market")
-
-    # Validate deadline
-    # Normalize deadline to UTC-aware datetime for comparison
-    if data.deadline.tzinfo is None:
-        # If deadline is naive, assume it's UTC
-        deadline_utc = data.deadline.replace(tzinfo=UTC)
-    else:
-        # If deadline is aware, convert to UTC
-        deadline_utc = data.deadline.astimezone(UTC)
-
-    now_utc = datetime.now(UTC)
-    if deadline_utc <= now_utc:
+    # Validate deadline (already aware UTC)
+    if data.deadline <= utc_now():
         raise HTTPException(status_code=400, detail="Deadline must be in the future")
 
-    # Check balance for creation fee
+    # Deduct the creation fee if the balance covers it
     creation_fee = settings.MARKET_CREATION_FEE
-    if agent.available_balance < creation_fee:
+    if not await charge_fee(session, agent.id, creation_fee):
         raise HTTPException(
             status_code=400, detail=f"Insufficient balance for creation fee ({creation_fee} tokens)"
         )
 
-    # Deduct fee
-    agent.balance -= creation_fee
-
     # Create market
     market = Market(
         creator_id=agent.id,
@@ -521,25 +694,14 @@ async def create_market(
     session.add(market)
 
     # Update platform stats
-    await update_platform_stats(session, market_creation_fee=creation_fee, markets_created=1)
+    await update_platform_stats(
+        session, market_creation_fee=creation_fee, markets_created=1, open_markets=1
+    )
 
     await session.commit()
-    await session.refresh(market)
-
-    return MarketResponse(
-        id=market.id,
-        creator_id=market.creator_id,
-        question=market.question,
-        description=market.description,
-        category=market.category.value,
-        status=market.status.value,
-        outcome=None,
-        yes_price=float(market.yes_price),
-        no_price=float(market.no_price),
-        volume=float(market.volume),
-        deadline=market.deadline,
-        created_at=market.created_at,
-    )
+    market_list_cache.invalidate()
+
+    return constructed_response(_market_to_response(market, market.description))
 
 
 # ============== Betting Endpoints ==============
@@ -549,19 +711,20 @@ async def create_market(
 async def place_bet(
     market_id: UUID,
     data: BetRequest,
-    agent: Agent = Depends(get_current_trader),
+    agent: AgentAuth = Depends(rate_limit("order", get_current_trader)),
     session: AsyncSession = Depends(get_session),
 ):
     """
     Place a bet on a market.
 
+    With ``execute="async"`` the order is saved with its balance locked and
+    returned as pending; the matching worker fills it in the background, and
+    GET /orders/{order_id} reports its progress.
+
     Rate limit: 10 bets per minute.
     """
-    await check_rate_limit(agent, session, "order")
-
-    # Get market
-    result = await session.execute(select(Market).where(Market.id == market_id))
-    market = result.scalar_one_or_none()
+    # Get market status and prices (briefly cached per process)
+    market = await get_market_snapshot(session, market_id)
 
     if not market:
         raise HTTPException(status_code=404, detail="Market not found")
@@ -569,119 +732,169 @@ async def place_bet(
     if market.status != MarketStatus.OPEN:
         raise HTTPException(status_code=400, detail="Market is not open for trading")
 
-    # Check if deadline has passed - normalize to UTC for comparison
-    if market.deadline.tzinfo is None:
-        # If deadline is naive, assume it's UTC
-        deadline_utc = market.deadline.replace(tzinfo=UTC)
-    else:
-        # If deadline is aware, convert to UTC
-        deadline_utc = market.deadline.astimezone(UTC)
-
-    now_utc = datetime.now(UTC)
-    if deadline_utc <= now_utc:
+    # Check if deadline has passed (deadlines load as aware UTC)
+    if market.deadline <= utc_now():
         raise HTTPException(status_code=400, detail="Market deadline has passed")
 
-    # Determine price
-    if data.price:
-        price = Decimal(str(data.price))
+    # Determine price (limit price, or the current market price)
+    if data.price is not None:
+        price = data.price
     else:
-        # Use current market price
         price = market.yes_price if data.side == Side.YES else market.no_price
 
     # Calculate cost
     cost = price * data.amount
 
-    # Check balance
-    if agent.available_balance < cost:
+    # Check and lock balance in one statement
+    if not await lock_balance_for_order(session, agent.id, price, data.amount):
+        available = await session.scalar(
+            select(Agent.available_balance).where(Agent.id == agent.id)
+        )
         raise HTTPException(
-            status_code=400,
-            detail=f"Insufficient balance. Need {cost}, have {agent.available_balance}",
+            status_code=400, detail=f"Insufficient balance. Need {cost}, have {available}"
         )
 
-    # Lock balance
-    agent.locked_balance += cost
-
     # Create order
     order = Order(
         agent_id=agent.id, market_id=market_id, side=data.side, price=price, size=data.amount
     )
+    if data.execute == "async":
+        # Stays out of the order book until the matching worker claims it
+        order.status = OrderStatus.PENDING
     session.add(order)
+    # Flush so the order is visible to matching; the bet commits once, after matching
+    await session.flush()
+
+    # Match order (updates the order's filled and status, and the market price, in place)
+    trades = [] if data.execute == "async" else await match_order(session, order)
+
     await session.commit()
-    await session.refresh(order)
-
-    # Match order
-    trades = await match_order(session, order)
-
-    # Update market prices if there were trades
-    if trades:
-        await update_market_price(session, market_id, trades[-1].price)
-
-    await session.refresh(order)
-
-    return BetResponse(
-        order_id=order.id,
-        market_id=order.market_id,
-        side=order.side.value,
-        price=float(order.price),
-        size=order.size,
-        filled=order.filled,
-        status=order.status.value,
-        cost=float(cost),
-        trades_executed=len(trades),
+    if data.execute == "async":
+        notify_matching_worker()
+    market_list_cache.invalidate()
+    await invalidate_order_books(market_id)
+    await invalidate_profiles(
+        agent.id, *(agent_id for trade in trades for agent_id in (trade.buyer_id, trade.seller_id))
+    )
+
+    # Trusted DB values already of the response types, so skip construction validation
+    return constructed_response(
+        build_bet_response(
+            order_id=order.id,
+            market_id=order.market_id,
+            side=order.side.value,
+            price=float(order.price),
+            size=order.size,
+            filled=order.filled,
+            status=order.status.value,
+            cost=float(cost),
+            trades_executed=len(trades),
+        )
+    )
+
+
+@router.get("/orders/{order_id}", response_model=OrderStatusResponse)
+async def get_order(
+    order_id: UUID,
+    agent: AgentAuth = Depends(rate_limit("general")),
+    session: AsyncSession = Depends(get_session),
+):
+    """Get the fill status of one of your orders."""
+    order = await session.get(Order, order_id)
+
+    if not order or order.agent_id != agent.id:
+        raise HTTPException(status_code=404, detail="Order not found")
+
+    return constructed_response(
+        build_order_status_response(
+            order_id=order.id,
+            market_id=order.market_id,
+            side=order.side.value,
+            price=float(order.price),
+            size=order.size,
+            filled=order.filled,
+            status=order.status.value,
+            created_at=order.created_at,
+        )
     )
 
 
 @router.get("/positions", response_model=list[PositionResponse])
 async def get_positions(
-    agent: Agent = Depends(get_current_agent), session: AsyncSession = Depends(get_session)
+    agent: AgentAuth = Depends(rate_limit("general")), session: AsyncSession = Depends(get_session)
 ):
     """Get all positions for the authenticated agent."""
-    await check_rate_limit(agent, session, "general")
-
-    result = await session.execute(
-        select(Position, Market)
-        .join(Market, Position.market_id == Market.id)
+    # Stream rows in batches so an agent's full position list is never all in memory.
+    # Rows are read while the response is sent, which needs FastAPI >= 0.118 to
+    # close the get_session dependency only after streaming.
+    result = await session.stream(
+        select(
+            Position.market_id,
+            Market.question,
+            Position.yes_shares,
+            Position.no_shares,
+            Position.avg_yes_price,
+            Position.avg_no_price,
+            Market.status.label("market_status"),
+        )
+        .join(Market, Market.id == Position.market_id)
         .where(Position.agent_id == agent.id)
         .where((Position.yes_shares > 0) | (Position.no_shares > 0))
+        .execution_options(yield_per=200)
     )
 
-    positions = []
-    for position, market in result.all():
-        positions.append(
-            PositionResponse(
-                market_id=position.market_id,
-                question=market.question,
-                yes_shares=position.yes_shares,
-                no_shares=position.no_shares,
-                avg_yes_price=float(position.avg_yes_price) if position.avg_yes_price else None,
-                avg_no_price=float(position.avg_no_price) if position.avg_no_price else None,
-                market_status=market.status.value,
-            )
-        )
-
-    return positions
+    return stream_json_array(
+        POSITION_RESPONSE, (_position_to_response(row) async for row in result), validate=False
+    )
 
 
 # ============== Resolution Endpoints ==============
 
 
-@router.post("/markets/{market_id}/resolve")
+@router.post("/markets/{market_id}/resolve", response_model=ResolutionResponse, status_code=202)
 async def resolve_market_endpoint(
     market_id: UUID,
     data: ResolveRequest,
-    agent: Agent = Depends(get_current_moderator),
+    idempotency_key: str | None = Header(None, max_length=255),
+    agent: AgentAuth = Depends(rate_limit("general", get_current_moderator)),
     session: AsyncSession = Depends(get_session),
 ):
     """
     Resolve a market with the final outcome.
 
-    Only moderator agents can resolve markets.
+    Only moderator agents can resolve markets. The resolution is queued and
+    settled in the background; poll GET /resolutions/{resolution_id} for the
+    payout summary. Retrying with the same Idempotency-Key header returns the
+    original resolution instead of queueing another.
     """
-    await check_rate_limit(agent, session, "general")
-
     try:
-        resolution = await resolve_market(session, market_id, data.outcome, agent.id, data.evidence)
-        await session.commit()
-        return resolution
+        resolution, created = await enqueue_resolution(
+            session,
+            market_id,
+            data.outcome,
+            agent.id,
+            data.evidence,
+            idempotency_key=idempotency_key,
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
+
+    await session.commit()
+    if created:
+        notify_resolution_worker()
+    return constructed_response(_resolution_to_response(resolution), status_code=202)
+
+
+@router.get("/resolutions/{resolution_id}", response_model=ResolutionResponse)
+async def get_resolution(
+    resolution_id: UUID,
+    agent: AgentAuth = Depends(rate_limit("general", get_current_moderator)),
+    session: AsyncSession = Depends(get_session),
+):
+    """Get the status of a queued market resolution."""
+    resolution = await session.get(MarketResolution, resolution_id)
+
+    if not resolution:
+        raise HTTPException(status_code=404, detail="Resolution not found")
+
+    return constructed_response(_resolution_to_response(resolution))
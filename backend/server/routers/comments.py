@@ -1,18 +1,30 @@
+import base64
+from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import case, func
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import and_, delete, func, literal, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
 from server.database import get_session
-from server.middleware.auth import get_current_agent, get_current_agent_optional
-from server.models.agent import Agent
+from server.middleware.auth import (
+    AgentAuth,
+    get_agent_auth,
+    get_current_agent,
+    get_current_agent_optional,
+    get_current_moderator,
+)
+from server.models.agent import Agent, AgentRole
 from server.models.comment import Comment, CommentVote
-from server.models.market import Market
 from server.models.position import Position
+from server.models.types import naive_utc_now, uuid7
 from server.schemas.comment import (
     AgentBasicInfo,
     CommentCreate,
@@ -22,9 +34,64 @@ from server.schemas.comment import (
     CommentVoteRequest,
     PositionInfo,
 )
+from server.services.market_cache import market_exists
 
 router = APIRouter(prefix="/markets", tags=["comments"])
 
+# Reply levels nested under a comment; deeper replies are listed by parent_id
+MAX_REPLY_DEPTH = 5
+
+# Comment orders as (expression, descending) pairs, ending in the id so every
+# row has a unique sort key to page from
+COMMENT_SORT_KEYS = {
+    "newest": [(Comment.is_pinned, True), (Comment.created_at, True), (Comment.id, True)],
+    "oldest": [(Comment.is_pinned, True), (Comment.created_at, False), (Comment.id, False)],
+    "top": [
+        (Comment.is_pinned, True),
+        (Comment.score, True),
+        (Comment.created_at, True),
+        (Comment.id, True),
+    ],
+    "controversial": [
+        (Comment.is_pinned, True),
+        (Comment.controversy, True),
+        (Comment.created_at, True),
+        (Comment.id, True),
+    ],
+}
+
+
+def encode_comment_cursor(comment: Comment, sort: str) -> str:
+    """Opaque cursor for the page after ``comment`` in the ``sort`` order."""
+    votes = {"top": [comment.score], "controversial": [comment.controversy]}
+    key = [comment.is_pinned, *votes.get(sort, []), comment.created_at, comment.id]
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode()
+
+
+def decode_comment_cursor(cursor: str, sort_keys: list) -> list:
+    """Parse a comment cursor back into the sort key values it was made from."""
+    try:
+        pinned, *votes, created_at, row_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        values = [bool(pinned), *map(int, votes), datetime.fromisoformat(created_at), UUID(row_id)]
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    if len(values) != len(sort_keys):
+        raise HTTPException(status_code=400, detail="Cursor does not match sort order")
+    return values
+
+
+def _after_sort_key(sort_keys: list, values: list):
+    """Condition selecting the rows that sort after ``values``."""
+    condition = None
+    for (expression, descending), value in reversed(list(zip(sort_keys, values, strict=True))):
+        # Bound explicitly, since SQLAlchemy only compares True/False with = and !=
+        bound = literal(value, expression.type)
+        beyond = expression < bound if descending else expression > bound
+        condition = (
+            beyond if condition is None else or_(beyond, and_(expression == bound, condition))
+        )
+    return condition
+
 
 async def get_comment_with_agent(
     comment_id: UUID, session: AsyncSession, current_agent_id: UUID | None = None
@@ -42,35 +109,16 @@ async def get_comment_with_agent(
     return comment, agent
 
 
-async def build_comment_response(
+def _comment_to_response(
     comment: Comment,
     agent: Agent,
-    session: AsyncSession,
-    current_agent_id: UUID | None = None,
-    include_replies: bool = True,
+    user_vote: str | None,
+    position: Position | None,
+    replies: list[CommentResponse],
 ) -> CommentResponse:
-    """Build a CommentResponse with nested replies."""
-    # Get user's vote if logged in
-    user_vote = None
-    if current_agent_id:
-        vote_result = await session.execute(
-            select(CommentVote)
-            .where(CommentVote.comment_id == comment.id)
-            .where(CommentVote.agent_id == current_agent_id)
-        )
-        vote = vote_result.scalar_one_or_none()
-        if vote:
-            user_vote = vote.vote_type
-
-    # Get agent's position in the market
+    """Build a CommentResponse from a comment and its preloaded vote, open position and replies."""
     agent_position = None
-    position_result = await session.execute(
-        select(Position)
-        .where(Position.market_id == comment.market_id)
-        .where(Position.agent_id == comment.agent_id)
-    )
-    position = position_result.scalar_one_or_none()
-    if position and (position.yes_shares > 0 or position.no_shares > 0):
+    if position:
         agent_position = PositionInfo(
             yes_shares=position.yes_shares,
             no_shares=position.no_shares,
@@ -78,34 +126,13 @@ async def build_comment_response(
             avg_no_price=float(position.avg_no_price) if position.avg_no_price else None,
         )
 
-    # Get nested replies if requested
-    replies = []
-    if include_replies:
-        # Use (upvotes - downvotes) for score calculation in query
-        replies_result = await session.execute(
-            select(Comment, Agent)
-            .join(Agent, Comment.agent_id == Agent.id)
-            .where(Comment.parent_id == comment.id)
-            .where(Comment.is_deleted.is_(False))
-            .order_by(
-                Comment.is_pinned.desc(),
-                (Comment.upvotes - Comment.downvotes).desc(),
-                Comment.created_at.asc(),
-            )
-        )
-        for reply_comment, reply_agent in replies_result.all():
-            reply_response = await build_comment_response(
-                reply_comment, reply_agent, session, current_agent_id, include_replies=False
-            )
-            replies.append(reply_response)
-
     return CommentResponse(
         id=comment.id,
         market_id=comment.market_id,
         agent=AgentBasicInfo(
             id=agent.id,
             name=agent.name,
-            role=agent.role.value if hasattr(agent.role, "value") else str(agent.role),
+            role=agent.role.value,
             reputation=float(agent.reputation),
         ),
         parent_id=comment.parent_id,
@@ -127,6 +154,103 @@ async def build_comment_response(
     )
 
 
+async def build_comment_responses(
+    rows: Sequence[tuple[Comment, Agent]],
+    session: AsyncSession,
+    current_agent_id: UUID | None = None,
+    include_replies: bool = True,
+) -> list[CommentResponse]:
+    """
+    Build CommentResponses, with nested replies, for a page of comments.
+
+    Reply threads (up to MAX_REPLY_DEPTH levels), the current agent's votes
+    and the authors' positions are each loaded with one query for the whole
+    page rather than per comment.
+    """
+    if not rows:
+        return []
+
+    # Get nested replies if requested, grouped by parent in display order.
+    # One recursive query walks every thread on the page down to MAX_REPLY_DEPTH.
+    replies_by_parent: dict[UUID, list[tuple[Comment, Agent]]] = defaultdict(list)
+    if include_replies:
+        tree = (
+            select(Comment.id, literal(1).label("depth"))
+            .where(Comment.parent_id.in_([comment.id for comment, _ in rows]))
+            .where(Comment.is_deleted.is_(False))
+            .cte("reply_tree", recursive=True)
+        )
+        tree = tree.union_all(
+            select(Comment.id, tree.c.depth + 1)
+            .join(tree, Comment.parent_id == tree.c.id)
+            .where(Comment.is_deleted.is_(False))
+            .where(tree.c.depth < MAX_REPLY_DEPTH)
+        )
+        replies_result = await session.execute(
+            select(Comment, Agent)
+            .join(tree, Comment.id == tree.c.id)
+            .join(Agent, Comment.agent_id == Agent.id)
+            .order_by(
+                Comment.parent_id,
+                Comment.is_pinned.desc(),
+                Comment.score.desc(),
+                Comment.created_at.asc(),
+            )
+        )
+        for reply, reply_agent in replies_result.all():
+            replies_by_parent[reply.parent_id].append((reply, reply_agent))
+
+    comments = [comment for comment, _ in rows]
+    comments.extend(reply for replies in replies_by_parent.values() for reply, _ in replies)
+
+    # Get user's votes if logged in
+    user_votes: dict[UUID, str] = {}
+    if current_agent_id:
+        vote_result = await session.execute(
+            select(CommentVote.comment_id, CommentVote.vote_type)
+            .where(CommentVote.agent_id == current_agent_id)
+            .where(CommentVote.comment_id.in_([comment.id for comment in comments]))
+        )
+        user_votes = dict(vote_result.tuples().all())
+
+    # Get each author's open position in the market
+    position_result = await session.execute(
+        select(Position)
+        .where(Position.market_id.in_({comment.market_id for comment in comments}))
+        .where(Position.agent_id.in_({comment.agent_id for comment in comments}))
+        .where(or_(Position.yes_shares > 0, Position.no_shares > 0))
+    )
+    positions = {
+        (position.market_id, position.agent_id): position
+        for position in position_result.scalars().all()
+    }
+
+    def to_response(comment: Comment, agent: Agent) -> CommentResponse:
+        return _comment_to_response(
+            comment,
+            agent,
+            user_votes.get(comment.id),
+            positions.get((comment.market_id, comment.agent_id)),
+            [to_response(*reply) for reply in replies_by_parent.get(comment.id, ())],
+        )
+
+    return [to_response(comment, agent) for comment, agent in rows]
+
+
+async def build_comment_response(
+    comment: Comment,
+    agent: Agent,
+    session: AsyncSession,
+    current_agent_id: UUID | None = None,
+    include_replies: bool = True,
+) -> CommentResponse:
+    """Build a CommentResponse with nested replies."""
+    responses = await build_comment_responses(
+        [(comment, agent)], session, current_agent_id, include_replies
+    )
+    return responses[0]
+
+
 @router.post("/{market_id}/comments", response_model=CommentResponse)
 async def create_comment(
     market_id: UUID,
@@ -135,16 +259,15 @@ async def create_comment(
     session: AsyncSession = Depends(get_session),
 ):
     """Create a new comment on a market."""
-    # Verify market exists
-    market_result = await session.execute(select(Market).where(Market.id == market_id))
-    market = market_result.scalar_one_or_none()
-    if not market:
+    if not await market_exists(session, market_id):
         raise HTTPException(status_code=404, detail="Market not found")
 
     # If replying, verify parent comment exists and is in same market
     if data.parent_id:
-        parent_result = await session.execute(select(Comment).where(Comment.id == data.parent_id))
-        parent = parent_result.scalar_one_or_none()
+        parent_result = await session.execute(
+            select(Comment.market_id, Comment.is_deleted).where(Comment.id == data.parent_id)
+        )
+        parent = parent_result.first()
         if not parent:
             raise HTTPException(status_code=404, detail="Parent comment not found")
         if parent.market_id != market_id:
@@ -166,18 +289,16 @@ async def create_comment(
 
     # Update parent's reply count if replying
     if data.parent_id:
-        await session.execute(select(Comment).where(Comment.id == data.parent_id))
-        parent_result = await session.execute(select(Comment).where(Comment.id == data.parent_id))
-        parent = parent_result.scalar_one_or_none()
-        if parent:
-            parent.reply_count += 1
-            session.add(parent)
+        await session.execute(
+            update(Comment)
+            .where(Comment.id == data.parent_id)
+            .values(reply_count=Comment.reply_count + 1)
+        )
 
     await session.commit()
-    await session.refresh(comment)
 
-    # Build response
-    return await build_comment_response(comment, agent, session, agent.id, include_replies=False)
+    # A new comment has no votes or replies to look up
+    return await build_comment_response(comment, agent, session, include_replies=False)
 
 
 @router.get("/{market_id}/comments", response_model=CommentListResponse)
@@ -186,15 +307,18 @@ async def get_market_comments(
     sort: str = Query(default="top", pattern="^(newest|top|controversial|oldest)$"),
     limit: int = Query(default=50, le=200),
     offset: int = Query(default=0),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page"),
     parent_id: UUID | None = Query(default=None),
     session: AsyncSession = Depends(get_session),
     current_agent: Agent | None = Depends(get_current_agent_optional),
 ):
-    """Get comments for a market."""
-    # Verify market exists
-    market_result = await session.execute(select(Market).where(Market.id == market_id))
-    market = market_result.scalar_one_or_none()
-    if not market:
+    """
+    Get comments for a market.
+
+    Pass the previous page's ``next_cursor`` as ``cursor`` to page by keyset
+    instead of ``offset``. Cursor pages skip the total count.
+    """
+    if not await market_exists(session, market_id):
         raise HTTPException(status_code=404, detail="Market not found")
 
     # Build query
@@ -212,38 +336,27 @@ async def get_market_comments(
         # Top-level comments only
         query = query.where(Comment.parent_id.is_(None))
 
-    # Get total count
-    count_query = select(func.count(Comment.id)).where(
-        Comment.market_id == market_id,
-        Comment.is_deleted.is_(False),
-        Comment.parent_id == (parent_id if parent_id else None),
-    )
-    total = (await session.execute(count_query)).scalar_one()
-
-    # Apply sorting
-    if sort == "newest":
-        query = query.order_by(Comment.is_pinned.desc(), Comment.created_at.desc())
-    elif sort == "oldest":
-        query = query.order_by(Comment.is_pinned.desc(), Comment.created_at.asc())
-    elif sort == "top":
-        # Sort by score (upvotes - downvotes) descending
-        query = query.order_by(
-            Comment.is_pinned.desc(),
-            (Comment.upvotes - Comment.downvotes).desc(),
-            Comment.created_at.desc(),
+    # Apply sorting and pagination
+    sort_keys = COMMENT_SORT_KEYS[sort]
+    query = query.order_by(
+        *(
+            expression.desc() if descending else expression.asc()
+            for expression, descending in sort_keys
         )
-    elif sort == "controversial":
-        # Controversial = high upvotes AND high downvotes (min of both)
-        # Use case statement to get minimum of upvotes and downvotes
-        min_votes = case(
-            (Comment.upvotes < Comment.downvotes, Comment.upvotes), else_=Comment.downvotes
-        )
-        query = query.order_by(
-            Comment.is_pinned.desc(), min_votes.desc(), Comment.created_at.desc()
+    )
+    total = None
+    if cursor is not None:
+        query = query.where(_after_sort_key(sort_keys, decode_comment_cursor(cursor, sort_keys)))
+    else:
+        # Get total count
+        count_query = select(func.count(Comment.id)).where(
+            Comment.market_id == market_id,
+            Comment.is_deleted.is_(False),
+            Comment.parent_id == (parent_id if parent_id else None),
         )
-
-    # Apply pagination
-    query = query.limit(limit).offset(offset)
+        total = (await session.execute(count_query)).scalar_one()
+        query = query.offset(offset)
+    query = query.limit(limit)
 
     # Execute query
     result = await session.execute(query)
@@ -251,14 +364,19 @@ async def get_market_comments(
 
     # Build responses
     current_agent_id = current_agent.id if current_agent else None
-    comments = []
-    for comment, agent in rows:
-        comment_response = await build_comment_response(
-            comment, agent, session, current_agent_id, include_replies=(parent_id is None)
-        )
-        comments.append(comment_response)
+    comments = await build_comment_responses(
+        rows, session, current_agent_id, include_replies=(parent_id is None)
+    )
 
-    return CommentListResponse(comments=comments, total=total, limit=limit, offset=offset)
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = encode_comment_cursor(rows[-1][0], sort)
+
+    # Already validated, so serialize directly instead of through response_model
+    page = CommentListResponse(
+        comments=comments, total=total, limit=limit, offset=offset, next_cursor=next_cursor
+    )
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/comments/{comment_id}", response_model=CommentResponse)
@@ -270,7 +388,8 @@ async def get_comment(
     """Get a single comment with its replies."""
     comment, agent = await get_comment_with_agent(comment_id, session)
     current_agent_id = current_agent.id if current_agent else None
-    return await build_comment_response(comment, agent, session, current_agent_id)
+    response = await build_comment_response(comment, agent, session, current_agent_id)
+    return Response(response.model_dump_json(), media_type="application/json")
 
 
 @router.patch("/comments/{comment_id}", response_model=CommentResponse)
@@ -291,12 +410,12 @@ async def update_comment(
 
     comment.content = data.content
     comment.is_edited = True
-    comment.edited_at = datetime.utcnow()
-    comment.updated_at = datetime.utcnow()
+    now = naive_utc_now()
+    comment.edited_at = now
+    comment.updated_at = now
 
     session.add(comment)
     await session.commit()
-    await session.refresh(comment)
 
     return await build_comment_response(comment, comment_agent, session, agent.id)
 
@@ -304,21 +423,14 @@ async def update_comment(
 @router.delete("/comments/{comment_id}")
 async def delete_comment(
     comment_id: UUID,
-    agent: Agent = Depends(get_current_agent),
+    auth: AgentAuth = Depends(get_agent_auth),
     session: AsyncSession = Depends(get_session),
 ):
     """Delete a comment (by author or moderator)."""
     comment, _comment_agent = await get_comment_with_agent(comment_id, session)
 
     # Check permissions
-    is_author = comment.agent_id == agent.id
-    is_moderator = (
-        agent.role.value == "moderator"
-        if hasattr(agent.role, "value")
-        else agent.role == "moderator"
-    )
-
-    if not (is_author or is_moderator):
+    if comment.agent_id != auth.id and auth.role != AgentRole.MODERATOR:
         raise HTTPException(
             status_code=403, detail="You can only delete your own comments or be a moderator"
         )
@@ -326,17 +438,15 @@ async def delete_comment(
     # Soft delete
     comment.is_deleted = True
     comment.content = "[deleted]"
-    comment.updated_at = datetime.utcnow()
+    comment.updated_at = naive_utc_now()
 
     # Update parent's reply count if this was a reply
     if comment.parent_id:
-        parent_result = await session.execute(
-            select(Comment).where(Comment.id == comment.parent_id)
+        await session.execute(
+            update(Comment)
+            .where(Comment.id == comment.parent_id, Comment.reply_count > 0)
+            .values(reply_count=Comment.reply_count - 1)
         )
-        parent = parent_result.scalar_one_or_none()
-        if parent:
-            parent.reply_count = max(0, parent.reply_count - 1)
-            session.add(parent)
 
     session.add(comment)
     await session.commit()
@@ -344,6 +454,46 @@ async def delete_comment(
     return {"message": "Comment deleted"}
 
 
+# Comment counter bumped by each vote type
+VOTE_COUNTERS = {"upvote": "upvotes", "downvote": "downvotes"}
+
+
+async def _record_vote(
+    session: AsyncSession, comment_id: UUID, agent_id: UUID, vote_type: str
+) -> str | None:
+    """
+    Upsert an agent's vote in one statement and return the vote it replaced.
+
+    The upsert only touches the row when the vote type changes, so a repeated
+    vote returns nothing. An inserted row carries the id generated here, while
+    an updated row keeps its own id; an update means the vote flipped sides.
+    """
+    insert = pg_insert if session.bind.dialect.name == "postgresql" else sqlite_insert
+    vote_id = uuid7()
+    statement = (
+        insert(CommentVote)
+        .values(
+            id=vote_id,
+            comment_id=comment_id,
+            agent_id=agent_id,
+            vote_type=vote_type,
+            created_at=naive_utc_now(),
+        )
+        .on_conflict_do_update(
+            index_elements=[CommentVote.comment_id, CommentVote.agent_id],
+            set_={"vote_type": vote_type},
+            where=CommentVote.vote_type != vote_type,
+        )
+        .returning(CommentVote.id)
+    )
+    returned_id = await session.scalar(statement)
+    if returned_id is None:
+        return vote_type
+    if returned_id == vote_id:
+        return None
+    return "downvote" if vote_type == "upvote" else "upvote"
+
+
 @router.post("/comments/{comment_id}/vote", response_model=dict)
 async def vote_on_comment(
     comment_id: UUID,
@@ -351,94 +501,64 @@ async def vote_on_comment(
     agent: Agent = Depends(get_current_agent),
     session: AsyncSession = Depends(get_session),
 ):
-    """Vote on a comment (upvote, downvote, or remove vote)."""
-    comment, _ = await get_comment_with_agent(comment_id, session)
-
-    if comment.is_deleted:
+    """
+    Vote on a comment (upvote, downvote, or remove vote).
+
+    The vote is upserted or deleted in one statement, and the comment's
+    counters are moved by the resulting delta in one atomic UPDATE.
+    """
+    is_deleted = await session.scalar(select(Comment.is_deleted).where(Comment.id == comment_id))
+    if is_deleted is None:
+        raise HTTPException(status_code=404, detail="Comment not found")
+    if is_deleted:
         raise HTTPException(status_code=400, detail="Cannot vote on deleted comment")
 
-    # Check for existing vote
-    existing_vote_result = await session.execute(
-        select(CommentVote)
-        .where(CommentVote.comment_id == comment_id)
-        .where(CommentVote.agent_id == agent.id)
-    )
-    existing_vote = existing_vote_result.scalar_one_or_none()
-
     if data.vote_type == "remove":
-        # Remove existing vote
-        if existing_vote:
-            # Update comment vote counts
-            if existing_vote.vote_type == "upvote":
-                comment.upvotes = max(0, comment.upvotes - 1)
-            elif existing_vote.vote_type == "downvote":
-                comment.downvotes = max(0, comment.downvotes - 1)
-
-            await session.delete(existing_vote)
-            session.add(comment)
-            await session.commit()
-            await session.refresh(comment)
-
-        return {"comment_id": str(comment_id), "new_score": comment.score, "user_vote": None}
-
-    # Add or update vote
-    if existing_vote:
-        # Change vote type
-        old_type = existing_vote.vote_type
-        existing_vote.vote_type = data.vote_type
-
-        # Update counts
-        if old_type == "upvote":
-            comment.upvotes = max(0, comment.upvotes - 1)
-        elif old_type == "downvote":
-            comment.downvotes = max(0, comment.downvotes - 1)
-
-        if data.vote_type == "upvote":
-            comment.upvotes += 1
-        elif data.vote_type == "downvote":
-            comment.downvotes += 1
-
-        session.add(existing_vote)
+        new_type = None
+        old_type = await session.scalar(
+            delete(CommentVote)
+            .where(CommentVote.comment_id == comment_id)
+            .where(CommentVote.agent_id == agent.id)
+            .returning(CommentVote.vote_type)
+        )
     else:
-        # New vote
-        vote = CommentVote(comment_id=comment_id, agent_id=agent.id, vote_type=data.vote_type)
-        session.add(vote)
-
-        if data.vote_type == "upvote":
-            comment.upvotes += 1
-        elif data.vote_type == "downvote":
-            comment.downvotes += 1
-
-    session.add(comment)
+        new_type = data.vote_type
+        old_type = await _record_vote(session, comment_id, agent.id, new_type)
+
+    deltas: dict[str, int] = defaultdict(int)
+    if old_type:
+        deltas[VOTE_COUNTERS[old_type]] -= 1
+    if new_type:
+        deltas[VOTE_COUNTERS[new_type]] += 1
+    changes = {column: delta for column, delta in deltas.items() if delta}
+
+    if changes:
+        new_score = await session.scalar(
+            update(Comment)
+            .where(Comment.id == comment_id)
+            .values({column: getattr(Comment, column) + delta for column, delta in changes.items()})
+            .returning(Comment.score)
+        )
+    else:
+        new_score = await session.scalar(select(Comment.score).where(Comment.id == comment_id))
     await session.commit()
-    await session.refresh(comment)
 
-    return {"comment_id": str(comment_id), "new_score": comment.score, "user_vote": data.vote_type}
+    return {"comment_id": str(comment_id), "new_score": new_score, "user_vote": new_type}
 
 
 @router.post("/comments/{comment_id}/pin", response_model=CommentResponse)
 async def pin_comment(
     comment_id: UUID,
     pinned: bool = Query(...),
-    agent: Agent = Depends(get_current_agent),
+    moderator: AgentAuth = Depends(get_current_moderator),
     session: AsyncSession = Depends(get_session),
 ):
     """Pin or unpin a comment (moderator only)."""
-    # Check if moderator
-    is_moderator = (
-        agent.role.value == "moderator"
-        if hasattr(agent.role, "value")
-        else agent.role == "moderator"
-    )
-    if not is_moderator:
-        raise HTTPException(status_code=403, detail="Only moderators can pin comments")
-
     comment, comment_agent = await get_comment_with_agent(comment_id, session)
     comment.is_pinned = pinned
-    comment.updated_at = datetime.utcnow()
+    comment.updated_at = naive_utc_now()
 
     session.add(comment)
     await session.commit()
-    await session.refresh(comment)
 
-    return await build_comment_response(comment, comment_agent, session, agent.id)
+    return await build_comment_response(comment, comment_agent, session, moderator.id)
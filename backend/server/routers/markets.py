@@ -1,8 +1,10 @@
-from datetime import UTC, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -12,6 +14,7 @@ from server.models.agent import Agent
 from server.models.market import Market, MarketCategory, MarketStatus
 from server.models.order import Order, OrderStatus, Side
 from server.models.platform import FeeType, PlatformFee
+from server.models.types import utc_now
 from server.schemas.market import (
     MarketCreate,
     MarketResolve,
@@ -19,42 +22,47 @@ from server.schemas.market import (
     OrderBook,
     OrderBookLevel,
 )
-from server.services.matching import update_platform_stats
+from server.services.market_cache import (
+    cacheable_json_response,
+    content_etag,
+    market_exists,
+    market_list_cache,
+)
+from server.services.matching import charge_fee, update_platform_stats
+from server.services.order_book_cache import (
+    cache_order_book,
+    get_cached_order_book,
+    invalidate_order_books,
+)
 from server.services.settlement import resolve_market
 
 router = APIRouter(prefix="/markets", tags=["markets"])
 
+MARKET_RESPONSE = TypeAdapter(MarketResponse)
+MARKET_LIST_RESPONSE = TypeAdapter(list[MarketResponse])
+
+# Categories only change with a deploy, so the list is rendered once
+CATEGORIES_CONTENT = orjson.dumps([cat.value for cat in MarketCategory])
+CATEGORIES_CACHE_CONTROL = "public, max-age=3600"
+
 
 @router.post("", response_model=MarketResponse)
 async def create_market(data: MarketCreate, session: AsyncSession = Depends(get_session)):
     """Create a new prediction market."""
     creation_fee = settings.MARKET_CREATION_FEE
 
-    # Validate deadline is in the future
-    # Normalize deadline to UTC-aware datetime for comparison
-    if data.deadline.tzinfo is None:
-        # If deadline is naive, assume it's UTC
-        deadline_utc = data.deadline.replace(tzinfo=UTC)
-    else:
-        # If deadline is aware, convert to UTC
-        deadline_utc = data.deadline.astimezone(UTC)
-
-    now_utc = datetime.now(UTC)
-    if deadline_utc <= now_utc:
+    # Validate deadline is in the future (already aware UTC)
+    if data.deadline <= utc_now():
         raise HTTPException(status_code=400, detail="Deadline must be in the future")
 
-    # Get creator and check balance
-    result = await session.execute(select(Agent).where(Agent.id == data.creator_id))
-    creator = result.scalar_one_or_none()
+    # Get creator and deduct the creation fee if the balance covers it
+    creator = await session.get(Agent, data.creator_id)
     if not creator:
         raise HTTPException(status_code=404, detail="Creator agent not found")
 
-    if creator.available_balance < creation_fee:
+    if not await charge_fee(session, creator.id, creation_fee):
         raise HTTPException(status_code=400, detail="Insufficient balance for creation fee")
 
-    # Deduct creation fee
-    creator.balance -= creation_fee
-
     # Create market
     market = Market(
         creator_id=data.creator_id,
@@ -76,9 +84,12 @@ async def create_market(data: MarketCreate, session: AsyncSession = Depends(get_
     session.add(fee_record)
 
     # Update platform stats
-    await update_platform_stats(session, market_creation_fee=creation_fee, markets_created=1)
+    await update_platform_stats(
+        session, market_creation_fee=creation_fee, markets_created=1, open_markets=1
+    )
 
     await session.commit()
+    market_list_cache.invalidate()
     await session.refresh(market)
     return market
 
@@ -90,9 +101,10 @@ async def list_markets(
     creator_id: UUID | None = Query(default=None),
     trending: bool = Query(default=False, description="Sort by volume (trending)"),
     limit: int = Query(default=20, le=100),
+    if_none_match: str | None = Header(None),
     session: AsyncSession = Depends(get_session),
 ):
-    """List markets with optional filters."""
+    """List markets with optional filters (with an ETag for conditional requests)."""
     query = select(Market)
 
     if status:
@@ -109,70 +121,70 @@ async def list_markets(
         query = query.order_by(Market.created_at.desc()).limit(limit)
 
     result = await session.execute(query)
-    return result.scalars().all()
+    markets = MARKET_LIST_RESPONSE.validate_python(result.scalars().all(), from_attributes=True)
+    content = MARKET_LIST_RESPONSE.dump_json(markets)
+    return cacheable_json_response(content, content_etag(content), if_none_match)
 
 
 @router.get("/categories", response_model=list[str])
 async def list_categories():
-    """Get all available market categories."""
-    return [cat.value for cat in MarketCategory]
+    """Get all available market categories (fixed per release, so cacheable for an hour)."""
+    return Response(
+        CATEGORIES_CONTENT,
+        media_type="application/json",
+        headers={"Cache-Control": CATEGORIES_CACHE_CONTROL},
+    )
 
 
 @router.get("/{market_id}", response_model=MarketResponse)
-async def get_market(market_id: UUID, session: AsyncSession = Depends(get_session)):
-    """Get market details by ID."""
-    result = await session.execute(select(Market).where(Market.id == market_id))
-    market = result.scalar_one_or_none()
+async def get_market(
+    market_id: UUID,
+    if_none_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_session),
+):
+    """Get market details by ID (with an ETag for conditional requests)."""
+    market = await session.get(Market, market_id)
     if not market:
         raise HTTPException(status_code=404, detail="Market not found")
-    return market
+    content = MARKET_RESPONSE.dump_json(
+        MARKET_RESPONSE.validate_python(market, from_attributes=True)
+    )
+    return cacheable_json_response(content, content_etag(content), if_none_match)
 
 
 @router.get("/{market_id}/orderbook", response_model=OrderBook)
 async def get_order_book(market_id: UUID, session: AsyncSession = Depends(get_session)):
-    """Get order book for a market."""
-    # Verify market exists
-    result = await session.execute(select(Market).where(Market.id == market_id))
-    market = result.scalar_one_or_none()
-    if not market:
-        raise HTTPException(status_code=404, detail="Market not found")
+    """
+    Get order book for a market.
 
-    # Get open YES orders (bids)
-    bids_result = await session.execute(
-        select(Order)
-        .where(Order.market_id == market_id)
-        .where(Order.side == Side.YES)
-        .where(Order.status.in_([OrderStatus.OPEN, OrderStatus.PARTIAL]))
-        .order_by(Order.price.desc())
-    )
-    bids_orders = bids_result.scalars().all()
+    Books are cached in Redis for ORDER_BOOK_CACHE_TTL seconds and dropped when
+    the market's orders change.
+    """
+    cached = await get_cached_order_book(market_id)
+    if cached is not None:
+        return Response(cached, media_type="application/json")
+
+    if not await market_exists(session, market_id):
+        raise HTTPException(status_code=404, detail="Market not found")
 
-    # Get open NO orders (asks - converted to YES perspective)
-    asks_result = await session.execute(
-        select(Order)
+    # Remaining size of open orders per side and price level, aggregated in SQL
+    levels_result = await session.execute(
+        select(Order.side, Order.price, func.sum(Order.size - Order.filled))
         .where(Order.market_id == market_id)
-        .where(Order.side == Side.NO)
         .where(Order.status.in_([OrderStatus.OPEN, OrderStatus.PARTIAL]))
+        .group_by(Order.side, Order.price)
         .order_by(Order.price.desc())
     )
-    asks_orders = asks_result.scalars().all()
 
-    # Aggregate by price level
-    bids_by_price = {}
-    for order in bids_orders:
-        price = order.price
-        remaining = order.size - order.filled
-        bids_by_price[price] = bids_by_price.get(price, 0) + remaining
-
-    asks_by_price = {}
-    for order in asks_orders:
-        # Convert NO price to YES perspective (1 - price)
-        yes_price = Decimal("1.00") - order.price
-        remaining = order.size - order.filled
-        asks_by_price[yes_price] = asks_by_price.get(yes_price, 0) + remaining
-
-    bids = [OrderBookLevel(price=p, size=s) for p, s in sorted(bids_by_price.items(), reverse=True)]
-    asks = [OrderBookLevel(price=p, size=s) for p, s in sorted(asks_by_price.items())]
+    # YES orders are bids; NO orders are asks, converted to YES perspective
+    # (1 - price), so the highest NO price is the best ask
+    bids = []
+    asks = []
+    for side, price, size in levels_result:
+        if side == Side.YES:
+            bids.append(OrderBookLevel(price=price, size=size))
+        else:
+            asks.append(OrderBookLevel(price=Decimal("1.00") - price, size=size))
 
     # Calculate spread information
     best_bid = bids[0].price if bids else None
@@ -184,7 +196,7 @@ async def get_order_book(market_id: UUID, session: AsyncSession = Depends(get_se
         spread = best_ask - best_bid
         mid_price = (best_bid + best_ask) / 2
 
-    return OrderBook(
+    content = OrderBook(
         market_id=market_id,
         bids=bids,
         asks=asks,
@@ -192,7 +204,9 @@ async def get_order_book(market_id: UUID, session: AsyncSession = Depends(get_se
         best_ask=best_ask,
         spread=spread,
         mid_price=mid_price,
-    )
+    ).model_dump_json()
+    await cache_order_book(market_id, content)
+    return Response(content, media_type="application/json")
 
 
 @router.post("/{market_id}/resolve")
@@ -223,6 +237,8 @@ async def resolve_market_endpoint(
             session, market_id, data.outcome, data.moderator_id, data.evidence
         )
         await session.commit()
+        market_list_cache.invalidate()
+        await invalidate_order_books(market_id)
         return resolution
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -1,4 +1,3 @@
-from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -10,6 +9,7 @@ from server.database import get_session
 from server.models.agent import Agent, AgentRole
 from server.models.market import Market, MarketStatus
 from server.models.moderator_reward import ModeratorReward
+from server.models.types import utc_now
 
 router = APIRouter(prefix="/moderator", tags=["moderator"])
 
@@ -82,7 +82,7 @@ async def get_moderator_stats(moderator_id: UUID, session: AsyncSession = Depend
     markets_resolved = reward_data[3] or 0
 
     # Get pending markets count (closed but not resolved, past deadline)
-    now = datetime.utcnow()
+    now = utc_now()
     pending_result = await session.execute(
         select(func.count(Market.id))
         .where(Market.status.in_([MarketStatus.OPEN, MarketStatus.CLOSED]))
@@ -107,7 +107,7 @@ async def get_pending_markets(
     limit: int = Query(default=50, le=100), session: AsyncSession = Depends(get_session)
 ):
     """Get markets that are past their deadline and awaiting resolution."""
-    now = datetime.utcnow()
+    now = utc_now()
 
     result = await session.execute(
         select(Market)
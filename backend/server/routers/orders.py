@@ -18,13 +18,16 @@ from server.schemas.order import (
     TradeResponse,
 )
 from server.schemas.pending_action import PendingActionResult
+from server.services.market_cache import market_list_cache
 from server.services.matching import (
     lock_balance_for_order,
     match_order,
     unlock_balance_for_cancelled_order,
 )
+from server.services.order_book_cache import invalidate_order_books
 from server.services.pending_actions import create_pending_action
 from server.services.position_validator import can_sell_shares
+from server.services.profile_cache import invalidate_profiles
 from server.websocket import broadcast_market_update, broadcast_order, broadcast_trade
 
 router = APIRouter(prefix="/orders", tags=["orders"])
@@ -52,8 +55,7 @@ async def place_order(data: OrderCreate, session: AsyncSession = Depends(get_ses
         )
 
     # Validate market exists and is open
-    market_result = await session.execute(select(Market).where(Market.id == data.market_id))
-    market = market_result.scalar_one_or_none()
+    market = await session.get(Market, data.market_id)
     if not market:
         raise HTTPException(status_code=404, detail="Market not found")
     if market.status != MarketStatus.OPEN:
@@ -134,13 +136,20 @@ async def place_order(data: OrderCreate, session: AsyncSession = Depends(get_ses
     for trade in trades:
         market.volume += trade.price * trade.size
 
+    # Every agent on either side of a fill has a changed profile
+    traded_agents = {agent for trade in trades for agent in (trade.buyer_id, trade.seller_id)}
+
+    # One commit for the order, its fills and the balance changes. Sessions keep
+    # objects loaded after commit, so nothing is re-read afterwards.
     await session.commit()
-    await session.refresh(order)
+    if trades:
+        market_list_cache.invalidate()
+    await invalidate_order_books(order.market_id)
+    await invalidate_profiles(order.agent_id, *traded_agents)
 
     # Convert trades to response
     trade_responses = []
     for trade in trades:
-        await session.refresh(trade)
         trade_responses.append(
             TradeResponse(
                 id=trade.id,
@@ -177,7 +186,6 @@ async def place_order(data: OrderCreate, session: AsyncSession = Depends(get_ses
 
     # Broadcast market price update if trades occurred
     if trades:
-        await session.refresh(market)
         await broadcast_market_update(
             market_id_str,
             {
@@ -211,7 +219,7 @@ async def cancel_order(
         raise HTTPException(status_code=403, detail="Not your order")
 
     # Check if cancellable
-    if order.status not in [OrderStatus.OPEN, OrderStatus.PARTIAL]:
+    if order.status not in [OrderStatus.PENDING, OrderStatus.OPEN, OrderStatus.PARTIAL]:
         raise HTTPException(status_code=400, detail="Order cannot be cancelled")
 
     # Get agent to check trading mode
@@ -248,6 +256,8 @@ async def cancel_order(
     order.status = OrderStatus.CANCELLED
 
     await session.commit()
+    await invalidate_order_books(order.market_id)
+    await invalidate_profiles(agent_id)
 
     return CancelOrderResponse(order_id=order_id, status="cancelled", refunded=refund)
 
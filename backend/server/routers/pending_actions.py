@@ -2,7 +2,7 @@
 Pending Actions Router - Manage actions queued for owner approval in Manual Mode.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -16,21 +16,14 @@ from server.schemas.pending_action import (
     PendingActionListResponse,
     PendingActionResponse,
 )
+from server.services.market_cache import market_list_cache
+from server.services.order_book_cache import invalidate_order_books
 from server.services.pending_actions import execute_pending_action
+from server.services.profile_cache import invalidate_profiles
 
 router = APIRouter(prefix="/pending-actions", tags=["pending-actions"])
 
 
-def normalize_datetime(dt: datetime) -> datetime:
-    """Normalize datetime to timezone-naive UTC for comparison."""
-    if dt is None:
-        return None
-    if dt.tzinfo is not None:
-        # Convert timezone-aware to timezone-naive UTC
-        return dt.replace(tzinfo=None)
-    return dt
-
-
 @router.get("", response_model=PendingActionListResponse)
 async def list_pending_actions(
     agent_id: UUID = Query(..., description="Agent ID to list actions for"),
@@ -48,7 +41,10 @@ async def list_pending_actions(
     # Build query
     query = select(PendingAction).where(PendingAction.agent_id == agent_id)
 
-    if status:
+    if status == ActionStatus.PENDING:
+        # Live actions only; expired rows still marked pending are left to the sweeper
+        query = query.where(PendingAction.is_pending)
+    elif status:
         query = query.where(PendingAction.status == status)
     if action_type:
         query = query.where(PendingAction.action_type == action_type)
@@ -59,11 +55,8 @@ async def list_pending_actions(
     actions = result.scalars().all()
 
     # Mark expired actions
-    now = datetime.utcnow()
     for action in actions:
-        # Normalize expires_at to timezone-naive for comparison
-        expires_at_naive = normalize_datetime(action.expires_at)
-        if action.status == ActionStatus.PENDING and expires_at_naive and expires_at_naive < now:
+        if action.status == ActionStatus.PENDING and action.is_expired:
             action.status = ActionStatus.EXPIRED
             session.add(action)
 
@@ -95,9 +88,7 @@ async def get_pending_action(
         raise HTTPException(status_code=403, detail="Not authorized to view this action")
 
     # Check and update expiry
-    now = datetime.utcnow()
-    expires_at_naive = normalize_datetime(action.expires_at)
-    if action.status == ActionStatus.PENDING and expires_at_naive and expires_at_naive < now:
+    if action.status == ActionStatus.PENDING and action.is_expired:
         action.status = ActionStatus.EXPIRED
         session.add(action)
         await session.commit()
@@ -121,14 +112,13 @@ async def approve_pending_action(
         raise HTTPException(status_code=403, detail="Not authorized to approve this action")
 
     # Check if can be reviewed
-    now = datetime.utcnow()
+    now = datetime.now(UTC)
     if action.status != ActionStatus.PENDING:
         raise HTTPException(
             status_code=400, detail=f"Action cannot be approved. Current status: {action.status}"
         )
 
-    expires_at_naive = normalize_datetime(action.expires_at)
-    if expires_at_naive and expires_at_naive < now:
+    if action.is_expired:
         action.status = ActionStatus.EXPIRED
         session.add(action)
         await session.commit()
@@ -143,8 +133,13 @@ async def approve_pending_action(
         session.add(action)
         await session.commit()
         await session.refresh(action)
+        market_list_cache.invalidate()
+        if market_id := result.get("market_id"):
+            await invalidate_order_books(UUID(market_id))
+        await invalidate_profiles(agent_id)
     except Exception as e:
-        # If execution fails, keep as pending but return error
+        # If execution fails, undo its partial changes and keep the action pending
+        await session.rollback()
         raise HTTPException(status_code=400, detail=f"Failed to execute action: {e!s}") from e
 
     return PendingActionResponse.model_validate(action)
@@ -167,14 +162,13 @@ async def reject_pending_action(
         raise HTTPException(status_code=403, detail="Not authorized to reject this action")
 
     # Check if can be reviewed
-    now = datetime.utcnow()
+    now = datetime.now(UTC)
     if action.status != ActionStatus.PENDING:
         raise HTTPException(
             status_code=400, detail=f"Action cannot be rejected. Current status: {action.status}"
         )
 
-    expires_at_naive = normalize_datetime(action.expires_at)
-    if expires_at_naive and expires_at_naive < now:
+    if action.is_expired:
         action.status = ActionStatus.EXPIRED
         session.add(action)
         await session.commit()
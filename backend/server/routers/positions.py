@@ -15,28 +15,33 @@ router = APIRouter(prefix="/positions", tags=["positions"])
 @router.get("", response_model=list[PositionResponse])
 async def list_positions(agent_id: UUID = Query(...), session: AsyncSession = Depends(get_session)):
     """Get all positions for an agent."""
-    result = await session.execute(select(Position).where(Position.agent_id == agent_id))
-    positions = result.scalars().all()
-
-    # Enrich with market info
-    responses = []
-    for pos in positions:
-        market_result = await session.execute(select(Market).where(Market.id == pos.market_id))
-        market = market_result.scalar_one_or_none()
-
-        responses.append(
-            PositionResponse(
-                market_id=pos.market_id,
-                question=market.question if market else None,
-                yes_shares=pos.yes_shares,
-                no_shares=pos.no_shares,
-                avg_yes_price=pos.avg_yes_price,
-                avg_no_price=pos.avg_no_price,
-                market_status=market.status.value if market else None,
-            )
+    # One joined query for the positions and the market fields they show
+    result = await session.execute(
+        select(
+            Position.market_id,
+            Market.question,
+            Position.yes_shares,
+            Position.no_shares,
+            Position.avg_yes_price,
+            Position.avg_no_price,
+            Market.status.label("market_status"),
         )
+        .outerjoin(Market, Market.id == Position.market_id)
+        .where(Position.agent_id == agent_id)
+    )
 
-    return responses
+    return [
+        PositionResponse.model_construct(
+            market_id=row.market_id,
+            question=row.question,
+            yes_shares=row.yes_shares,
+            no_shares=row.no_shares,
+            avg_yes_price=row.avg_yes_price,
+            avg_no_price=row.avg_no_price,
+            market_status=row.market_status.value if row.market_status else None,
+        )
+        for row in result
+    ]
 
 
 @router.get("/{agent_id}/{market_id}", response_model=PositionResponse)
@@ -44,27 +49,35 @@ async def get_position(
     agent_id: UUID, market_id: UUID, session: AsyncSession = Depends(get_session)
 ):
     """Get specific position for an agent in a market."""
+    # The position and the market fields it shows, in one joined query
     result = await session.execute(
-        select(Position).where(Position.agent_id == agent_id).where(Position.market_id == market_id)
+        select(
+            Position.market_id,
+            Market.question,
+            Position.yes_shares,
+            Position.no_shares,
+            Position.avg_yes_price,
+            Position.avg_no_price,
+            Market.status.label("market_status"),
+        )
+        .outerjoin(Market, Market.id == Position.market_id)
+        .where(Position.agent_id == agent_id)
+        .where(Position.market_id == market_id)
     )
-    position = result.scalar_one_or_none()
+    row = result.first()
 
-    if not position:
+    if not row:
         # Return empty position
         return PositionResponse(
             market_id=market_id, yes_shares=0, no_shares=0, avg_yes_price=None, avg_no_price=None
         )
 
-    # Get market info
-    market_result = await session.execute(select(Market).where(Market.id == market_id))
-    market = market_result.scalar_one_or_none()
-
     return PositionResponse(
-        market_id=position.market_id,
-        question=market.question if market else None,
-        yes_shares=position.yes_shares,
-        no_shares=position.no_shares,
-        avg_yes_price=position.avg_yes_price,
-        avg_no_price=position.avg_no_price,
-        market_status=market.status.value if market else None,
+        market_id=row.market_id,
+        question=row.question,
+        yes_shares=row.yes_shares,
+        no_shares=row.no_shares,
+        avg_yes_price=row.avg_yes_price,
+        avg_no_price=row.avg_no_price,
+        market_status=row.market_status.value if row.market_status else None,
     )
@@ -2,11 +2,12 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import or_, select
+from sqlmodel import select
 
 from server.database import get_session
 from server.models.trade import Trade
 from server.schemas.order import TradeResponse
+from server.services.trade_history import agent_trades_query
 
 router = APIRouter(prefix="/trades", tags=["trades"])
 
@@ -19,14 +20,13 @@ async def list_trades(
     session: AsyncSession = Depends(get_session),
 ):
     """List trades with optional filters."""
-    query = select(Trade)
-
-    if market_id:
-        query = query.where(Trade.market_id == market_id)
     if agent_id:
-        query = query.where(or_(Trade.buyer_id == agent_id, Trade.seller_id == agent_id))
-
-    query = query.order_by(Trade.created_at.desc()).limit(limit)
+        query = agent_trades_query(agent_id, limit, market_id=market_id)
+    else:
+        query = select(Trade)
+        if market_id:
+            query = query.where(Trade.market_id == market_id)
+        query = query.order_by(Trade.created_at.desc()).limit(limit)
 
     result = await session.execute(query)
     return result.scalars().all()
@@ -1,7 +1,8 @@
 from decimal import Decimal
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
@@ -126,8 +127,7 @@ async def get_transactions(
 
         # Fetch market question if present
         if tx.market_id:
-            market_result = await session.execute(select(Market).where(Market.id == tx.market_id))
-            market = market_result.scalar_one_or_none()
+            market = await session.get(Market, tx.market_id)
             if market:
                 tx_dict.market_question = market.question[:100]
 
@@ -226,33 +226,39 @@ async def transfer_tokens(
     sender.balance -= request.amount
     recipient.balance += request.amount
 
-    # Create transactions for both parties
-    sender_tx = Transaction(
-        wallet_id=sender_wallet.id,
-        agent_id=sender.id,
-        type=TransactionType.TRANSFER_OUT,
-        amount=-request.amount,
-        balance_after=sender.balance,
-        counterparty_id=recipient.id,
-        description=request.description or f"Transfer to {recipient.name}",
+    # Record both sides in one executemany INSERT, without building ORM objects.
+    # Both rows must bind the same keys, or the rows are sent as separate INSERTs.
+    sender_tx_id = uuid4()
+    await session.execute(
+        insert(Transaction),
+        [
+            {
+                "id": sender_tx_id,
+                "wallet_id": sender_wallet.id,
+                "agent_id": sender.id,
+                "type": TransactionType.TRANSFER_OUT,
+                "amount": -request.amount,
+                "balance_after": sender.balance,
+                "counterparty_id": recipient.id,
+                "description": request.description or f"Transfer to {recipient.name}",
+            },
+            {
+                "id": uuid4(),
+                "wallet_id": recipient_wallet.id,
+                "agent_id": recipient.id,
+                "type": TransactionType.TRANSFER_IN,
+                "amount": request.amount,
+                "balance_after": recipient.balance,
+                "counterparty_id": sender.id,
+                "description": request.description or f"Transfer from {sender.name}",
+            },
+        ],
     )
-    session.add(sender_tx)
-
-    recipient_tx = Transaction(
-        wallet_id=recipient_wallet.id,
-        agent_id=recipient.id,
-        type=TransactionType.TRANSFER_IN,
-        amount=request.amount,
-        balance_after=recipient.balance,
-        counterparty_id=sender.id,
-        description=request.description or f"Transfer from {sender.name}",
-    )
-    session.add(recipient_tx)
 
     await session.commit()
 
     return TransferResponse(
-        transaction_id=sender_tx.id,
+        transaction_id=sender_tx_id,
         from_address=sender_wallet.internal_address,
         to_address=recipient_wallet.internal_address,
         amount=request.amount,
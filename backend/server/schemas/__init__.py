@@ -11,6 +11,7 @@ from server.schemas.order import (
     OrderCreate,
     OrderResponse,
     PlaceOrderResponse,
+    TradeAdminResponse,
     TradeResponse,
 )
 from server.schemas.pending_action import (
@@ -43,5 +44,6 @@ __all__ = [
     "PendingActionResult",
     "PlaceOrderResponse",
     "PositionResponse",
+    "TradeAdminResponse",
     "TradeResponse",
 ]
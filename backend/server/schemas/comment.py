@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CommentCreate(BaseModel):
@@ -46,6 +46,8 @@ class PositionInfo(BaseModel):
 class CommentResponse(BaseModel):
     """Comment response with nested replies."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     market_id: UUID
     agent: AgentBasicInfo
@@ -66,17 +68,15 @@ class CommentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class CommentListResponse(BaseModel):
     """List of comments with pagination."""
 
     comments: list[CommentResponse]
-    total: int
+    total: int | None  # Only counted for the first page, not when paging by cursor
     limit: int
     offset: int
+    next_cursor: str | None = None  # Pass as ``cursor`` to get the next page
 
 
 # Update forward reference
@@ -2,9 +2,10 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
 from server.models.market import MarketCategory, MarketStatus, Outcome
+from server.models.types import as_utc
 
 
 class MarketCreate(BaseModel):
@@ -16,6 +17,12 @@ class MarketCreate(BaseModel):
     category: MarketCategory = Field(default=MarketCategory.TECH)
     deadline: datetime
 
+    @field_validator("deadline")
+    @classmethod
+    def deadline_as_utc(cls, value: datetime) -> datetime:
+        """Treat naive deadlines as UTC."""
+        return as_utc(value)
+
 
 class MarketResponse(BaseModel):
     """Market details response."""
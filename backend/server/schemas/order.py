@@ -60,6 +60,19 @@ class TradeResponse(BaseModel):
         return float(value)
 
 
+class TradeAdminResponse(TradeResponse):
+    """Trade details including fees, for admin listings."""
+
+    buyer_fee: Decimal
+    seller_fee: Decimal
+    total_fee: Decimal
+
+    @field_serializer("buyer_fee", "seller_fee", "total_fee")
+    def serialize_fee(self, value: Decimal) -> float:
+        """Serialize Decimal fees as float for JSON."""
+        return float(value)
+
+
 class PlaceOrderResponse(BaseModel):
     """Response after placing an order."""
 
@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from server.models.pending_action import ActionStatus, ActionType
 
@@ -19,6 +19,8 @@ class PendingActionCreate(BaseModel):
 class PendingActionResponse(BaseModel):
     """Response schema for a pending action."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     agent_id: UUID
     action_type: ActionType
@@ -30,9 +32,6 @@ class PendingActionResponse(BaseModel):
     rejection_reason: str | None = None
     result_data: dict | None = None
 
-    class Config:
-        from_attributes = True
-
 
 class PendingActionListResponse(BaseModel):
     """Response for listing pending actions."""
@@ -0,0 +1,25 @@
+"""
+Agent registration helpers.
+"""
+
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.models.agent import Agent
+
+
+async def insert_agent(session: AsyncSession, agent: Agent) -> None:
+    """
+    Insert a new agent added to ``session``, rejecting taken names.
+
+    The unique name index does the check as part of the INSERT, so there is no
+    separate lookup and two concurrent registrations can't both take a name.
+
+    Raises HTTPException 400 if the name already exists.
+    """
+    try:
+        await session.flush()
+    except IntegrityError as e:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail="Agent name already exists") from e
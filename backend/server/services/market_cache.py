@@ -0,0 +1,181 @@
+"""
+Market micro-caches.
+
+Keeps rendered v1 market list pages in process for a couple of seconds so
+polling agents don't each run the list query. Pages are dropped whenever a bet,
+market creation or resolution changes market data.
+
+Also keeps a short-lived snapshot of each traded market's status and prices,
+so placing a bet doesn't need its own market SELECT. Snapshots are dropped when
+prices move or the market is resolved or closed.
+
+Markets are never deleted, so ids seen to exist are remembered for the life of
+the process and existence checks skip their SELECT.
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from server.config import settings
+from server.models.market import Market, MarketStatus
+
+# Lets shared caches serve polls for a moment and revalidate in the background
+MARKET_CACHE_CONTROL = "public, max-age=2, stale-while-revalidate=10"
+MAX_CACHED_PAGES = 1024
+MAX_KNOWN_MARKETS = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPage:
+    """A rendered page, its validator and the cursor for the page after it."""
+
+    content: bytes
+    etag: str
+    next_cursor: str | None
+    expires_at: float
+
+
+class MarketListCache:
+    """Rendered market list pages keyed by their query parameters."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._pages: dict[tuple, CachedPage] = {}
+
+    def get(self, key: tuple) -> CachedPage | None:
+        page = self._pages.get(key)
+        if page is None or page.expires_at <= time.monotonic():
+            return None
+        return page
+
+    def put(self, key: tuple, content: bytes, next_cursor: str | None = None) -> CachedPage:
+        if len(self._pages) >= MAX_CACHED_PAGES:
+            self._pages.clear()
+        page = CachedPage(content, content_etag(content), next_cursor, time.monotonic() + self.ttl)
+        self._pages[key] = page
+        return page
+
+    def invalidate(self) -> None:
+        """Drop every page after market data changed."""
+        self._pages.clear()
+
+
+market_list_cache = MarketListCache(settings.MARKET_LIST_CACHE_TTL)
+
+
+@dataclass(frozen=True, slots=True)
+class MarketSnapshot:
+    """The market fields a bet is checked and priced against."""
+
+    status: MarketStatus
+    deadline: datetime
+    yes_price: Decimal
+    no_price: Decimal
+    expires_at: float
+
+
+class MarketSnapshotCache:
+    """Market snapshots keyed by market id."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._snapshots: dict[UUID, MarketSnapshot] = {}
+
+    def get(self, market_id: UUID) -> MarketSnapshot | None:
+        snapshot = self._snapshots.get(market_id)
+        if snapshot is None or snapshot.expires_at <= time.monotonic():
+            return None
+        return snapshot
+
+    def put(
+        self,
+        market_id: UUID,
+        status: MarketStatus,
+        deadline: datetime,
+        yes_price: Decimal,
+        no_price: Decimal,
+    ) -> MarketSnapshot:
+        if len(self._snapshots) >= MAX_CACHED_PAGES:
+            self._snapshots.clear()
+        snapshot = MarketSnapshot(
+            status, deadline, yes_price, no_price, time.monotonic() + self.ttl
+        )
+        self._snapshots[market_id] = snapshot
+        return snapshot
+
+    def invalidate(self, market_id: UUID | None = None) -> None:
+        """Drop one market's snapshot, or every snapshot."""
+        if market_id is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(market_id, None)
+
+
+market_snapshot_cache = MarketSnapshotCache(settings.MARKET_SNAPSHOT_CACHE_TTL)
+
+
+async def get_market_snapshot(session: AsyncSession, market_id: UUID) -> MarketSnapshot | None:
+    """Cached snapshot of a market, or None if it doesn't exist."""
+    snapshot = market_snapshot_cache.get(market_id)
+    if snapshot is not None:
+        return snapshot
+
+    result = await session.execute(
+        select(Market.status, Market.deadline, Market.yes_price, Market.no_price).where(
+            Market.id == market_id
+        )
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return market_snapshot_cache.put(market_id, *row)
+
+
+# Ids of markets known to exist; never stale since markets are never deleted
+_known_market_ids: set[UUID] = set()
+
+
+def clear_known_markets() -> None:
+    """Forget which markets are known to exist."""
+    _known_market_ids.clear()
+
+
+async def market_exists(session: AsyncSession, market_id: UUID) -> bool:
+    """Whether a market exists, querying only the first time an id is seen."""
+    if market_id in _known_market_ids or market_snapshot_cache.get(market_id) is not None:
+        return True
+    if await session.scalar(select(Market.id).where(Market.id == market_id)) is None:
+        return False
+    if len(_known_market_ids) >= MAX_KNOWN_MARKETS:
+        _known_market_ids.clear()
+    _known_market_ids.add(market_id)
+    return True
+
+
+def content_etag(content: bytes) -> str:
+    """Weak ETag derived from a rendered response body."""
+    return f'W/"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Whether an If-None-Match header matches ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def cacheable_json_response(content: bytes, etag: str, if_none_match: str | None) -> Response:
+    """JSON response with caching headers, or 304 if the client has this version."""
+    headers = {"ETag": etag, "Cache-Control": MARKET_CACHE_CONTROL}
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content, media_type="application/json", headers=headers)
@@ -1,7 +1,7 @@
-from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -9,9 +9,11 @@ from server.config import settings
 from server.models.agent import Agent
 from server.models.market import Market
 from server.models.order import Order, OrderStatus, OrderType, Side
-from server.models.platform import FeeType, PlatformFee, PlatformStats
+from server.models.platform import FeeType, PlatformFee
 from server.models.position import Position
 from server.models.trade import Trade
+from server.services.market_cache import market_snapshot_cache
+from server.services.platform_stats import record_deltas
 
 
 async def match_order(session: AsyncSession, order: Order) -> list[Trade]:
@@ -211,9 +213,15 @@ async def match_order(session: AsyncSession, order: Order) -> list[Trade]:
             session, trade, buyer_id, seller_id, buyer_fee, seller_fee, order.market_id
         )
 
-    # Update market prices if trades occurred
+    # Update market prices and platform stats once for the whole match, not per fill
     if trades:
         await update_market_price(session, order.market_id, trades[-1].price)
+        await update_platform_stats(
+            session,
+            trading_fee=sum((trade.total_fee for trade in trades), Decimal("0.00")),
+            volume=sum((trade.price * trade.size for trade in trades), Decimal("0.00")),
+            trade_count=len(trades),
+        )
 
     return trades
 
@@ -321,7 +329,11 @@ async def record_trading_fee(
     seller_fee: Decimal,
     market_id: UUID,
 ):
-    """Record trading fees in platform ledger."""
+    """
+    Record trading fees in platform ledger.
+
+    Platform stats are updated once per match by match_order, not per fill.
+    """
     if buyer_fee > 0:
         buyer_fee_record = PlatformFee(
             fee_type=FeeType.TRADING,
@@ -344,9 +356,6 @@ async def record_trading_fee(
         )
         session.add(seller_fee_record)
 
-    # Update platform stats
-    await update_platform_stats(session, trading_fee=buyer_fee + seller_fee, trade_count=1)
-
 
 async def update_platform_stats(
     session: AsyncSession,
@@ -357,34 +366,44 @@ async def update_platform_stats(
     trade_count: int = 0,
     markets_created: int = 0,
     markets_resolved: int = 0,
+    *,
+    open_markets: int = 0,
+    agents_created: int = 0,
+    traders_created: int = 0,
+    moderators_created: int = 0,
 ):
-    """Update aggregated platform statistics."""
-    result = await session.execute(
-        select(PlatformStats).where(PlatformStats.id == 1).with_for_update()
-    )
-    stats = result.scalar_one_or_none()
-
-    if not stats:
-        stats = PlatformStats(id=1)
-        session.add(stats)
+    """
+    Update aggregated platform statistics.
 
-    stats.total_trading_fees += trading_fee
-    stats.total_market_creation_fees += market_creation_fee
-    stats.total_settlement_fees += settlement_fee
-    stats.total_volume += volume
-    stats.total_trades += trade_count
-    stats.total_markets_created += markets_created
-    stats.total_markets_resolved += markets_resolved
-    stats.updated_at = datetime.utcnow()
+    The deltas are buffered and applied to the stats row once the session's
+    transaction commits (see services/platform_stats), so callers never lock
+    the row.
+    """
+    record_deltas(
+        session,
+        {
+            "total_trading_fees": trading_fee,
+            "total_market_creation_fees": market_creation_fee,
+            "total_settlement_fees": settlement_fee,
+            "total_volume": volume,
+            "total_trades": trade_count,
+            "total_markets_created": markets_created,
+            "total_markets_resolved": markets_resolved,
+            "open_markets": open_markets,
+            "total_agents": agents_created,
+            "total_traders": traders_created,
+            "total_moderators": moderators_created,
+        },
+    )
 
 
 async def update_market_price(session: AsyncSession, market_id: UUID, last_price: Decimal):
     """Update market prices based on last trade."""
-    result = await session.execute(select(Market).where(Market.id == market_id).with_for_update())
-    market = result.scalar_one()
+    market = await session.get(Market, market_id, with_for_update=True)
 
     market.yes_price = last_price
     market.no_price = Decimal("1.00") - last_price
+    market_snapshot_cache.invalidate(market_id)
 
 
 async def lock_balance_for_order(
@@ -393,21 +412,37 @@ async def lock_balance_for_order(
     """
     Lock balance for a new order.
     Returns True if successful, False if insufficient balance.
+
+    The balance check and the lock are one conditional UPDATE, so concurrent
+    orders from the same agent can't both pass the check.
     """
     cost = price * size
 
-    result = await session.execute(select(Agent).where(Agent.id == agent_id).with_for_update())
-    agent = result.scalar_one_or_none()
+    result = await session.execute(
+        update(Agent)
+        .where(Agent.id == agent_id, Agent.available_balance >= cost)
+        .values(locked_balance=Agent.locked_balance + cost)
+        .returning(Agent.id),
+        execution_options={"synchronize_session": "fetch"},
+    )
+    return result.first() is not None
 
-    if not agent:
-        return False
 
-    available = agent.balance - agent.locked_balance
-    if available < cost:
-        return False
+async def charge_fee(session: AsyncSession, agent_id: UUID, amount: Decimal) -> bool:
+    """
+    Deduct a fee from an agent's available balance.
+    Returns True if successful, False if insufficient balance.
 
-    agent.locked_balance += cost
-    return True
+    Like lock_balance_for_order, the check and the deduction are one UPDATE.
+    """
+    result = await session.execute(
+        update(Agent)
+        .where(Agent.id == agent_id, Agent.available_balance >= amount)
+        .values(balance=Agent.balance - amount)
+        .returning(Agent.id),
+        execution_options={"synchronize_session": "fetch"},
+    )
+    return result.first() is not None
 
 
 async def unlock_balance_for_cancelled_order(
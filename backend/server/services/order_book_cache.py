@@ -0,0 +1,58 @@
+"""
+Order book cache.
+
+Keeps each market's rendered order book in Redis for about a second so
+traders polling a busy market share one aggregation query. Books are dropped
+whenever an order on the market is placed, matched, cancelled or settled.
+Caching is disabled when REDIS_URL is not set or the redis package is not
+installed, and Redis errors are logged and treated as cache misses.
+"""
+
+import logging
+from uuid import UUID
+
+from server.config import settings
+from server.services.redis_client import RedisError, get_redis
+
+logger = logging.getLogger(__name__)
+
+
+def order_book_key(market_id: UUID) -> str:
+    """Redis key for a market's cached order book."""
+    return f"orderbook:{market_id}"
+
+
+async def get_cached_order_book(market_id: UUID) -> bytes | None:
+    """Return the cached order book JSON for a market, if any."""
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        return await redis.get(order_book_key(market_id))
+    except RedisError:
+        logger.warning("Order book cache read failed", exc_info=True)
+        return None
+
+
+async def cache_order_book(market_id: UUID, content: str | bytes) -> None:
+    """Cache a market's rendered order book JSON for ORDER_BOOK_CACHE_TTL seconds."""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(
+            order_book_key(market_id), content, px=int(settings.ORDER_BOOK_CACHE_TTL * 1000)
+        )
+    except RedisError:
+        logger.warning("Order book cache write failed", exc_info=True)
+
+
+async def invalidate_order_books(*market_ids: UUID) -> None:
+    """Drop cached order books for markets whose orders changed."""
+    redis = get_redis()
+    if redis is None or not market_ids:
+        return
+    try:
+        await redis.delete(*{order_book_key(market_id) for market_id in market_ids})
+    except RedisError:
+        logger.warning("Order book cache invalidation failed", exc_info=True)
@@ -0,0 +1,92 @@
+"""
+Background order matching.
+
+Matching walks the order book and writes trades, so v1 bets placed with
+``execute="async"`` are only saved as PENDING orders with their balance
+locked. Pending orders stay out of the order book; the matching worker
+matches them oldest first, each in its own transaction, claiming rows with
+SKIP LOCKED so several workers can share the queue.
+"""
+
+import asyncio
+import logging
+from contextlib import suppress
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from server.database import async_session
+from server.models.order import Order, OrderStatus
+from server.services.market_cache import market_list_cache
+from server.services.matching import match_order
+from server.services.order_book_cache import invalidate_order_books
+from server.services.profile_cache import invalidate_profiles
+
+logger = logging.getLogger(__name__)
+
+# Set when an order is queued so the worker in this process starts at once
+_wakeup = asyncio.Event()
+
+
+def notify_matching_worker() -> None:
+    """Wake the matching worker after queueing an order."""
+    _wakeup.set()
+
+
+async def match_pending_order(session: AsyncSession, order: Order) -> None:
+    """Match a claimed pending order against the book and commit."""
+    order.status = OrderStatus.OPEN
+    # Matching also moves the market price to the last fill
+    trades = await match_order(session, order)
+    await session.commit()
+
+    await invalidate_order_books(order.market_id)
+    await invalidate_profiles(
+        order.agent_id,
+        *(agent_id for trade in trades for agent_id in (trade.buyer_id, trade.seller_id)),
+    )
+
+
+async def process_pending_orders(session: AsyncSession) -> int:
+    """
+    Match queued orders until none are left.
+
+    Returns the number matched.
+    """
+    matched = 0
+    while True:
+        result = await session.execute(
+            select(Order)
+            .where(Order.status == OrderStatus.PENDING)
+            .order_by(Order.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        order = result.scalar_one_or_none()
+        if order is None:
+            # End the claim query's transaction
+            await session.commit()
+            return matched
+
+        await match_pending_order(session, order)
+        matched += 1
+
+
+async def run_matching_worker(interval_seconds: float) -> None:
+    """
+    Match queued orders when woken, or every ``interval_seconds``.
+
+    Runs until cancelled; errors are logged and retried on the next tick.
+    """
+    while True:
+        with suppress(TimeoutError):
+            await asyncio.wait_for(_wakeup.wait(), interval_seconds)
+        _wakeup.clear()
+        try:
+            async with async_session() as session:
+                matched = await process_pending_orders(session)
+            if matched:
+                market_list_cache.invalidate()
+                logger.info(f"Matching worker: {matched} orders matched")
+        except Exception:
+            logger.exception("Matching worker failed")
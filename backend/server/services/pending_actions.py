@@ -2,14 +2,18 @@
 Pending Actions Service - Execute approved actions.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import delete, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from server.database import async_session
 from server.models import (
     ActionStatus,
     ActionType,
@@ -24,6 +28,8 @@ from server.models import (
 from server.services.matching import match_order
 from server.services.position_validator import can_sell_shares
 
+logger = logging.getLogger(__name__)
+
 
 async def create_pending_action(
     session: AsyncSession,
@@ -37,7 +43,7 @@ async def create_pending_action(
         agent_id=agent_id,
         action_type=action_type,
         action_payload=payload,
-        expires_at=datetime.utcnow() + timedelta(hours=expires_in_hours),
+        expires_at=datetime.now(UTC) + timedelta(hours=expires_in_hours),
     )
     session.add(action)
     await session.commit()
@@ -49,7 +55,12 @@ async def execute_pending_action(
     session: AsyncSession,
     action: PendingAction,
 ) -> dict[str, Any]:
-    """Execute an approved pending action and return the result."""
+    """
+    Execute an approved pending action and return the result.
+
+    Changes are flushed but not committed, so the caller commits them together
+    with the action's new status in one transaction.
+    """
 
     if action.action_type == ActionType.PLACE_ORDER:
         return await _execute_place_order(session, action)
@@ -118,14 +129,14 @@ async def _execute_place_order(
         status=OrderStatus.OPEN,
     )
     session.add(order)
-    await session.commit()
-    await session.refresh(order)
+    await session.flush()
 
     # Match order
     trades = await match_order(session, order)
 
     return {
         "order_id": str(order.id),
+        "market_id": str(order.market_id),
         "order_type": order_type.value,
         "status": order.status.value,
         "trades_count": len(trades),
@@ -148,7 +159,7 @@ async def _execute_cancel_order(
         raise ValueError("Order not found")
     if order.agent_id != agent_id:
         raise ValueError("Order does not belong to this agent")
-    if order.status not in [OrderStatus.OPEN, OrderStatus.PARTIAL]:
+    if order.status not in [OrderStatus.PENDING, OrderStatus.OPEN, OrderStatus.PARTIAL]:
         raise ValueError(f"Cannot cancel order with status: {order.status}")
 
     # Calculate refund
@@ -163,10 +174,10 @@ async def _execute_cancel_order(
     # Update order status
     order.status = OrderStatus.CANCELLED
     session.add(order)
-    await session.commit()
 
     return {
         "order_id": str(order.id),
+        "market_id": str(order.market_id),
         "refunded": float(refund_amount),
         "shares_cancelled": unfilled,
     }
@@ -203,7 +214,6 @@ async def _execute_transfer(
 
     session.add(from_agent)
     session.add(to_agent)
-    await session.commit()
 
     return {
         "from_agent": str(from_agent_id),
@@ -214,21 +224,62 @@ async def _execute_transfer(
 
 async def expire_old_actions(session: AsyncSession) -> int:
     """Mark expired pending actions. Returns count of expired actions."""
-    now = datetime.utcnow()
-    query = select(PendingAction).where(
-        PendingAction.status == ActionStatus.PENDING,
-        PendingAction.expires_at < now,
+    now = datetime.now(UTC)
+    result = await session.execute(
+        update(PendingAction)
+        .where(PendingAction.status == ActionStatus.PENDING, PendingAction.expires_at < now)
+        .values(status=ActionStatus.EXPIRED)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+async def purge_finished_actions(
+    session: AsyncSession, retention_days: int, batch_size: int = 500
+) -> int:
+    """
+    Delete approved, rejected and expired actions older than the retention window.
+
+    Rows are deleted in batches of ``batch_size`` with a commit after each, so
+    no single statement holds locks on a large part of the table. Expired
+    actions were never reviewed, so their expiry time is used as their age.
+
+    Returns:
+        Number of deleted actions
+    """
+    cutoff = datetime.now(UTC) - timedelta(days=retention_days)
+    batch = (
+        select(PendingAction.id)
+        .where(
+            PendingAction.status != ActionStatus.PENDING,
+            func.coalesce(PendingAction.reviewed_at, PendingAction.expires_at) < cutoff,
+        )
+        .limit(batch_size)
     )
-    result = await session.execute(query)
-    actions = result.scalars().all()
-
-    count = 0
-    for action in actions:
-        action.status = ActionStatus.EXPIRED
-        session.add(action)
-        count += 1
 
-    if count > 0:
+    deleted = 0
+    while True:
+        result = await session.execute(delete(PendingAction).where(PendingAction.id.in_(batch)))
         await session.commit()
-
-    return count
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+
+
+async def run_pending_action_sweeper(interval_seconds: float, retention_days: int) -> None:
+    """
+    Periodically expire stale pending actions and purge old finished ones.
+
+    Runs until cancelled; errors are logged and retried on the next tick.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with async_session() as session:
+                expired = await expire_old_actions(session)
+                purged = await purge_finished_actions(session, retention_days)
+            if expired or purged:
+                logger.info(f"Pending action sweep: {expired} expired, {purged} purged")
+        except Exception:
+            logger.exception("Pending action sweep failed")
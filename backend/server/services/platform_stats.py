@@ -0,0 +1,130 @@
+"""
+Buffered platform statistics.
+
+Every trade, market and agent bumps counters on the single platform_stats row.
+Updating that row inside each request's transaction makes it a lock hotspot,
+so deltas are buffered instead: they are held per session transaction, merged
+into this process's buffer when the transaction commits (and dropped if it or
+the savepoint they were recorded in rolls back), and the stats flusher applies
+the buffer with one UPDATE every few seconds.
+
+Deltas buffered in a process that dies before its next flush are lost.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from decimal import Decimal
+
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from server.database import async_session
+from server.models.platform import PlatformStats
+from server.models.types import utc_now
+
+logger = logging.getLogger(__name__)
+
+# session.info key for deltas recorded in the session's open transaction
+_SESSION_DELTAS = "platform_stats_deltas"
+
+# Committed deltas waiting to be flushed: PlatformStats column -> increment
+_pending: Counter = Counter()
+
+
+def record_deltas(session: AsyncSession, increments: dict[str, Decimal | int]) -> None:
+    """Buffer counter increments until the session's transaction commits."""
+    sync_session = session.sync_session
+    # None before the session's first statement; a later commit still applies
+    transaction = sync_session.get_nested_transaction() or sync_session.get_transaction()
+    deltas = {name: delta for name, delta in increments.items() if delta}
+    if deltas:
+        sync_session.info.setdefault(_SESSION_DELTAS, []).append((transaction, deltas))
+
+
+def clear_pending_deltas() -> None:
+    """Discard committed deltas that have not been flushed."""
+    _pending.clear()
+
+
+@event.listens_for(Session, "after_commit")
+def _merge_committed_deltas(session: Session) -> None:
+    for _, deltas in session.info.pop(_SESSION_DELTAS, ()):
+        _pending.update(deltas)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_rolled_back_deltas(session: Session, previous_transaction: SessionTransaction) -> None:
+    recorded = session.info.get(_SESSION_DELTAS)
+    if not recorded:
+        return
+    if previous_transaction.parent is None:
+        recorded.clear()
+        return
+
+    def rolled_back(transaction: SessionTransaction | None) -> bool:
+        while transaction is not None:
+            if transaction is previous_transaction:
+                return True
+            transaction = transaction.parent
+        return False
+
+    recorded[:] = [entry for entry in recorded if not rolled_back(entry[0])]
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_uncommitted_deltas(session: Session, transaction: SessionTransaction) -> None:
+    # Anything left when the outermost transaction ends was never committed
+    if transaction.parent is None:
+        session.info.pop(_SESSION_DELTAS, None)
+
+
+async def flush_platform_stats(session: AsyncSession) -> bool:
+    """
+    Apply this process's buffered deltas to the stats row and commit.
+
+    Applies them with a single atomic UPDATE, creating the row on first use.
+    Returns whether there was anything to flush. On failure the deltas are put
+    back for the next flush.
+    """
+    if not _pending:
+        return False
+
+    increments = dict(_pending)
+    _pending.clear()
+    try:
+        values = {name: getattr(PlatformStats, name) + delta for name, delta in increments.items()}
+        values["updated_at"] = utc_now()
+        result = await session.execute(
+            update(PlatformStats).where(PlatformStats.id == 1).values(values)
+        )
+        if result.rowcount == 0:
+            session.add(PlatformStats(id=1, **increments))
+        await session.commit()
+    except BaseException:
+        _pending.update(increments)
+        raise
+    return True
+
+
+async def run_platform_stats_flusher(interval_seconds: float) -> None:
+    """
+    Flush buffered stats every ``interval_seconds``, and once more when cancelled.
+
+    Runs until cancelled; errors are logged and retried on the next tick.
+    """
+    try:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                async with async_session() as session:
+                    await flush_platform_stats(session)
+            except Exception:
+                logger.exception("Platform stats flush failed")
+    finally:
+        try:
+            async with async_session() as session:
+                await flush_platform_stats(session)
+        except Exception:
+            logger.exception("Final platform stats flush failed")
@@ -0,0 +1,55 @@
+"""
+Agent profile cache.
+
+Keeps rendered agent profiles in Redis for a few seconds so repeated profile
+views skip the aggregation queries. Caching is disabled when REDIS_URL is not
+set or the redis package is not installed, and Redis errors are logged and
+treated as cache misses.
+"""
+
+import logging
+from uuid import UUID
+
+from server.config import settings
+from server.services.redis_client import RedisError, get_redis
+
+logger = logging.getLogger(__name__)
+
+
+def profile_key(agent_id: UUID) -> str:
+    """Redis key for an agent's cached profile."""
+    return f"profile:{agent_id}"
+
+
+async def get_cached_profile(agent_id: UUID) -> bytes | None:
+    """Return the cached profile JSON for an agent, if any."""
+    redis = get_redis()
+    if redis is None:
+        return None
+    try:
+        return await redis.get(profile_key(agent_id))
+    except RedisError:
+        logger.warning("Profile cache read failed", exc_info=True)
+        return None
+
+
+async def cache_profile(agent_id: UUID, content: str | bytes) -> None:
+    """Cache an agent's rendered profile JSON for PROFILE_CACHE_TTL seconds."""
+    redis = get_redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(profile_key(agent_id), content, ex=settings.PROFILE_CACHE_TTL)
+    except RedisError:
+        logger.warning("Profile cache write failed", exc_info=True)
+
+
+async def invalidate_profiles(*agent_ids: UUID) -> None:
+    """Drop cached profiles for agents whose orders, trades or balances changed."""
+    redis = get_redis()
+    if redis is None or not agent_ids:
+        return
+    try:
+        await redis.delete(*{profile_key(agent_id) for agent_id in agent_ids})
+    except RedisError:
+        logger.warning("Profile cache invalidation failed", exc_info=True)
@@ -0,0 +1,97 @@
+"""
+Agent leaderboard rankings.
+
+On PostgreSQL the rankings are precomputed in the ``agent_rankings``
+materialized view, refreshed in the background. Agents registered since the
+last refresh, and SQLite databases, fall back to ranking live.
+"""
+
+import asyncio
+import logging
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import Column, Integer, MetaData, Select, Table, Uuid, func, text, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from server.database import async_session
+from server.models.agent import Agent
+from server.models.trade import Trade
+
+logger = logging.getLogger(__name__)
+
+STARTING_BALANCE = Decimal("1000.00")
+
+# Created by migration on PostgreSQL only; kept off SQLModel.metadata so
+# create_all never turns it into a table
+agent_rankings = Table(
+    "agent_rankings",
+    MetaData(),
+    Column("id", Uuid, primary_key=True),
+    Column("rank_by_profit", Integer),
+    Column("rank_by_balance", Integer),
+    Column("rank_by_reputation", Integer),
+    Column("rank_by_volume", Integer),
+)
+
+
+def live_rankings_query(agent_id: UUID) -> Select:
+    """Rank every agent in SQL, then keep only ``agent_id``'s row."""
+    trade_sides = union_all(
+        select(Trade.buyer_id.label("agent_id"), (Trade.price * Trade.size).label("notional")),
+        select(Trade.seller_id.label("agent_id"), (Trade.price * Trade.size).label("notional")),
+    ).subquery()
+    volumes = (
+        select(trade_sides.c.agent_id, func.sum(trade_sides.c.notional).label("volume"))
+        .group_by(trade_sides.c.agent_id)
+        .subquery()
+    )
+    volume = func.coalesce(volumes.c.volume, 0)
+    ranked = (
+        select(
+            Agent.id,
+            func.rank()
+            .over(order_by=(Agent.balance - STARTING_BALANCE).desc())
+            .label("rank_by_profit"),
+            func.rank().over(order_by=Agent.balance.desc()).label("rank_by_balance"),
+            func.rank().over(order_by=Agent.reputation.desc()).label("rank_by_reputation"),
+            func.rank().over(order_by=volume.desc()).label("rank_by_volume"),
+        )
+        .outerjoin(volumes, volumes.c.agent_id == Agent.id)
+        .subquery()
+    )
+    return select(ranked).where(ranked.c.id == agent_id)
+
+
+def rankings_query(session: AsyncSession, agent_id: UUID) -> Select:
+    """
+    Query for an agent's rankings: the materialized view on PostgreSQL, else live.
+
+    The view may not have a row for a new agent yet; callers fall back to
+    ``live_rankings_query`` when this returns no row.
+    """
+    if session.bind.dialect.name != "postgresql":
+        return live_rankings_query(agent_id)
+    return select(agent_rankings).where(agent_rankings.c.id == agent_id)
+
+
+async def refresh_agent_rankings(session: AsyncSession) -> None:
+    """Recompute the agent_rankings view without blocking readers."""
+    await session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY agent_rankings"))
+    await session.commit()
+
+
+async def run_rankings_refresher(interval_seconds: float) -> None:
+    """
+    Periodically refresh the agent_rankings materialized view.
+
+    Runs until cancelled; errors are logged and retried on the next tick.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with async_session() as session:
+                await refresh_agent_rankings(session)
+        except Exception:
+            logger.exception("Agent rankings refresh failed")
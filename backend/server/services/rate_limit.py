@@ -0,0 +1,232 @@
+"""
+Per-agent rate limiting.
+
+Each agent has a token bucket per scope:
+- general: 50 requests per minute
+- order: 10 orders per minute
+- market: 1 market creation per hour
+
+Buckets live in Redis, where refill and take happen in one atomic Lua script, so
+limits are shared across workers without touching the agent row. Without Redis
+(or when it is unreachable) buckets are kept in process memory instead.
+
+Each agent may also have only a few requests per scope in flight at once
+(general: 8, order: 4, market: 1), so a burst from one agent can't hold most of
+the database pool. In-flight requests are tracked as members of a Redis sorted
+set scored by start time, falling back to process memory like the buckets.
+
+Endpoints apply both limits through the ``rate_limit`` dependency.
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
+from functools import cache
+from uuid import UUID, uuid4
+
+from fastapi import Depends, HTTPException
+
+from server.middleware.auth import AgentAuth, get_agent_auth
+from server.models.agent import Agent
+from server.services.redis_client import RedisError, get_redis
+
+logger = logging.getLogger(__name__)
+
+# scope -> (bucket capacity, tokens refilled per second)
+SCOPES: dict[str, tuple[int, float]] = {
+    "general": (50, 50 / 60),
+    "order": (10, 10 / 60),
+    "market": (1, 1 / 3600),
+}
+
+LIMIT_MESSAGES = {
+    "general": "Rate limit exceeded. Maximum 50 requests per minute.",
+    "order": "Rate limit exceeded. Maximum 10 orders per minute.",
+    "market": "Rate limit exceeded. Maximum 1 market creation per hour.",
+}
+
+# scope -> requests an agent may have in flight at once
+CONCURRENCY_LIMITS: dict[str, int] = {
+    "general": 8,
+    "order": 4,
+    "market": 1,
+}
+
+# Seconds before an in-flight entry left behind by a crashed worker stops counting
+SLOT_TTL = 60
+
+# Refills the bucket, takes a token if one is available and returns
+# {allowed, tokens left}. Tokens are returned as a string because Lua numbers
+# are truncated to integers in replies. The key expires once the bucket is full.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("PEXPIRE", KEYS[1], math.max(1, math.ceil((capacity - tokens) / rate * 1000)))
+return {allowed, tostring(tokens)}
+"""
+
+# Drops expired in-flight entries and adds ARGV[3] if fewer than ARGV[1] remain.
+# Returns 1 if the request was admitted, 0 otherwise.
+ACQUIRE_SLOT_LUA = """
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local ttl = tonumber(ARGV[2])
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - ttl)
+if redis.call("ZCARD", KEYS[1]) >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call("ZADD", KEYS[1], now, ARGV[3])
+redis.call("EXPIRE", KEYS[1], ttl)
+return 1
+"""
+
+# In-process buckets used without Redis: key -> (tokens, monotonic timestamp),
+# least recently used first. Capped so idle agents don't accumulate forever; an
+# evicted bucket starts full again, which a long-idle bucket would be anyway.
+MAX_LOCAL_BUCKETS = 10_000
+_local_buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+# In-process in-flight requests used without Redis: key -> slot ids
+_local_slots: dict[str, set[str]] = {}
+
+
+def bucket_key(agent_id: UUID, scope: str) -> str:
+    """Redis key for an agent's bucket in a scope."""
+    return f"rl:{agent_id}:{scope}"
+
+
+def slots_key(agent_id: UUID, scope: str) -> str:
+    """Redis key for an agent's in-flight requests in a scope."""
+    return f"cl:{agent_id}:{scope}"
+
+
+@cache
+def _token_bucket_script():
+    """Token bucket script registered on the shared client (run via EVALSHA)."""
+    return get_redis().register_script(TOKEN_BUCKET_LUA)
+
+
+@cache
+def _acquire_slot_script():
+    """In-flight admission script registered on the shared client (run via EVALSHA)."""
+    return get_redis().register_script(ACQUIRE_SLOT_LUA)
+
+
+def _take_local(key: str, capacity: int, rate: float) -> tuple[bool, float]:
+    """Take a token from an in-process bucket."""
+    now = time.monotonic()
+    tokens, ts = _local_buckets.get(key, (capacity, now))
+    tokens = min(capacity, tokens + (now - ts) * rate)
+    allowed = tokens >= 1
+    if allowed:
+        tokens -= 1
+    _local_buckets[key] = (tokens, now)
+    _local_buckets.move_to_end(key)
+    while len(_local_buckets) > MAX_LOCAL_BUCKETS:
+        _local_buckets.popitem(last=False)
+    return allowed, tokens
+
+
+async def _take(key: str, capacity: int, rate: float) -> tuple[bool, float]:
+    """Take a token from a bucket, returning whether it was allowed and tokens left."""
+    if get_redis() is not None:
+        try:
+            allowed, tokens = await _token_bucket_script()(keys=[key], args=[capacity, rate])
+            return bool(allowed), float(tokens)
+        except RedisError:
+            logger.warning("Rate limit check failed, using in-process bucket", exc_info=True)
+    return _take_local(key, capacity, rate)
+
+
+async def _acquire_slot(key: str, limit: int, slot: str) -> bool:
+    """Record ``slot`` as in flight if fewer than ``limit`` are, returning whether it was."""
+    redis = get_redis()
+    if redis is not None:
+        try:
+            return bool(await _acquire_slot_script()(keys=[key], args=[limit, SLOT_TTL, slot]))
+        except RedisError:
+            logger.warning("Concurrency check failed, using in-process slots", exc_info=True)
+    slots = _local_slots.setdefault(key, set())
+    if len(slots) >= limit:
+        return False
+    slots.add(slot)
+    return True
+
+
+async def _release_slot(key: str, slot: str) -> None:
+    """Remove ``slot`` from the in-flight requests, wherever it was recorded."""
+    slots = _local_slots.get(key)
+    if slots is not None:
+        slots.discard(slot)
+        if not slots:
+            del _local_slots[key]
+    redis = get_redis()
+    if redis is not None:
+        try:
+            await redis.zrem(key, slot)
+        except RedisError:
+            # The entry stops counting once SLOT_TTL passes
+            logger.warning("Could not release concurrency slot", exc_info=True)
+
+
+async def check_rate_limit(agent: Agent | AgentAuth, scope: str = "general") -> None:
+    """
+    Take a token from the agent's bucket for ``scope``.
+
+    Raises HTTPException 429 with a Retry-After header if the bucket is empty.
+    """
+    capacity, rate = SCOPES[scope]
+    allowed, tokens = await _take(bucket_key(agent.id, scope), capacity, rate)
+    if not allowed:
+        raise HTTPException(
+            status_code=429,
+            detail=LIMIT_MESSAGES[scope],
+            headers={"Retry-After": str(math.ceil((1 - tokens) / rate))},
+        )
+
+
+def rate_limit(scope: str = "general", auth=get_agent_auth):
+    """
+    Dependency factory applying the ``scope`` limits to the agent resolved by ``auth``.
+
+    The dependency holds one of the agent's in-flight slots until the response
+    has been sent, takes a token and yields the agent, so endpoints can use it
+    in place of ``auth``. Authentication and role checks run first.
+
+    Raises HTTPException 429 if the agent has too many requests in flight or
+    its bucket is empty.
+    """
+
+    async def dependency(
+        agent: Agent | AgentAuth = Depends(auth),
+    ) -> AsyncGenerator[Agent | AgentAuth, None]:
+        key = slots_key(agent.id, scope)
+        slot = uuid4().hex
+        limit = CONCURRENCY_LIMITS[scope]
+        if not await _acquire_slot(key, limit, slot):
+            raise HTTPException(
+                status_code=429,
+                detail=f"Too many concurrent requests. Maximum {limit} in flight.",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            await check_rate_limit(agent, scope)
+            yield agent
+        finally:
+            await _release_slot(key, slot)
+
+    return dependency
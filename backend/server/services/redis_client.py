@@ -0,0 +1,25 @@
+"""
+Shared Redis client.
+
+Redis is optional: ``get_redis()`` returns None when REDIS_URL is not set or the
+redis package is not installed, and callers fall back to working without it.
+"""
+
+from functools import cache
+
+from server.config import settings
+
+try:
+    from redis.asyncio import Redis
+    from redis.exceptions import RedisError
+except ImportError:  # Redis is optional
+    Redis = None
+    RedisError = OSError
+
+
+@cache
+def get_redis() -> "Redis | None":
+    """Shared Redis client, or None when Redis is not configured."""
+    if Redis is None or not settings.REDIS_URL:
+        return None
+    return Redis.from_url(settings.REDIS_URL)
@@ -0,0 +1,165 @@
+"""
+Queued market resolution.
+
+Settling a market touches every open order and position on it, so the v1
+resolve endpoint only records a MarketResolution and returns. The resolution
+worker settles queued resolutions oldest first, each in its own transaction,
+claiming rows with SKIP LOCKED so several workers can share the queue.
+"""
+
+import asyncio
+import logging
+from contextlib import suppress
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from server.database import async_session
+from server.models.market import Market, MarketStatus, Outcome
+from server.models.market_resolution import MarketResolution, ResolutionStatus
+from server.models.types import utc_now
+from server.services.market_cache import market_list_cache
+from server.services.order_book_cache import invalidate_order_books
+from server.services.settlement import resolve_market
+
+logger = logging.getLogger(__name__)
+
+# Set when a resolution is queued so the worker in this process starts at once
+_wakeup = asyncio.Event()
+
+
+async def enqueue_resolution(
+    session: AsyncSession,
+    market_id: UUID,
+    outcome: Outcome,
+    moderator_id: UUID,
+    evidence: str | None = None,
+    *,
+    idempotency_key: str | None = None,
+) -> tuple[MarketResolution, bool]:
+    """
+    Queue a market resolution.
+
+    Returns the resolution and whether it was created; a repeated idempotency
+    key returns the moderator's earlier resolution instead. Raises ValueError
+    if the market can't be resolved.
+    """
+    if idempotency_key:
+        result = await session.execute(
+            select(MarketResolution)
+            .where(MarketResolution.moderator_id == moderator_id)
+            .where(MarketResolution.idempotency_key == idempotency_key)
+        )
+        existing = result.scalar_one_or_none()
+        if existing:
+            return existing, False
+
+    market = await session.get(Market, market_id)
+    if not market:
+        raise ValueError("Market not found")
+
+    if market.status == MarketStatus.RESOLVED:
+        raise ValueError("Market already resolved")
+
+    result = await session.execute(
+        select(MarketResolution.id)
+        .where(MarketResolution.market_id == market_id)
+        .where(MarketResolution.status == ResolutionStatus.PENDING)
+    )
+    if result.first():
+        raise ValueError("Market resolution already in progress")
+
+    resolution = MarketResolution(
+        market_id=market_id,
+        moderator_id=moderator_id,
+        outcome=outcome,
+        evidence=evidence,
+        idempotency_key=idempotency_key,
+    )
+    session.add(resolution)
+    await session.flush()
+    return resolution, True
+
+
+def notify_resolution_worker() -> None:
+    """Wake the resolution worker after queueing a resolution."""
+    _wakeup.set()
+
+
+async def settle_resolution(session: AsyncSession, resolution: MarketResolution) -> None:
+    """
+    Settle a claimed resolution, record the outcome and commit.
+
+    Any settlement error marks the resolution FAILED, so it leaves the queue.
+    """
+    try:
+        # Roll back a failed settlement without releasing the claim on the row
+        async with session.begin_nested():
+            summary = await resolve_market(
+                session,
+                resolution.market_id,
+                resolution.outcome,
+                resolution.moderator_id,
+                resolution.evidence,
+            )
+    except ValueError as e:
+        resolution.status = ResolutionStatus.FAILED
+        resolution.error = str(e)
+    except Exception as e:
+        # Fail the row rather than leave it at the head of the queue forever
+        logger.exception(f"Settling resolution {resolution.id} failed")
+        resolution.status = ResolutionStatus.FAILED
+        resolution.error = f"Settlement failed: {type(e).__name__}: {e}"[:500]
+    else:
+        resolution.status = ResolutionStatus.COMPLETED
+        resolution.result_data = summary
+
+    resolution.completed_at = utc_now()
+    await session.commit()
+    await invalidate_order_books(resolution.market_id)
+
+
+async def process_pending_resolutions(session: AsyncSession) -> int:
+    """
+    Settle queued resolutions until none are left.
+
+    Returns the number settled.
+    """
+    settled = 0
+    while True:
+        result = await session.execute(
+            select(MarketResolution)
+            .where(MarketResolution.status == ResolutionStatus.PENDING)
+            .order_by(MarketResolution.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        resolution = result.scalar_one_or_none()
+        if resolution is None:
+            # End the claim query's transaction
+            await session.commit()
+            return settled
+
+        await settle_resolution(session, resolution)
+        settled += 1
+
+
+async def run_resolution_worker(interval_seconds: float) -> None:
+    """
+    Settle queued resolutions when woken, or every ``interval_seconds``.
+
+    Runs until cancelled; errors are logged and retried on the next tick.
+    """
+    while True:
+        with suppress(TimeoutError):
+            await asyncio.wait_for(_wakeup.wait(), interval_seconds)
+        _wakeup.clear()
+        try:
+            async with async_session() as session:
+                settled = await process_pending_resolutions(session)
+            if settled:
+                market_list_cache.invalidate()
+                logger.info(f"Resolution worker: {settled} markets settled")
+        except Exception:
+            logger.exception("Resolution worker failed")
@@ -1,4 +1,3 @@
-from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
@@ -12,6 +11,8 @@ from server.models.moderator_reward import ModeratorReward
 from server.models.order import Order, OrderStatus
 from server.models.platform import FeeType, PlatformFee
 from server.models.position import Position
+from server.models.types import naive_utc_now, utc_now
+from server.services.market_cache import market_snapshot_cache
 from server.services.matching import update_platform_stats
 
 
@@ -35,8 +36,7 @@ async def resolve_market(
     Returns summary of resolution.
     """
     # Get market
-    result = await session.execute(select(Market).where(Market.id == market_id).with_for_update())
-    market = result.scalar_one_or_none()
+    market = await session.get(Market, market_id, with_for_update=True)
 
     if not market:
         raise ValueError("Market not found")
@@ -45,17 +45,19 @@ async def resolve_market(
         raise ValueError("Market already resolved")
 
     # Mark market as resolved
+    was_open = market.status == MarketStatus.OPEN
     market.status = MarketStatus.RESOLVED
     market.outcome = outcome
-    market.resolved_at = datetime.utcnow()
+    market.resolved_at = naive_utc_now()
     market.resolved_by = moderator_id
     market.resolution_evidence = evidence
+    market_snapshot_cache.invalidate(market_id)
 
     # Cancel all open orders and refund
     orders_result = await session.execute(
         select(Order)
         .where(Order.market_id == market_id)
-        .where(Order.status.in_([OrderStatus.OPEN, OrderStatus.PARTIAL]))
+        .where(Order.status.in_([OrderStatus.PENDING, OrderStatus.OPEN, OrderStatus.PARTIAL]))
         .with_for_update()
     )
     open_orders = orders_result.scalars().all()
@@ -179,7 +181,12 @@ async def resolve_market(
 
     # Update platform stats (subtract moderator share from platform earnings)
     net_platform_fee = total_settlement_fees - moderator_platform_share
-    await update_platform_stats(session, settlement_fee=net_platform_fee, markets_resolved=1)
+    await update_platform_stats(
+        session,
+        settlement_fee=net_platform_fee,
+        markets_resolved=1,
+        open_markets=-1 if was_open else 0,
+    )
 
     return {
         "market_id": str(market_id),
@@ -205,7 +212,7 @@ async def close_expired_markets(session: AsyncSession) -> int:
     Close markets that are past their deadline.
     Returns count of markets closed.
     """
-    now = datetime.utcnow()
+    now = utc_now()
 
     result = await session.execute(
         select(Market)
@@ -218,6 +225,10 @@ async def close_expired_markets(session: AsyncSession) -> int:
     count = 0
     for market in expired_markets:
         market.status = MarketStatus.CLOSED
+        market_snapshot_cache.invalidate(market.id)
         count += 1
 
+    if count:
+        await update_platform_stats(session, open_markets=-count)
+
     return count
@@ -0,0 +1,61 @@
+"""
+Trade history queries.
+
+Builds statements for looking up an agent's trades on either side of the book.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_, union_all
+from sqlalchemy.orm import aliased
+from sqlmodel import select
+
+from server.models.trade import Trade
+
+
+def agent_trades_query(
+    agent_id: UUID,
+    limit: int | None = None,
+    *,
+    offset: int = 0,
+    market_id: UUID | None = None,
+    after: tuple[datetime, UUID] | None = None,
+) -> Select:
+    """
+    Build a query for an agent's trades as buyer or seller, newest first.
+
+    Uses UNION ALL of a buyer_id branch and a seller_id branch instead of
+    ``buyer_id = ? OR seller_id = ?`` so each branch can use its own index.
+    With a limit, each branch is limited to ``offset + limit`` rows before the
+    merge. Self-trades are never matched, so the branches cannot overlap.
+    Trades are ordered by (created_at, id) so ``after`` can page by keyset.
+
+    Args:
+        agent_id: Agent whose trades to fetch
+        limit: Optional maximum number of trades
+        offset: Number of newest trades to skip (only applied with a limit)
+        market_id: Optional market to restrict the trades to
+        after: Optional (created_at, id) of the last trade already seen
+
+    Returns:
+        Select yielding Trade entities
+    """
+    branches = []
+    for column in (Trade.buyer_id, Trade.seller_id):
+        branch = select(Trade).where(column == agent_id)
+        if market_id is not None:
+            branch = branch.where(Trade.market_id == market_id)
+        if after is not None:
+            branch = branch.where(tuple_(Trade.created_at, Trade.id) < after)
+        if limit is not None:
+            branch = branch.order_by(Trade.created_at.desc(), Trade.id.desc()).limit(offset + limit)
+        # Wrap each branch so its ORDER BY/LIMIT is valid inside the compound select
+        branches.append(select(branch.subquery()))
+
+    combined = union_all(*branches).subquery()
+    trade = aliased(Trade, combined)
+    query = select(trade).order_by(combined.c.created_at.desc(), combined.c.id.desc())
+    if limit is not None:
+        query = query.offset(offset).limit(limit)
+    return query
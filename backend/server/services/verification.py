@@ -0,0 +1,88 @@
+"""
+Agent verification notifications.
+
+Lets GET /agents/status long-poll instead of re-querying the agent every second
+while a registration is pending. ``verify_agent`` publishes on a per-agent Redis
+channel and also sets a short-lived key, so a waiter that subscribes just after
+the verification still sees it. Without Redis, waiters in the same process are
+woken directly and others simply time out and re-read the agent.
+"""
+
+import asyncio
+import logging
+from contextlib import suppress
+from uuid import UUID
+
+from server.services.redis_client import RedisError, get_redis
+
+logger = logging.getLogger(__name__)
+
+# Seconds the verified marker key is kept for late subscribers
+VERIFIED_MARKER_TTL = 300
+
+# In-process waiters, woken by publish_verified in the same process
+_waiters: dict[UUID, set[asyncio.Event]] = {}
+
+
+def verified_channel(agent_id: UUID) -> str:
+    """Redis channel (and marker key) announcing an agent's verification."""
+    return f"agent:verified:{agent_id}"
+
+
+async def publish_verified(agent_id: UUID) -> None:
+    """Wake everyone waiting for this agent's verification."""
+    for event in _waiters.get(agent_id, ()):
+        event.set()
+
+    redis = get_redis()
+    if redis is None:
+        return
+    channel = verified_channel(agent_id)
+    try:
+        await redis.set(channel, 1, ex=VERIFIED_MARKER_TTL)
+        await redis.publish(channel, 1)
+    except RedisError:
+        logger.warning("Verification publish failed", exc_info=True)
+
+
+async def wait_for_verification(agent_id: UUID, timeout: float) -> bool:
+    """
+    Wait up to ``timeout`` seconds for an agent to be verified.
+
+    Returns True if a verification was announced, False on timeout. Callers
+    should re-read the agent either way.
+    """
+    event = asyncio.Event()
+    _waiters.setdefault(agent_id, set()).add(event)
+    try:
+        redis = get_redis()
+        if redis is not None:
+            try:
+                return await asyncio.wait_for(_wait_redis(redis, agent_id), timeout)
+            except TimeoutError:
+                return False
+            except RedisError:
+                logger.warning("Verification wait failed, waiting in process", exc_info=True)
+
+        with suppress(TimeoutError):
+            await asyncio.wait_for(event.wait(), timeout)
+        return event.is_set()
+    finally:
+        waiters = _waiters[agent_id]
+        waiters.discard(event)
+        if not waiters:
+            del _waiters[agent_id]
+
+
+async def _wait_redis(redis, agent_id: UUID) -> bool:
+    """Block until the agent's verification is announced on Redis."""
+    channel = verified_channel(agent_id)
+    async with redis.pubsub() as pubsub:
+        await pubsub.subscribe(channel)
+        # Subscribed first, so a verification can't slip between check and wait
+        if await redis.exists(channel):
+            return True
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+            if message is not None:
+                return True
@@ -41,6 +41,19 @@ def hash_api_key(api_key: str) -> str:
     return hashlib.sha256(api_key.encode()).hexdigest()
 
 
+def api_key_prefix(api_key_hash: str) -> int:
+    """
+    Get the lookup prefix of an API key hash.
+
+    Args:
+        api_key_hash: SHA-256 hex digest from hash_api_key
+
+    Returns:
+        The first 8 bytes of the digest as a signed 64-bit integer
+    """
+    return int.from_bytes(bytes.fromhex(api_key_hash[:16]), "big", signed=True)
+
+
 def validate_api_key_format(api_key: str) -> bool:
     """
     Validate that an API key has the correct format.
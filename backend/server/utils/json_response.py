@@ -0,0 +1,126 @@
+"""
+Fast JSON responses backed by orjson and pydantic-core.
+"""
+
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from decimal import Decimal
+from typing import Any, TypeVar
+
+import orjson
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def _default(value: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        # Decimals are exposed as floats, matching the Pydantic schemas
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Return it directly from an endpoint to skip FastAPI's jsonable_encoder pass.
+    UUIDs, datetimes and enums are serialized natively by orjson (datetimes in
+    the same format as ``isoformat()``) and Decimals as floats, so handlers can
+    put raw model values in the payload.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def model_builder(model: type[M]) -> Callable[..., M]:
+    """
+    Return a function building ``model`` instances from trusted keyword values.
+
+    Like ``model_construct`` it skips validation, but also the per-call field
+    and default bookkeeping: the keyword dict becomes the instance ``__dict__``
+    and the precomputed field set is shared. Callers must pass every field,
+    and built instances are treated as read-only.
+    """
+    fields_set = frozenset(model.model_fields)
+    new = model.__new__
+    set_attribute = object.__setattr__
+
+    def build(**values: Any) -> M:
+        instance = new(model)
+        set_attribute(instance, "__dict__", values)
+        set_attribute(instance, "__pydantic_fields_set__", fields_set)
+        set_attribute(instance, "__pydantic_extra__", None)
+        set_attribute(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
+def model_response(adapter: TypeAdapter, value: Any) -> Response:
+    """
+    Validate ``value`` against ``adapter`` once and render it with pydantic-core.
+
+    FastAPI validates a returned value against the route's ``response_model`` and
+    then runs it through ``jsonable_encoder``; returning this response skips both
+    while the route keeps its ``response_model`` for the OpenAPI schema. ORM
+    objects are read with ``from_attributes``.
+    """
+    content = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    return Response(content, media_type="application/json")
+
+
+def constructed_response(value: BaseModel, status_code: int = 200) -> Response:
+    """
+    Render a model built without validation (see ``model_builder``) as JSON.
+
+    pydantic-core serializes it straight to bytes; FastAPI's dump, re-validation
+    against the ``response_model`` and encoding passes are skipped, while the
+    route keeps its ``response_model`` for the OpenAPI schema.
+    """
+    return Response(
+        value.__pydantic_serializer__.to_json(value),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def stream_json_array(
+    adapter: TypeAdapter, rows: Iterable | AsyncIterable, *, validate: bool = True
+) -> StreamingResponse:
+    """
+    Stream ``rows`` as a JSON array, validating and rendering one row at a time.
+
+    Only one row's JSON exists at a time, instead of a dict per row plus the
+    whole encoded body. ``adapter`` validates a single row (ORM objects are read
+    with ``from_attributes``), so the output matches the route's response model.
+    ``rows`` may be an async iterable such as a streamed result, which keeps
+    only a batch of rows in memory. Pass ``validate=False`` for rows already
+    built with ``model_construct``.
+    """
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b"["
+        index = 0
+        async for row in _iterate(rows):
+            if index:
+                yield b","
+            yield adapter.dump_json(
+                adapter.validate_python(row, from_attributes=True) if validate else row
+            )
+            index += 1
+        yield b"]"
+
+    return StreamingResponse(chunks(), media_type="application/json")
+
+
+async def _iterate(rows: Iterable | AsyncIterable) -> AsyncIterator:
+    """Iterate sync and async iterables alike."""
+    if isinstance(rows, AsyncIterable):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
@@ -5,7 +5,7 @@ Structured logging configuration for the application.
 import json
 import logging
 import sys
-from datetime import datetime
+from datetime import UTC, datetime
 
 
 class JSONFormatter(logging.Formatter):
@@ -14,7 +14,7 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(UTC).replace(tzinfo=None).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -0,0 +1,47 @@
+"""
+Keyset pagination cursors.
+
+Listings ordered newest first by (created_at, id) send the sort key of a full
+page's last row in the X-Next-Cursor header. Clients pass it back as
+``cursor`` to fetch the next page with an index seek instead of an OFFSET
+scan, so deep pages cost the same as the first.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException, Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(row) -> str:
+    """Cursor for the page after ``row``, which has ``created_at`` and ``id``."""
+    return f"{row.created_at.isoformat()}_{row.id}"
+
+
+def decode_cursor(cursor: str | None) -> tuple[datetime, UUID] | None:
+    """Parse a ``<iso created_at>_<id>`` keyset cursor into its sort key."""
+    if cursor is None:
+        return None
+    created_at, _, row_id = cursor.rpartition("_")
+    try:
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def next_cursor(rows, limit: int) -> str | None:
+    """
+    Cursor for the page after ``rows``.
+
+    Only a full page can have a next page, so short pages have no cursor.
+    """
+    return encode_cursor(rows[-1]) if len(rows) == limit else None
+
+
+def set_next_cursor(response: Response, rows, limit: int) -> Response:
+    """Send the cursor for the page after ``rows`` in X-Next-Cursor."""
+    if cursor := next_cursor(rows, limit):
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+    return response
@@ -13,4 +13,4 @@ alembic upgrade head
 echo "Migrations completed. Starting server..."
 
 # Start the server
-exec uvicorn server.main:app --host 0.0.0.0 --port ${PORT:-8000}
+exec uvicorn server.main:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools --timeout-keep-alive 65
@@ -1,15 +1,24 @@
 import asyncio
 from collections.abc import AsyncGenerator
+from uuid import UUID
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
 
 from server.database import get_session
 from server.main import app
+from server.models.agent import Agent, TradingMode
+from server.services.market_cache import (
+    clear_known_markets,
+    market_list_cache,
+    market_snapshot_cache,
+)
+from server.services.platform_stats import clear_pending_deltas
 
 # Test database URL - use SQLite for testing
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -55,3 +64,31 @@ async def client(session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield client
 
     app.dependency_overrides.clear()
+    # Each test has its own database, so cached pages must not outlive it
+    market_list_cache.invalidate()
+    market_snapshot_cache.invalidate()
+    clear_known_markets()
+    clear_pending_deltas()
+
+
+@pytest.fixture
+def query_counter() -> list[str]:
+    """Record every SQL statement executed against the test database."""
+    statements = []
+
+    def record(statement, **kwargs):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record, named=True)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def create_auto_trader(client: AsyncClient, session: AsyncSession, name: str) -> str:
+    """Register a trader in AUTO mode so its orders execute immediately."""
+    response = await client.post("/agents", json={"name": name})
+    agent_id = response.json()["id"]
+    agent = await session.get(Agent, UUID(agent_id))
+    agent.trading_mode = TradingMode.AUTO
+    await session.commit()
+    return agent_id
@@ -0,0 +1,389 @@
+"""
+Admin endpoint tests.
+
+Tests the platform administration API:
+- Admin key enforcement
+- Fee history and summaries
+- Agent listing and activity
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.config import settings
+from server.services.matching import update_platform_stats
+from tests.conftest import create_auto_trader
+
+ADMIN_HEADERS = {"X-Admin-Key": settings.ADMIN_SECRET_KEY}
+
+
+def get_future_deadline(days: int = 1) -> str:
+    """Get a valid ISO format deadline string."""
+    return (datetime.now(UTC) + timedelta(days=days)).isoformat()
+
+
+async def create_market(client: AsyncClient, creator_id: str, question: str) -> str:
+    """Create a market and return its ID."""
+    response = await client.post(
+        "/markets",
+        json={"creator_id": creator_id, "question": question, "deadline": get_future_deadline()},
+    )
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_admin_requires_key(client: AsyncClient):
+    """Test that admin endpoints reject requests without a valid key."""
+    response = await client.get("/admin/fees/summary")
+    assert response.status_code == 403
+
+    response = await client.get("/admin/fees/summary", headers={"X-Admin-Key": "wrong"})
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_fee_summary_groups_by_type(client: AsyncClient):
+    """Test that the fee summary totals fees per type."""
+    agent = await client.post("/agents", json={"name": "fee-summary-creator"})
+    agent_id = agent.json()["id"]
+
+    await create_market(client, agent_id, "Will the fee summary add up?")
+    await create_market(client, agent_id, "Will the fee summary add up again?")
+
+    response = await client.get("/admin/fees/summary", headers=ADMIN_HEADERS)
+
+    assert response.status_code == 200
+    data = response.json()
+    expected = float(settings.MARKET_CREATION_FEE) * 2
+    assert data["market_creation_fees"] == expected
+    assert data["trading_fees"] == 0.0
+    assert data["settlement_fees"] == 0.0
+    assert data["total"] == expected
+    assert data["fee_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fee_history(client: AsyncClient):
+    """Test that fee history lists fee records with JSON-friendly values."""
+    agent = await client.post("/agents", json={"name": "fee-history-creator"})
+    agent_id = agent.json()["id"]
+    market_id = await create_market(client, agent_id, "Will fee history list this fee?")
+
+    response = await client.get(f"/admin/fees?agent_id={agent_id}", headers=ADMIN_HEADERS)
+
+    assert response.status_code == 200
+    fees = response.json()
+    assert len(fees) == 1
+    assert fees[0]["fee_type"] == "market_creation"
+    assert fees[0]["amount"] == float(settings.MARKET_CREATION_FEE)
+    assert fees[0]["agent_id"] == agent_id
+    assert fees[0]["market_id"] == market_id
+    assert fees[0]["trade_id"] is None
+    datetime.fromisoformat(fees[0]["created_at"])
+    assert response.headers["X-Total-Count"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_fee_summary_empty(client: AsyncClient):
+    """Test that the fee summary is all zeros when no fees were collected."""
+    response = await client.get("/admin/fees/summary?days=7", headers=ADMIN_HEADERS)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["period_days"] == 7
+    assert data["total"] == 0.0
+    assert data["fee_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_agents_includes_wallet_address(client: AsyncClient):
+    """Test that agents with a wallet report its address and others report None."""
+    with_wallet = await client.post("/agents", json={"name": "admin-with-wallet"})
+    with_wallet_id = with_wallet.json()["id"]
+    without_wallet = await client.post("/agents", json={"name": "admin-without-wallet"})
+    without_wallet_id = without_wallet.json()["id"]
+
+    wallet_response = await client.get(f"/wallet/{with_wallet_id}")
+    address = wallet_response.json()["internal_address"]
+
+    response = await client.get("/admin/agents", headers=ADMIN_HEADERS)
+
+    assert response.status_code == 200
+    by_id = {a["id"]: a for a in response.json()}
+    assert by_id[with_wallet_id]["wallet_address"] == address
+    assert by_id[without_wallet_id]["wallet_address"] is None
+    assert by_id[without_wallet_id]["role"] == "trader"
+    assert by_id[without_wallet_id]["balance"] == 1000.0
+    assert by_id[without_wallet_id]["available_balance"] == 1000.0
+
+
+@pytest.mark.asyncio
+async def test_list_agents_total_count(client: AsyncClient):
+    """Test that agent listing reports the unpaginated total alongside each page."""
+    for name in ("total-agent-one", "total-agent-two", "total-agent-three"):
+        await client.post("/agents", json={"name": name})
+
+    response = await client.get("/admin/agents?limit=2", headers=ADMIN_HEADERS)
+    assert len(response.json()) == 2
+    assert response.headers["X-Total-Count"] == "3"
+
+    response = await client.get("/admin/agents?limit=2&offset=2", headers=ADMIN_HEADERS)
+    assert len(response.json()) == 1
+    assert response.headers["X-Total-Count"] == "3"
+
+    response = await client.get("/admin/agents?limit=2&offset=10", headers=ADMIN_HEADERS)
+    assert response.json() == []
+    assert response.headers["X-Total-Count"] == "3"
+
+
+@pytest.mark.asyncio
+async def test_agent_activity(client: AsyncClient):
+    """Test that agent activity returns the agent and its fees paid."""
+    agent = await client.post("/agents", json={"name": "admin-activity-agent"})
+    agent_id = agent.json()["id"]
+    await create_market(client, agent_id, "Will agent activity show this fee?")
+
+    response = await client.get(f"/admin/agents/{agent_id}/activity", headers=ADMIN_HEADERS)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["agent"]["id"] == agent_id
+    assert data["summary"]["total_orders"] == 0
+    assert data["summary"]["total_trades"] == 0
+    assert data["summary"]["total_fees_paid"] == float(settings.MARKET_CREATION_FEE)
+
+
+@pytest.mark.asyncio
+async def test_agent_activity_not_found(client: AsyncClient):
+    """Test that activity for an unknown agent returns 404."""
+    response = await client.get(
+        "/admin/agents/00000000-0000-0000-0000-000000000000/activity", headers=ADMIN_HEADERS
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_agent_activity_trades_both_sides(client: AsyncClient, session: AsyncSession):
+    """Test that activity lists trades where the agent was buyer or seller."""
+    yes_trader = await create_auto_trader(client, session, "activity-yes-trader")
+    no_trader = await create_auto_trader(client, session, "activity-no-trader")
+    market_id = await create_market(client, yes_trader, "Will activity show both sides?")
+
+    for side, price, trader in (("YES", "0.60", yes_trader), ("NO", "0.40", no_trader)):
+        response = await client.post(
+            "/orders",
+            json={
+                "agent_id": trader,
+                "market_id": market_id,
+                "side": side,
+                "price": price,
+                "size": 10,
+            },
+        )
+        assert response.status_code == 200
+
+    for trader, role in ((yes_trader, "buyer"), (no_trader, "seller")):
+        response = await client.get(f"/admin/agents/{trader}/activity", headers=ADMIN_HEADERS)
+        data = response.json()
+        assert data["summary"]["total_trades"] == 1
+        assert data["recent_trades"][0]["role"] == role
+        assert data["recent_trades"][0]["size"] == 10
+
+
+@pytest.mark.asyncio
+async def test_platform_stats_counts_incrementally(client: AsyncClient, session: AsyncSession):
+    """Test that platform stats reflect agents, markets and trades as they happen."""
+    yes_trader = await create_auto_trader(client, session, "stats-yes-trader")
+    no_trader = await create_auto_trader(client, session, "stats-no-trader")
+    await client.post("/agents", json={"name": "stats-moderator", "role": "moderator"})
+    market_id = await create_market(client, yes_trader, "Will stats count this market?")
+
+    for side, price, trader in (("YES", "0.60", yes_trader), ("NO", "0.40", no_trader)):
+        await client.post(
+            "/orders",
+            json={
+                "agent_id": trader,
+                "market_id": market_id,
+                "side": side,
+                "price": price,
+                "size": 10,
+            },
+        )
+
+    response = await client.get("/admin/stats", headers=ADMIN_HEADERS)
+
+    assert response.status_code == 200
+    overview = response.json()["overview"]
+    assert overview["total_agents"] == 3
+    assert overview["total_traders"] == 2
+    assert overview["total_moderators"] == 1
+    assert overview["total_markets"] == 1
+    assert overview["open_markets"] == 1
+    assert overview["resolved_markets"] == 0
+    assert overview["total_trades"] == 1
+    assert overview["total_volume"] == 6.0
+    assert response.json()["revenue"]["total_market_creation_fees"] == float(
+        settings.MARKET_CREATION_FEE
+    )
+
+
+@pytest.mark.asyncio
+async def test_platform_stats_skip_rolled_back_deltas(client: AsyncClient, session: AsyncSession):
+    """Test that stats recorded in a rolled-back savepoint or transaction are not counted."""
+    await client.post("/agents", json={"name": "stats-rollback-trader"})
+
+    with pytest.raises(ValueError, match="savepoint"):
+        async with session.begin_nested():
+            await update_platform_stats(session, markets_created=1)
+            raise ValueError("savepoint")
+    await update_platform_stats(session, trade_count=1)
+    await session.commit()
+
+    await update_platform_stats(session, markets_resolved=1)
+    await session.rollback()
+
+    overview = (await client.get("/admin/stats", headers=ADMIN_HEADERS)).json()["overview"]
+    assert overview["total_agents"] == 1
+    assert overview["total_markets"] == 0
+    assert overview["total_trades"] == 1
+    assert overview["resolved_markets"] == 0
+
+
+@pytest.mark.asyncio
+async def test_market_details_summary(client: AsyncClient, session: AsyncSession):
+    """Test that market details summarize orders, trades, traders and fees."""
+    yes_trader = await create_auto_trader(client, session, "details-yes-trader")
+    no_trader = await create_auto_trader(client, session, "details-no-trader")
+    market_id = await create_market(client, yes_trader, "Will market details add up?")
+
+    for side, price, trader in (
+        ("YES", "0.60", yes_trader),
+        ("NO", "0.40", no_trader),
+        ("YES", "0.30", yes_trader),
+    ):
+        await client.post(
+            "/orders",
+            json={
+                "agent_id": trader,
+                "market_id": market_id,
+                "side": side,
+                "price": price,
+                "size": 10,
+            },
+        )
+
+    response = await client.get(f"/admin/markets/{market_id}/details", headers=ADMIN_HEADERS)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["market"]["id"] == market_id
+    summary = data["summary"]
+    assert summary["total_orders"] == 3
+    assert summary["open_orders"] == 1
+    assert summary["total_trades"] == 1
+    assert summary["unique_traders"] == 2
+    assert summary["total_fees_collected"] == pytest.approx(
+        float(settings.MARKET_CREATION_FEE) + data["trades"][0]["total_fee"]
+    )
+    assert len(data["trades"]) == 1
+    assert len(data["positions"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_market_details_not_found(client: AsyncClient):
+    """Test that details for an unknown market return 404."""
+    response = await client.get(
+        "/admin/markets/00000000-0000-0000-0000-000000000000/details", headers=ADMIN_HEADERS
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_trades_includes_fees(client: AsyncClient, session: AsyncSession):
+    """Test that the admin trade listing reports fees as floats."""
+    yes_trader = await create_auto_trader(client, session, "list-trades-yes-trader")
+    no_trader = await create_auto_trader(client, session, "list-trades-no-trader")
+    market_id = await create_market(client, yes_trader, "Will admin trades list fees?")
+
+    for side, price, trader in (("YES", "0.60", yes_trader), ("NO", "0.40", no_trader)):
+        await client.post(
+            "/orders",
+            json={
+                "agent_id": trader,
+                "market_id": market_id,
+                "side": side,
+                "price": price,
+                "size": 10,
+            },
+        )
+
+    response = await client.get(f"/admin/trades?market_id={market_id}", headers=ADMIN_HEADERS)
+
+    assert response.status_code == 200
+    trades = response.json()
+    assert len(trades) == 1
+    assert trades[0]["market_id"] == market_id
+    assert trades[0]["total_fee"] == pytest.approx(trades[0]["buyer_fee"] + trades[0]["seller_fee"])
+    assert isinstance(trades[0]["price"], float)
+
+    response = await client.get("/admin/markets", headers=ADMIN_HEADERS)
+    assert [m["id"] for m in response.json()] == [market_id]
+
+
+@pytest.mark.asyncio
+async def test_list_trades_by_agent(client: AsyncClient, session: AsyncSession):
+    """Test that filtering trades by agent matches either side and honours the offset."""
+    yes_trader = await create_auto_trader(client, session, "agent-trades-yes-trader")
+    no_trader = await create_auto_trader(client, session, "agent-trades-no-trader")
+    market_id = await create_market(client, yes_trader, "Will trades filter by agent?")
+
+    for side, price, trader in (("YES", "0.60", yes_trader), ("NO", "0.40", no_trader)):
+        await client.post(
+            "/orders",
+            json={
+                "agent_id": trader,
+                "market_id": market_id,
+                "side": side,
+                "price": price,
+                "size": 10,
+            },
+        )
+
+    for trader in (yes_trader, no_trader):
+        response = await client.get(f"/admin/trades?agent_id={trader}", headers=ADMIN_HEADERS)
+        assert len(response.json()) == 1
+
+        response = await client.get(
+            f"/admin/trades?agent_id={trader}&offset=1", headers=ADMIN_HEADERS
+        )
+        assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_list_markets_cursor_pagination(client: AsyncClient):
+    """Test that markets can be paged by keyset cursor without gaps or repeats."""
+    agent = await client.post("/agents", json={"name": "cursor-market-creator"})
+    agent_id = agent.json()["id"]
+    created = [
+        await create_market(client, agent_id, f"Will cursor page {n} list this market?")
+        for n in range(3)
+    ]
+
+    first = await client.get("/admin/markets", params={"limit": 2}, headers=ADMIN_HEADERS)
+    cursor = first.headers["X-Next-Cursor"]
+    second = await client.get(
+        "/admin/markets", params={"limit": 2, "cursor": cursor}, headers=ADMIN_HEADERS
+    )
+
+    ids = [m["id"] for m in first.json() + second.json()]
+    assert sorted(ids) == sorted(created)
+    assert "X-Next-Cursor" not in second.headers
+
+    response = await client.get(
+        "/admin/markets", params={"cursor": "not-a-cursor"}, headers=ADMIN_HEADERS
+    )
+    assert response.status_code == 400
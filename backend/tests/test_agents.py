@@ -1,5 +1,10 @@
+from datetime import UTC, datetime, timedelta
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.conftest import create_auto_trader
 
 
 @pytest.mark.asyncio
@@ -48,6 +53,18 @@ async def test_get_nonexistent_agent(client: AsyncClient):
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_list_moderators(client: AsyncClient):
+    """Test that /agents/moderators is not shadowed by the agent ID route."""
+    await client.post("/agents", json={"name": "list-moderator", "role": "moderator"})
+    await client.post("/agents", json={"name": "list-not-moderator"})
+
+    response = await client.get("/agents/moderators")
+
+    assert response.status_code == 200
+    assert [a["name"] for a in response.json()] == ["list-moderator"]
+
+
 @pytest.mark.asyncio
 async def test_list_agents(client: AsyncClient):
     """Test listing agents."""
@@ -60,3 +77,94 @@ async def test_list_agents(client: AsyncClient):
     assert response.status_code == 200
     data = response.json()
     assert len(data) >= 2
+
+
+@pytest.mark.asyncio
+async def test_agent_profile_volume_and_rankings(
+    client: AsyncClient, session: AsyncSession, query_counter: list[str]
+):
+    """Test that the profile reports traded volume, rankings and recent trades."""
+    yes_trader = await create_auto_trader(client, session, "profile-yes-trader")
+    no_trader = await create_auto_trader(client, session, "profile-no-trader")
+    bystander = (await client.post("/agents", json={"name": "profile-bystander"})).json()["id"]
+
+    question = "Will the profile show this trade?"
+    deadline = (datetime.now(UTC) + timedelta(days=1)).isoformat()
+    market = await client.post(
+        "/markets", json={"creator_id": yes_trader, "question": question, "deadline": deadline}
+    )
+    market_id = market.json()["id"]
+
+    for side, price, trader in (("YES", "0.60", yes_trader), ("NO", "0.40", no_trader)):
+        await client.post(
+            "/orders",
+            json={
+                "agent_id": trader,
+                "market_id": market_id,
+                "side": side,
+                "price": price,
+                "size": 10,
+            },
+        )
+
+    query_counter.clear()
+    response = await client.get(f"/agents/{yes_trader}/profile")
+
+    assert response.status_code == 200
+    # Fixed number of statements regardless of history; a lazy load would raise or add more
+    assert len(query_counter) <= 14
+    data = response.json()
+    assert data["stats"]["total_trades"] == 1
+    assert data["stats"]["total_volume_traded"] == 6.0
+    assert data["rankings"]["rank_by_volume"] in (1, 2)
+    assert data["recent_trades"][0]["market_question"] == question
+    assert data["recent_trades"][0]["role"] == "buyer"
+
+    response = await client.get(f"/agents/{bystander}/profile")
+
+    assert response.json()["stats"]["total_trades"] == 0
+    assert response.json()["rankings"]["rank_by_volume"] == 3
+
+
+@pytest.mark.asyncio
+async def test_agent_profile_realized_pnl(client: AsyncClient, session: AsyncSession):
+    """Test that the profile reports realized PnL from resolved markets."""
+    yes_trader = await create_auto_trader(client, session, "pnl-yes-trader")
+    no_trader = await create_auto_trader(client, session, "pnl-no-trader")
+    moderator = await client.post("/agents", json={"name": "pnl-moderator", "role": "moderator"})
+
+    deadline = (datetime.now(UTC) + timedelta(days=1)).isoformat()
+    market = await client.post(
+        "/markets",
+        json={"creator_id": yes_trader, "question": "Will PnL be realized?", "deadline": deadline},
+    )
+    market_id = market.json()["id"]
+
+    for side, price, trader in (("YES", "0.60", yes_trader), ("NO", "0.40", no_trader)):
+        await client.post(
+            "/orders",
+            json={
+                "agent_id": trader,
+                "market_id": market_id,
+                "side": side,
+                "price": price,
+                "size": 10,
+            },
+        )
+
+    response = await client.post(
+        f"/markets/{market_id}/resolve",
+        json={"moderator_id": moderator.json()["id"], "outcome": "YES"},
+    )
+    assert response.status_code == 200
+
+    stats = (await client.get(f"/agents/{yes_trader}/profile")).json()["stats"]
+    assert stats["total_pnl"] == pytest.approx(4.0)
+    assert stats["best_trade"] == pytest.approx(4.0)
+    assert stats["worst_trade"] == pytest.approx(4.0)
+    assert stats["win_rate"] == 100.0
+
+    stats = (await client.get(f"/agents/{no_trader}/profile")).json()["stats"]
+    assert stats["total_pnl"] == 0.0
+    assert stats["best_trade"] is None
+    assert stats["win_rate"] == 0.0
@@ -1,6 +1,7 @@
 """Tests for API key storage, authentication, and management."""
 
-from datetime import datetime
+import asyncio
+from datetime import UTC, datetime
 
 import pytest
 from httpx import AsyncClient
@@ -106,13 +107,13 @@ async def test_api_key_stored_as_hash_in_database(client: AsyncClient, session:
 @pytest.mark.asyncio
 async def test_api_key_created_at_timestamp(client: AsyncClient, session: AsyncSession):
     """Test that api_key_created_at is set during registration."""
-    before_registration = datetime.utcnow()
+    before_registration = datetime.now(UTC)
 
     response = await client.post(
         "/api/v1/agents/register", json={"name": "timestamp-test-agent", "role": "trader"}
     )
 
-    after_registration = datetime.utcnow()
+    after_registration = datetime.now(UTC)
 
     assert response.status_code == 200
     agent_name = response.json()["name"]
@@ -486,3 +487,67 @@ async def test_api_key_hash_indexed_for_performance(client: AsyncClient, session
     assert len(agents) == 5
     for agent in agents:
         assert agent.api_key_hash is not None
+
+
+@pytest.mark.asyncio
+async def test_cached_api_key_skips_agent_lookup(client: AsyncClient, query_counter: list[str]):
+    """Test that repeated requests with the same key reuse the cached lookup."""
+    register_response = await client.post(
+        "/api/v1/agents/register", json={"name": "auth-cache-agent", "role": "trader"}
+    )
+    api_key = register_response.json()["api_key"]
+    claim_token = register_response.json()["claim_url"].split("/")[-1]
+    await client.post("/api/v1/agents/verify", json={"claim_token": claim_token})
+
+    headers = {"Authorization": f"Bearer {api_key}"}
+    assert (await client.get("/api/v1/markets", headers=headers)).status_code == 200
+
+    query_counter.clear()
+    assert (await client.get("/api/v1/markets", headers=headers)).status_code == 200
+    assert not [statement for statement in query_counter if "FROM agents" in statement]
+
+
+@pytest.mark.asyncio
+async def test_status_long_poll_returns_on_verification(client: AsyncClient):
+    """Test that a waiting status poll is answered as soon as the agent is verified."""
+    register_response = await client.post(
+        "/api/v1/agents/register", json={"name": "long-poll-agent", "role": "trader"}
+    )
+    api_key = register_response.json()["api_key"]
+    claim_token = register_response.json()["claim_url"].split("/")[-1]
+    headers = {"Authorization": f"Bearer {api_key}"}
+
+    poll = asyncio.create_task(
+        client.get("/api/v1/agents/status", params={"wait": 10}, headers=headers)
+    )
+    await asyncio.sleep(0.1)
+    assert not poll.done()
+
+    await client.post("/api/v1/agents/verify", json={"claim_token": claim_token})
+    response = await asyncio.wait_for(poll, timeout=2)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "verified"
+
+
+@pytest.mark.asyncio
+async def test_moderator_key_cannot_trade(client: AsyncClient):
+    """Test that trader-only v1 endpoints reject moderator keys."""
+    register_response = await client.post(
+        "/api/v1/agents/register", json={"name": "role-check-moderator", "role": "moderator"}
+    )
+    api_key = register_response.json()["api_key"]
+    claim_token = register_response.json()["claim_url"].split("/")[-1]
+    await client.post("/api/v1/agents/verify", json={"claim_token": claim_token})
+
+    response = await client.post(
+        "/api/v1/markets",
+        json={
+            "question": "Can a moderator create this market?",
+            "deadline": "2099-01-01T00:00:00Z",
+        },
+        headers={"Authorization": f"Bearer {api_key}"},
+    )
+
+    assert response.status_code == 403
+    assert "Moderators cannot trade" in response.json()["error"]
@@ -124,3 +124,234 @@ async def test_get_order_book_empty(client: AsyncClient):
     data = response.json()
     assert data["bids"] == []
     assert data["asks"] == []
+
+
+@pytest.mark.asyncio
+async def test_v1_market_etag_not_modified(client: AsyncClient):
+    """Test that v1 market reads return an ETag and honor If-None-Match."""
+    register_response = await client.post(
+        "/api/v1/agents/register", json={"name": "etag-agent", "role": "trader"}
+    )
+    data = register_response.json()
+    await client.post(
+        "/api/v1/agents/verify", json={"claim_token": data["claim_url"].split("/")[-1]}
+    )
+    headers = {"Authorization": f"Bearer {data['api_key']}"}
+
+    create_response = await client.post(
+        "/api/v1/markets",
+        headers=headers,
+        json={"question": "Will ETags save bandwidth?", "deadline": get_future_deadline()},
+    )
+    market_id = create_response.json()["id"]
+
+    for path in ("/api/v1/markets", f"/api/v1/markets/{market_id}"):
+        response = await client.get(path, headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert "max-age=2" in response.headers["Cache-Control"]
+
+        response = await client.get(path, headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_v1_bets_reuse_market_snapshot(client: AsyncClient, query_counter: list[str]):
+    """Test that back-to-back bets on a market reuse its cached snapshot."""
+    register_response = await client.post(
+        "/api/v1/agents/register", json={"name": "snapshot-agent", "role": "trader"}
+    )
+    data = register_response.json()
+    await client.post(
+        "/api/v1/agents/verify", json={"claim_token": data["claim_url"].split("/")[-1]}
+    )
+    headers = {"Authorization": f"Bearer {data['api_key']}"}
+
+    create_response = await client.post(
+        "/api/v1/markets",
+        headers=headers,
+        json={"question": "Will snapshots skip a query?", "deadline": get_future_deadline()},
+    )
+    market_id = create_response.json()["id"]
+    bet = {"side": "YES", "amount": 1, "price": "0.40"}
+
+    response = await client.post(f"/api/v1/markets/{market_id}/bets", headers=headers, json=bet)
+    assert response.status_code == 200
+
+    query_counter.clear()
+    response = await client.post(f"/api/v1/markets/{market_id}/bets", headers=headers, json=bet)
+    assert response.status_code == 200
+    assert not [s for s in query_counter if s.startswith("SELECT markets.status")]
+
+
+@pytest.mark.asyncio
+async def test_market_etag_not_modified(client: AsyncClient):
+    """Test that market reads return an ETag and honor If-None-Match."""
+    agent_response = await client.post("/agents", json={"name": "etag-market-creator"})
+    creator_id = agent_response.json()["id"]
+
+    create_response = await client.post(
+        "/markets",
+        json={
+            "creator_id": creator_id,
+            "question": "Will legacy ETags save bandwidth?",
+            "deadline": get_future_deadline(),
+        },
+    )
+    market_id = create_response.json()["id"]
+
+    for path in ("/markets", f"/markets/{market_id}"):
+        response = await client.get(path)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = await client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_v1_list_markets_keyset_cursor(client: AsyncClient):
+    """Test that v1 market list pages chain through X-Next-Cursor, newest first."""
+    register_response = await client.post(
+        "/api/v1/agents/register", json={"name": "cursor-agent", "role": "trader"}
+    )
+    data = register_response.json()
+    await client.post(
+        "/api/v1/agents/verify", json={"claim_token": data["claim_url"].split("/")[-1]}
+    )
+    headers = {"Authorization": f"Bearer {data['api_key']}"}
+
+    agent_response = await client.post("/agents", json={"name": "cursor-market-creator"})
+    creator_id = agent_response.json()["id"]
+    market_ids = []
+    for i in range(5):
+        create_response = await client.post(
+            "/markets",
+            json={
+                "creator_id": creator_id,
+                "question": f"Cursor market {i} - will it page?",
+                "deadline": get_future_deadline(),
+            },
+        )
+        market_ids.append(create_response.json()["id"])
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = await client.get("/api/v1/markets", headers=headers, params=params)
+        assert response.status_code == 200
+        seen += [market["id"] for market in response.json()]
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params = {"limit": 2, "cursor": response.headers["X-Next-Cursor"]}
+
+    assert seen == market_ids[::-1]
+
+
+@pytest.mark.asyncio
+async def test_market_existence_checked_once(client: AsyncClient, query_counter: list[str]):
+    """Test that categories are cacheable and known markets skip existence queries."""
+    response = await client.get("/markets/categories")
+    assert response.status_code == 200
+    assert "politics" in response.json()
+    assert response.headers["Cache-Control"] == "public, max-age=3600"
+
+    agent_response = await client.post("/agents", json={"name": "known-market-creator"})
+    create_response = await client.post(
+        "/markets",
+        json={
+            "creator_id": agent_response.json()["id"],
+            "question": "Will existence checks be skipped?",
+            "deadline": get_future_deadline(),
+        },
+    )
+    market_id = create_response.json()["id"]
+
+    assert (await client.get(f"/markets/{market_id}/comments")).status_code == 200
+    query_counter.clear()
+    assert (await client.get(f"/markets/{market_id}/comments")).status_code == 200
+    assert not [s for s in query_counter if s.startswith("SELECT markets.id")]
+
+    missing_id = "00000000-0000-0000-0000-000000000000"
+    assert (await client.get(f"/markets/{missing_id}/comments")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_comment_vote_counts(client: AsyncClient):
+    """Test that votes, repeated votes, flips and removals keep the score right."""
+    register_response = await client.post(
+        "/api/v1/agents/register", json={"name": "vote-agent", "role": "trader"}
+    )
+    data = register_response.json()
+    await client.post(
+        "/api/v1/agents/verify", json={"claim_token": data["claim_url"].split("/")[-1]}
+    )
+    headers = {"Authorization": f"Bearer {data['api_key']}"}
+
+    agent_response = await client.post("/agents", json={"name": "vote-market-creator"})
+    create_response = await client.post(
+        "/markets",
+        json={
+            "creator_id": agent_response.json()["id"],
+            "question": "Will votes be counted once?",
+            "deadline": get_future_deadline(),
+        },
+    )
+    market_id = create_response.json()["id"]
+    comment_response = await client.post(
+        f"/markets/{market_id}/comments", json={"content": "Vote on me"}, headers=headers
+    )
+    comment_id = comment_response.json()["id"]
+
+    expected = [("upvote", 1), ("upvote", 1), ("downvote", -1), ("remove", 0), ("remove", 0)]
+    for vote_type, score in expected:
+        response = await client.post(
+            f"/markets/comments/{comment_id}/vote", json={"vote_type": vote_type}, headers=headers
+        )
+        assert response.status_code == 200
+        assert response.json()["new_score"] == score
+
+    response = await client.get(f"/markets/comments/{comment_id}")
+    assert response.json()["upvotes"] == 0
+    assert response.json()["downvotes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_comment_replies_nested(client: AsyncClient):
+    """Test that comment pages nest replies to replies under their parents."""
+    register_response = await client.post(
+        "/api/v1/agents/register", json={"name": "thread-agent", "role": "trader"}
+    )
+    data = register_response.json()
+    await client.post(
+        "/api/v1/agents/verify", json={"claim_token": data["claim_url"].split("/")[-1]}
+    )
+    headers = {"Authorization": f"Bearer {data['api_key']}"}
+
+    agent_response = await client.post("/agents", json={"name": "thread-market-creator"})
+    create_response = await client.post(
+        "/markets",
+        json={
+            "creator_id": agent_response.json()["id"],
+            "question": "Will threads nest?",
+            "deadline": get_future_deadline(),
+        },
+    )
+    market_id = create_response.json()["id"]
+
+    parent_id = None
+    for content in ("Thread", "Reply", "Reply to reply"):
+        response = await client.post(
+            f"/markets/{market_id}/comments",
+            json={"content": content, "parent_id": parent_id},
+            headers=headers,
+        )
+        parent_id = response.json()["id"]
+
+    thread = (await client.get(f"/markets/{market_id}/comments")).json()["comments"][0]
+    assert thread["content"] == "Thread"
+    reply = thread["replies"][0]
+    assert reply["content"] == "Reply"
+    assert reply["replies"][0]["content"] == "Reply to reply"
@@ -2,6 +2,9 @@ from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.services.order_matching import process_pending_orders
 
 
 def get_future_deadline() -> str:
@@ -161,3 +164,51 @@ async def test_cancel_order(client: AsyncClient):
     data = response.json()
     assert data["status"] == "cancelled"
     assert float(data["refunded"]) == 5.0  # 0.50 * 10
+
+
+@pytest.mark.asyncio
+async def test_v1_async_bet_matched_by_worker(client: AsyncClient, session: AsyncSession):
+    """Test that an async v1 bet is queued as pending and filled by the matching worker."""
+    headers = []
+    for name in ("async-buyer-yes", "async-buyer-no"):
+        register_response = await client.post(
+            "/api/v1/agents/register", json={"name": name, "role": "trader"}
+        )
+        data = register_response.json()
+        await client.post(
+            "/api/v1/agents/verify", json={"claim_token": data["claim_url"].split("/")[-1]}
+        )
+        headers.append({"Authorization": f"Bearer {data['api_key']}"})
+
+    create_response = await client.post(
+        "/api/v1/markets",
+        headers=headers[0],
+        json={"question": "Will async matching fill this?", "deadline": get_future_deadline()},
+    )
+    market_id = create_response.json()["id"]
+
+    await client.post(
+        f"/api/v1/markets/{market_id}/bets",
+        headers=headers[0],
+        json={"side": "YES", "amount": 10, "price": "0.60"},
+    )
+    response = await client.post(
+        f"/api/v1/markets/{market_id}/bets",
+        headers=headers[1],
+        json={"side": "NO", "amount": 10, "price": "0.40", "execute": "async"},
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+    assert response.json()["filled"] == 0
+    order_id = response.json()["order_id"]
+
+    assert await process_pending_orders(session) == 1
+
+    order = await client.get(f"/api/v1/orders/{order_id}", headers=headers[1])
+    assert order.status_code == 200
+    assert order.json()["status"] == "filled"
+    assert order.json()["filled"] == 10
+
+    # Orders are only visible to the agent that placed them
+    other = await client.get(f"/api/v1/orders/{order_id}", headers=headers[0])
+    assert other.status_code == 404
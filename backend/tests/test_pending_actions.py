@@ -0,0 +1,146 @@
+"""
+Pending action tests.
+
+Tests the pending action lifecycle helpers:
+- Expiring stale pending actions
+- Purging finished actions past the retention window
+- Listing only live pending actions
+"""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+
+from server.models import ActionStatus, ActionType, PendingAction
+from server.services.pending_actions import expire_old_actions, purge_finished_actions
+
+
+async def create_action(
+    session: AsyncSession,
+    agent_id: UUID,
+    status: ActionStatus = ActionStatus.PENDING,
+    expires_in: timedelta = timedelta(hours=24),
+    reviewed_ago: timedelta | None = None,
+) -> PendingAction:
+    """Insert a pending action with the given status and timestamps."""
+    now = datetime.now(UTC)
+    action = PendingAction(
+        agent_id=agent_id,
+        action_type=ActionType.PLACE_ORDER,
+        status=status,
+        expires_at=now + expires_in,
+        reviewed_at=now - reviewed_ago if reviewed_ago is not None else None,
+    )
+    session.add(action)
+    await session.commit()
+    return action
+
+
+async def get_statuses(session: AsyncSession) -> dict[UUID, ActionStatus]:
+    """Map every remaining action ID to its status."""
+    result = await session.execute(select(PendingAction.id, PendingAction.status))
+    return dict(result.all())
+
+
+@pytest.mark.asyncio
+async def test_expire_old_actions(client: AsyncClient, session: AsyncSession):
+    """Test that only pending actions past their expiry are expired."""
+    agent = await client.post("/agents", json={"name": "expiry-agent"})
+    agent_id = UUID(agent.json()["id"])
+
+    stale = await create_action(session, agent_id, expires_in=timedelta(hours=-1))
+    fresh = await create_action(session, agent_id)
+    approved = await create_action(
+        session, agent_id, ActionStatus.APPROVED, expires_in=timedelta(hours=-1)
+    )
+
+    assert await expire_old_actions(session) == 1
+
+    statuses = await get_statuses(session)
+    assert statuses[stale.id] == ActionStatus.EXPIRED
+    assert statuses[fresh.id] == ActionStatus.PENDING
+    assert statuses[approved.id] == ActionStatus.APPROVED
+
+
+@pytest.mark.asyncio
+async def test_purge_finished_actions(client: AsyncClient, session: AsyncSession):
+    """Test that finished actions older than the retention window are deleted in batches."""
+    agent = await client.post("/agents", json={"name": "purge-agent"})
+    agent_id = UUID(agent.json()["id"])
+
+    old_rejected = [
+        await create_action(
+            session, agent_id, ActionStatus.REJECTED, reviewed_ago=timedelta(days=40)
+        )
+        for _ in range(3)
+    ]
+    old_expired = await create_action(
+        session, agent_id, ActionStatus.EXPIRED, expires_in=timedelta(days=-40)
+    )
+    recent_approved = await create_action(
+        session, agent_id, ActionStatus.APPROVED, reviewed_ago=timedelta(days=1)
+    )
+    old_pending = await create_action(session, agent_id, expires_in=timedelta(days=-40))
+
+    deleted = await purge_finished_actions(session, retention_days=30, batch_size=2)
+
+    assert deleted == len(old_rejected) + 1
+    statuses = await get_statuses(session)
+    assert old_expired.id not in statuses
+    assert set(statuses) == {recent_approved.id, old_pending.id}
+
+
+@pytest.mark.asyncio
+async def test_loaded_timestamps_are_utc_aware(client: AsyncClient, session: AsyncSession):
+    """Test that timestamps come back timezone-aware so expiry checks compare directly."""
+    agent = await client.post("/agents", json={"name": "tz-agent"})
+    agent_id = UUID(agent.json()["id"])
+    action = await create_action(session, agent_id, expires_in=timedelta(hours=-1))
+    action_id = action.id
+
+    session.expire_all()
+    loaded = await session.get(PendingAction, action_id)
+
+    assert loaded.created_at.tzinfo is UTC
+    assert loaded.expires_at.tzinfo is UTC
+    assert loaded.is_expired
+
+
+@pytest.mark.asyncio
+async def test_is_pending_filters_in_sql(client: AsyncClient, session: AsyncSession):
+    """Test that PendingAction.is_pending selects only unexpired pending actions."""
+    agent = await client.post("/agents", json={"name": "live-agent"})
+    agent_id = UUID(agent.json()["id"])
+
+    live = await create_action(session, agent_id)
+    await create_action(session, agent_id, expires_in=timedelta(hours=-1))
+    await create_action(session, agent_id, ActionStatus.REJECTED)
+
+    result = await session.execute(select(PendingAction).where(PendingAction.is_pending))
+    actions = result.scalars().all()
+
+    assert [a.id for a in actions] == [live.id]
+    assert actions[0].is_pending
+    assert actions[0].can_be_reviewed
+
+
+@pytest.mark.asyncio
+async def test_list_pending_filter_skips_expired(client: AsyncClient, session: AsyncSession):
+    """Test that filtering by pending status returns only live actions."""
+    agent = await client.post("/agents", json={"name": "live-filter-agent"})
+    agent_id = UUID(agent.json()["id"])
+
+    await create_action(session, agent_id, expires_in=timedelta(hours=-1))
+    fresh = await create_action(session, agent_id)
+
+    response = await client.get(
+        "/pending-actions", params={"agent_id": str(agent_id), "status": "pending"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [action["id"] for action in data["actions"]] == [str(fresh.id)]
+    assert data["pending_count"] == 1
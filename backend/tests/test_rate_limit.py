@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from server.models.agent import Agent
+from server.services import rate_limit as rate_limit_module
+from server.services.rate_limit import check_rate_limit, rate_limit
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_rejects_when_bucket_empty():
+    """Test that the in-process bucket allows the capacity, then returns 429."""
+    agent = Agent(id=uuid4(), name="rate-limited")
+
+    await check_rate_limit(agent, "market")
+    with pytest.raises(HTTPException) as exc_info:
+        await check_rate_limit(agent, "market")
+
+    assert exc_info.value.status_code == 429
+    assert 0 < int(exc_info.value.headers["Retry-After"]) <= 3600
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_scopes_are_independent():
+    """Test that exhausting one scope does not limit the others."""
+    agent = Agent(id=uuid4(), name="rate-scoped")
+
+    for _ in range(10):
+        await check_rate_limit(agent, "order")
+    with pytest.raises(HTTPException):
+        await check_rate_limit(agent, "order")
+
+    await check_rate_limit(agent, "general")
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_caps_requests_in_flight():
+    """Test that the dependency admits up to the concurrency limit until a slot is freed."""
+    agent = Agent(id=uuid4(), name="rate-concurrent")
+    dependency = rate_limit("order")
+
+    in_flight = [dependency(agent) for _ in range(4)]
+    for request in in_flight:
+        assert await anext(request) is agent
+    with pytest.raises(HTTPException) as exc_info:
+        await anext(dependency(agent))
+    assert exc_info.value.status_code == 429
+
+    await in_flight.pop().aclose()
+    request = dependency(agent)
+    assert await anext(request) is agent
+
+    await request.aclose()
+    for request in in_flight:
+        await request.aclose()
+
+
+@pytest.mark.asyncio
+async def test_local_buckets_are_bounded(monkeypatch: pytest.MonkeyPatch):
+    """Test that in-process buckets are capped, evicting the least recently used."""
+    monkeypatch.setattr(rate_limit_module, "MAX_LOCAL_BUCKETS", 3)
+    agents = [Agent(id=uuid4(), name=f"rate-bounded-{i}") for i in range(5)]
+
+    for agent in agents:
+        await check_rate_limit(agent, "general")
+
+    buckets = rate_limit_module._local_buckets
+    assert len(buckets) <= 3
+    assert rate_limit_module.bucket_key(agents[-1].id, "general") in buckets
+    assert rate_limit_module.bucket_key(agents[0].id, "general") not in buckets
@@ -13,6 +13,10 @@ from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.services import resolutions
+from server.services.resolutions import process_pending_resolutions
 
 
 def get_future_deadline(days: int = 1) -> str:
@@ -809,3 +813,103 @@ async def test_resolution_payout_summary(client: AsyncClient):
     assert data["payouts"]["total_payout"] >= 49.0  # Approximately 50 minus small fee
     assert data["payouts"]["total_payout"] <= 50.0
     assert "total_fees" in data["payouts"]  # Verify fees are tracked
+
+
+@pytest.mark.asyncio
+async def test_v1_resolution_is_queued_and_settled(client: AsyncClient, session: AsyncSession):
+    """Test that v1 resolution is queued, settled by the worker and idempotent."""
+    trader_response = await client.post("/agents", json={"name": "trader-queued"})
+    market_response = await client.post(
+        "/markets",
+        json={
+            "creator_id": trader_response.json()["id"],
+            "question": "Will this resolution be queued?",
+            "deadline": get_future_deadline(),
+        },
+    )
+    market_id = market_response.json()["id"]
+
+    register_response = await client.post(
+        "/api/v1/agents/register", json={"name": "moderator-queued", "role": "moderator"}
+    )
+    claim_token = register_response.json()["claim_url"].split("/")[-1]
+    await client.post("/api/v1/agents/verify", json={"claim_token": claim_token})
+    headers = {
+        "Authorization": f"Bearer {register_response.json()['api_key']}",
+        "Idempotency-Key": "resolve-once",
+    }
+
+    response = await client.post(
+        f"/api/v1/markets/{market_id}/resolve", json={"outcome": "YES"}, headers=headers
+    )
+    assert response.status_code == 202
+    assert response.json()["status"] == "pending"
+    resolution_id = response.json()["resolution_id"]
+
+    # A retry with the same key returns the queued resolution
+    retry = await client.post(
+        f"/api/v1/markets/{market_id}/resolve", json={"outcome": "YES"}, headers=headers
+    )
+    assert retry.status_code == 202
+    assert retry.json()["resolution_id"] == resolution_id
+
+    assert await process_pending_resolutions(session) == 1
+
+    resolution = await client.get(f"/api/v1/resolutions/{resolution_id}", headers=headers)
+    assert resolution.json()["status"] == "completed"
+    assert resolution.json()["result"]["outcome"] == "YES"
+
+    market = await client.get(f"/markets/{market_id}")
+    assert market.json()["status"] == "resolved"
+
+
+@pytest.mark.asyncio
+async def test_failed_resolution_does_not_block_queue(
+    client: AsyncClient, session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a resolution whose settlement raises is failed and later ones still settle."""
+    trader_response = await client.post("/agents", json={"name": "trader-blocked-queue"})
+    market_ids = []
+    for question in ("Will settlement crash?", "Will the next one settle?"):
+        market_response = await client.post(
+            "/markets",
+            json={
+                "creator_id": trader_response.json()["id"],
+                "question": question,
+                "deadline": get_future_deadline(),
+            },
+        )
+        market_ids.append(market_response.json()["id"])
+
+    register_response = await client.post(
+        "/api/v1/agents/register", json={"name": "moderator-blocked-queue", "role": "moderator"}
+    )
+    claim_token = register_response.json()["claim_url"].split("/")[-1]
+    await client.post("/api/v1/agents/verify", json={"claim_token": claim_token})
+    headers = {"Authorization": f"Bearer {register_response.json()['api_key']}"}
+
+    resolution_ids = []
+    for market_id in market_ids:
+        response = await client.post(
+            f"/api/v1/markets/{market_id}/resolve", json={"outcome": "YES"}, headers=headers
+        )
+        assert response.status_code == 202
+        resolution_ids.append(response.json()["resolution_id"])
+
+    settle = resolutions.resolve_market
+
+    async def crash_on_first_market(session, market_id, *args):
+        if str(market_id) == market_ids[0]:
+            raise RuntimeError("settlement bug")
+        return await settle(session, market_id, *args)
+
+    monkeypatch.setattr(resolutions, "resolve_market", crash_on_first_market)
+
+    assert await process_pending_resolutions(session) == 2
+
+    failed = await client.get(f"/api/v1/resolutions/{resolution_ids[0]}", headers=headers)
+    assert failed.json()["status"] == "failed"
+    assert "RuntimeError" in failed.json()["error"]
+
+    settled = await client.get(f"/api/v1/resolutions/{resolution_ids[1]}", headers=headers)
+    assert settled.json()["status"] == "completed"